@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 from contextlib import suppress
 import faulthandler
+from functools import partial
 import os
 import sys
 import threading
@@ -106,6 +107,30 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--compact-states",
+        action="store_true",
+        help="Store entity states in a compact columnar form to reduce memory usage",
+    )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Write a Chrome trace of the startup timeline to the config directory",
+    )
+    parser.add_argument(
+        "--zygote",
+        metavar="path_to_config_dir",
+        action="append",
+        default=None,
+        help="Preload once and fork an instance for each configuration directory",
+    )
+    parser.add_argument(
+        "--zygote-preload",
+        metavar="integrations",
+        type=lambda arg: arg.split(","),
+        default=[],
+        help="Integrations to import before forking the instances",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -167,22 +192,8 @@ def check_threads() -> None:
         sys.stderr.write("Failed to count non-daemonic threads.\n")
 
 
-def main() -> int:
-    """Start Home Assistant."""
-    validate_python()
-
-    args = get_arguments()
-
-    if not args.ignore_os_check:
-        validate_os()
-
-    if args.script is not None:
-        # pylint: disable-next=import-outside-toplevel
-        from . import scripts
-
-        return scripts.run(args.script)
-
-    config_dir = os.path.abspath(os.path.join(os.getcwd(), args.config))
+def run_instance(args: argparse.Namespace, config_dir: str) -> int:
+    """Run Home Assistant with a configuration directory."""
     if restore_backup(config_dir):
         return RESTART_EXIT_CODE
 
@@ -205,6 +216,8 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        compact_states=args.compact_states,
+        trace_startup=args.trace_startup,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -218,6 +231,38 @@ def main() -> int:
         if os.path.getsize(fault_file_name) == 0:
             os.remove(fault_file_name)
 
+    return exit_code
+
+
+def main() -> int:
+    """Start Home Assistant."""
+    validate_python()
+
+    args = get_arguments()
+
+    if not args.ignore_os_check:
+        validate_os()
+
+    if args.script is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from . import scripts
+
+        return scripts.run(args.script)
+
+    if args.zygote:
+        # pylint: disable-next=import-outside-toplevel
+        from . import runner
+
+        exit_code = runner.run_zygote(
+            [os.path.abspath(os.path.join(os.getcwd(), path)) for path in args.zygote],
+            args.zygote_preload,
+            partial(run_instance, args),
+        )
+    else:
+        exit_code = run_instance(
+            args, os.path.abspath(os.path.join(os.getcwd(), args.config))
+        )
+
     check_threads()
 
     return exit_code
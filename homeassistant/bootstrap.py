@@ -88,8 +88,19 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.integration_snapshot import (
+    DATA_INTEGRATION_SNAPSHOT_STORE,
+    IntegrationSnapshotStore,
+)
+from .helpers.json import json_bytes
+from .helpers.storage import STORAGE_DIR, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
+from .helpers.timeline import (
+    DATA_STARTUP_TIMELINE,
+    TRACK_BOOTSTRAP,
+    Timeline,
+    async_startup_timeline_span,
+)
 from .helpers.typing import ConfigType
 from .setup import (
     # _setup_started is marked as protected to make it clear
@@ -103,9 +114,11 @@ from .setup import (
     async_setup_component,
 )
 from .util.async_ import create_eager_task
+from .util.file import write_utf8_file
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
+from .util.yaml import YamlCache
 
 with contextlib.suppress(ImportError):
     # Ensure anyio backend is imported to avoid it being imported in the event loop
@@ -121,6 +134,7 @@ SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
 
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILE = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
@@ -263,7 +277,14 @@ async def async_setup_hass(
 
     async def create_hass() -> core.HomeAssistant:
         """Create the hass object and do basic setup."""
-        hass = core.HomeAssistant(runtime_config.config_dir)
+        hass = core.HomeAssistant(
+            runtime_config.config_dir, compact_states=runtime_config.compact_states
+        )
+        hass.data[DATA_STARTUP_TIMELINE] = Timeline()
+        hass.data[conf_util.DATA_YAML_CACHE] = YamlCache(
+            hass.config.path(STORAGE_DIR, conf_util.YAML_CACHE_FILE)
+        )
+        hass.data[DATA_INTEGRATION_SNAPSHOT_STORE] = IntegrationSnapshotStore(hass)
         loader.async_setup(hass)
 
         await async_enable_logging(
@@ -374,12 +395,25 @@ async def async_setup_hass(
     elif hass.config.safe_mode:
         _LOGGER.info("Starting in safe mode")
 
+    if runtime_config.trace_startup:
+        await async_write_startup_trace(hass)
+
     if runtime_config.open_ui:
         hass.add_job(open_hass_ui, hass)
 
     return hass
 
 
+async def async_write_startup_trace(hass: core.HomeAssistant) -> None:
+    """Write the startup timeline as a Chrome trace to the config directory."""
+    if (timeline := hass.data.get(DATA_STARTUP_TIMELINE)) is None:
+        return
+    path = hass.config.path(STARTUP_TRACE_FILE)
+    trace = json_bytes(timeline.as_chrome_trace())
+    await hass.async_add_executor_job(partial(write_utf8_file, path, trace, mode="wb"))
+    _LOGGER.info("Wrote startup trace to %s", path)
+
+
 def open_hass_ui(hass: core.HomeAssistant) -> None:
     """Open the UI."""
     import webbrowser  # pylint: disable=import-outside-toplevel
@@ -456,13 +490,19 @@ async def async_from_config_dict(
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
-    await async_load_base_functionality(hass)
+    if snapshot_store := hass.data.get(DATA_INTEGRATION_SNAPSHOT_STORE):
+        with async_startup_timeline_span(
+            hass, "restore integration snapshot", TRACK_BOOTSTRAP
+        ):
+            await snapshot_store.async_load()
+    with async_startup_timeline_span(hass, "load base functionality", TRACK_BOOTSTRAP):
+        await async_load_base_functionality(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with async_startup_timeline_span(hass, "core integrations", TRACK_BOOTSTRAP):
+        core_results = await asyncio.gather(
             *(
                 create_eager_task(
                     async_setup_component(hass, domain, config),
@@ -472,7 +512,7 @@ async def async_from_config_dict(
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -494,6 +534,11 @@ async def async_from_config_dict(
 
     await _async_set_up_integrations(hass, config)
 
+    if snapshot_store:
+        hass.async_create_background_task(
+            snapshot_store.async_save(), "save integration snapshot"
+        )
+
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
@@ -974,9 +1019,10 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
-    )
+    with async_startup_timeline_span(hass, "resolve domains", TRACK_BOOTSTRAP):
+        domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
+            hass, config
+        )
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -1022,7 +1068,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with async_startup_timeline_span(hass, f"stage 0: {name}", TRACK_BOOTSTRAP):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1034,7 +1081,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with async_startup_timeline_span(hass, "stage 1", TRACK_BOOTSTRAP):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1050,7 +1098,8 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with async_startup_timeline_span(hass, "stage 2", TRACK_BOOTSTRAP):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1061,7 +1110,8 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with async_startup_timeline_span(hass, "wrap up", TRACK_BOOTSTRAP):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -1069,6 +1119,8 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    if timeline := hass.data.get(DATA_STARTUP_TIMELINE):
+        timeline.finish()
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from contextlib import suppress
 from enum import StrEnum
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -25,6 +26,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
+from homeassistant.helpers.reload import async_get_config_item_cache
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.yaml.input import UndefinedSubstitution
@@ -342,20 +344,43 @@ async def async_validate_config_item(
     return await _async_validate_config_item(hass, config, True, False)
 
 
-async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
-    # No gather here since _try_async_validate_config_item is unlikely to suspend
-    # and the cost of creating many tasks is not worth the benefit.
-    automations = list(
-        filter(
-            lambda x: x is not None,
-            [
-                await _try_async_validate_config_item(hass, p_config)
-                for _, p_config in config_per_platform(config, DOMAIN)
-            ],
-        )
+def _is_cacheable(automation_config: AutomationConfig) -> bool:
+    """Return if a validated automation can be reused when its config is unchanged.
+
+    Blueprints can change without the automation config changing.
+    """
+    return (
+        automation_config.validation_status is ValidationStatus.OK
+        and automation_config.raw_blueprint_inputs is None
     )
 
+
+async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
+    """Validate config.
+
+    Automations with an id are only validated again when their config changed.
+    """
+    cache = async_get_config_item_cache(hass, DOMAIN)
+    automations: list[AutomationConfig] = []
+    try:
+        # No gather here since _try_async_validate_config_item is unlikely to
+        # suspend and the cost of creating many tasks is not worth the benefit.
+        for _, p_config in config_per_platform(config, DOMAIN):
+            automation_id = (
+                p_config.get(CONF_ID) if isinstance(p_config, dict) else None
+            )
+            if (
+                automation_config := await cache.async_validate(
+                    automation_id,
+                    p_config,
+                    partial(_try_async_validate_config_item, hass, p_config),
+                    _is_cacheable,
+                )
+            ) is not None:
+                automations.append(automation_config)
+    finally:
+        cache.async_finish()
+
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
     config = config_without_domain(config, DOMAIN)
@@ -82,7 +82,7 @@ from .const import (
     StreamType,
 )
 from .helper import get_camera_from_entity_id
-from .img_util import scale_jpeg_camera_image
+from .img_util import scale_jpeg_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 from .webrtc import (
     DATA_ICE_SERVERS,
@@ -206,7 +206,6 @@ async def _async_get_image(
             )
             if image_bytes:
                 content_type = camera.content_type
-                image = Image(content_type, image_bytes)
                 if (
                     width is not None
                     and height is not None
@@ -214,11 +213,11 @@ async def _async_get_image(
                 ):
                     assert width is not None
                     assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                    image_bytes = await camera.hass.async_add_process_job(
+                        scale_jpeg_image, image_bytes, width, height
                     )
 
-                return image
+                return Image(content_type, image_bytes)
 
     raise HomeAssistantError("Unable to get image")
 
@@ -50,27 +50,34 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
 
     Scale as close as possible to one of the supported scaling factors.
     """
+    return scale_jpeg_image(cam_image.content, width, height)
+
+
+def scale_jpeg_image(content: bytes, width: int, height: int) -> bytes:
+    """Scale a jpeg image.
+
+    Scale as close as possible to one of the supported scaling factors.
+    This only takes and returns bytes so it can be run as a process job.
+    """
     turbo_jpeg = TurboJPEGSingleton.instance()
     if not turbo_jpeg:
-        return cam_image.content
+        return content
 
     try:
-        (current_width, current_height, _, _) = turbo_jpeg.decode_header(
-            cam_image.content
-        )
+        (current_width, current_height, _, _) = turbo_jpeg.decode_header(content)
     except OSError:
-        return cam_image.content
+        return content
 
     scaling_factor = find_supported_scaling_factor(
         current_width, current_height, width, height
     )
     if scaling_factor is None:
-        return cam_image.content
+        return content
 
     return cast(
         bytes,
         turbo_jpeg.scale_with_quality(
-            cam_image.content,
+            content,
             scaling_factor=scaling_factor,
             quality=JPEG_QUALITY,
         ),
@@ -17,7 +17,7 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
@@ -25,6 +25,9 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import async_get_store_write_stats
+from homeassistant.util.executor import get_executor_stats
+from homeassistant.util.job_stats import JobStats, LoopLagMonitor
 
 from .const import DOMAIN
 
@@ -40,6 +43,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_JOB_STATS = "log_job_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,17 +67,24 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_JOB_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+DEFAULT_MAX_JOBS = 25
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_JOBS = "max_jobs"
+CONF_RESET = "reset"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+JOB_STATS = "job_stats"
+LOOP_LAG_MONITOR = "loop_lag_monitor"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -86,6 +97,11 @@ async def async_setup_entry(  # noqa: C901
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
 
+    job_stats = domain_data[JOB_STATS] = JobStats()
+    loop_lag_monitor = domain_data[LOOP_LAG_MONITOR] = LoopLagMonitor(hass.loop)
+    hass.async_set_job_stats(job_stats)
+    loop_lag_monitor.start()
+
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
             await _async_generate_profile(hass, call)
@@ -273,6 +289,23 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_log_job_stats(call: ServiceCall) -> None:
+        """Log the jobs that blocked the event loop the longest."""
+        for name, stat in job_stats.top(call.data[CONF_MAX_JOBS]):
+            _LOGGER.critical(
+                "Job %s: count=%d total=%.6fs max=%.6fs",
+                name,
+                stat.count,
+                stat.total,
+                stat.max,
+            )
+        _LOGGER.critical("Event loop lag: %s", loop_lag_monitor.as_dict())
+        _LOGGER.critical("Executors: %s", get_executor_stats())
+        _LOGGER.critical("Store writes: %s", async_get_store_write_stats(hass))
+        if call.data[CONF_RESET]:
+            job_stats.reset()
+            loop_lag_monitor.reset()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +415,23 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_JOB_STATS,
+        _async_log_job_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_JOBS, default=DEFAULT_MAX_JOBS): vol.Range(
+                    min=1, max=1024
+                ),
+                vol.Optional(CONF_RESET, default=False): cv.boolean,
+            }
+        ),
+    )
+
+    websocket_api.async_register_command(hass, websocket_job_stats)
+
     return True
 
 
@@ -391,10 +441,51 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.async_set_job_stats(None)
+    hass.data[DOMAIN][LOOP_LAG_MONITOR].stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_stats",
+        vol.Optional(CONF_MAX_JOBS, default=DEFAULT_MAX_JOBS): vol.Range(
+            min=1, max=1024
+        ),
+        vol.Optional(CONF_RESET, default=False): bool,
+    }
+)
+@callback
+def websocket_job_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the jobs that blocked the event loop the longest and the loop lag."""
+    if DOMAIN not in hass.data:
+        connection.send_error(msg["id"], "not_loaded", "Profiler is not loaded")
+        return
+    job_stats: JobStats = hass.data[DOMAIN][JOB_STATS]
+    loop_lag_monitor: LoopLagMonitor = hass.data[DOMAIN][LOOP_LAG_MONITOR]
+    connection.send_result(
+        msg["id"],
+        {
+            "jobs": [
+                {"name": name, **stat.as_dict()}
+                for name, stat in job_stats.top(msg[CONF_MAX_JOBS])
+            ],
+            "loop_lag": loop_lag_monitor.as_dict(),
+            "executors": get_executor_stats(),
+            "stores": async_get_store_write_stats(hass),
+        },
+    )
+    if msg[CONF_RESET]:
+        job_stats.reset()
+        loop_lag_monitor.reset()
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,185 @@
+"""Insert the rows of a commit interval with Core statements."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from typing import Any, cast
+
+from sqlalchemy import ColumnDefault, Table, bindparam, insert, inspect, update
+from sqlalchemy.orm.session import Session
+
+from .const import SupportedDialect
+from .db_schema import (
+    Base,
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+# Dialects where a round trip per row costs enough that the rows of a
+# commit interval are inserted in bulk instead of flushing the session
+BULK_INSERT_DIALECTS = {SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL}
+
+type _ColumnGetter = tuple[str, str, Callable[[Any], Any] | None]
+
+
+def _scalar_default(value: Any, _ctx: Any) -> Any:
+    """Return the scalar default of a column."""
+    return value
+
+
+def _column_getters(table: type[Base]) -> list[_ColumnGetter]:
+    """Return the non primary key columns of a table and their defaults.
+
+    The ORM only applies the default of a column when its attribute was
+    never set, so the same is done for the bulk insert.
+    """
+    getters: list[_ColumnGetter] = []
+    for prop in inspect(table).column_attrs:
+        column = prop.columns[0]
+        if column.primary_key:
+            continue
+        default = column.default
+        getter: Callable[[Any], Any] | None = None
+        if isinstance(default, ColumnDefault) and default.is_callable:
+            getter = default.arg
+        elif isinstance(default, ColumnDefault) and default.is_scalar:
+            getter = partial(_scalar_default, default.arg)
+        getters.append((prop.key, column.key, getter))
+    return getters
+
+
+def _rows(objs: list[Any], getters: list[_ColumnGetter]) -> list[dict[str, Any]]:
+    """Return the column values of the objects to insert."""
+    rows: list[dict[str, Any]] = []
+    for obj in objs:
+        values = obj.__dict__
+        rows.append(
+            {
+                column_key: values[attr_key]
+                if attr_key in values
+                else default(None)
+                if default is not None
+                else None
+                for attr_key, column_key, default in getters
+            }
+        )
+    return rows
+
+
+class PendingRows:
+    """Collect the rows of a commit interval and insert them in bulk.
+
+    The objects are the ones the table managers hand out, so the ids
+    they read after the commit are set on them once they are inserted.
+    Foreign keys to objects of the same commit interval are resolved
+    from the ids of the objects inserted before them. A state that
+    follows another state of the same commit interval can only be
+    linked to it once both are inserted, which is done with a single
+    update of all such states.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pending rows."""
+        self._event_types: list[EventTypes] = []
+        self._event_data: list[EventData] = []
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._states: list[States] = []
+        self._events: list[Events] = []
+        self._by_type: dict[type, list[Any]] = {
+            EventTypes: self._event_types,
+            EventData: self._event_data,
+            StatesMeta: self._states_meta,
+            StateAttributes: self._state_attributes,
+            States: self._states,
+            Events: self._events,
+        }
+        self._getters = {table: _column_getters(table) for table in self._by_type}
+
+    def __bool__(self) -> bool:
+        """Return if there are rows to insert."""
+        return any(self._by_type.values())
+
+    def add(self, obj: object) -> bool:
+        """Add an object to insert.
+
+        Returns False if the object is not of a table that is inserted
+        in bulk, in which case it has to be added to the session.
+        """
+        if (objs := self._by_type.get(type(obj))) is None:
+            return False
+        objs.append(obj)
+        return True
+
+    def clear(self) -> None:
+        """Drop the pending rows."""
+        for objs in self._by_type.values():
+            objs.clear()
+
+    def insert(self, session: Session) -> None:
+        """Insert the pending rows with one statement per table."""
+        self._insert_returning(
+            session, EventTypes, EventTypes.event_type_id, self._event_types
+        )
+        self._insert_returning(session, EventData, EventData.data_id, self._event_data)
+        self._insert_returning(
+            session, StatesMeta, StatesMeta.metadata_id, self._states_meta
+        )
+        self._insert_returning(
+            session,
+            StateAttributes,
+            StateAttributes.attributes_id,
+            self._state_attributes,
+        )
+        if states := self._states:
+            for dbstate in states:
+                if (states_meta := dbstate.states_meta_rel) is not None:
+                    dbstate.metadata_id = states_meta.metadata_id
+                if (state_attributes := dbstate.state_attributes) is not None:
+                    dbstate.attributes_id = state_attributes.attributes_id
+            self._insert_returning(session, States, States.state_id, states)
+            if old_state_ids := [
+                {"b_state_id": dbstate.state_id, "b_old_state_id": old_state.state_id}
+                for dbstate in states
+                if (old_state := dbstate.old_state) is not None
+            ]:
+                session.execute(
+                    update(cast(Table, States.__table__))
+                    .where(States.state_id == bindparam("b_state_id"))
+                    .values(old_state_id=bindparam("b_old_state_id")),
+                    old_state_ids,
+                )
+                for dbstate in states:
+                    if (old_state := dbstate.old_state) is not None:
+                        dbstate.old_state_id = old_state.state_id
+        if events := self._events:
+            for dbevent in events:
+                if (event_type := dbevent.event_type_rel) is not None:
+                    dbevent.event_type_id = event_type.event_type_id
+                if (event_data := dbevent.event_data_rel) is not None:
+                    dbevent.data_id = event_data.data_id
+            session.execute(
+                insert(cast(Table, Events.__table__)),
+                _rows(events, self._getters[Events]),
+            )
+
+    def _insert_returning(
+        self, session: Session, table: type[Base], id_column: Any, objs: list[Any]
+    ) -> None:
+        """Insert objects and set the ids the database generated on them."""
+        if not objs:
+            return
+        result = session.execute(
+            insert(cast(Table, table.__table__)).returning(
+                id_column, sort_by_parameter_order=True
+            ),
+            _rows(objs, self._getters[table]),
+        )
+        id_key = id_column.key
+        for obj, row_id in zip(objs, result.scalars(), strict=True):
+            setattr(obj, id_key, row_id)
@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import BULK_INSERT_DIALECTS, PendingRows
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -203,6 +204,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._pending_rows: PendingRows | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -688,7 +690,8 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._pending_rows is None or not self._pending_rows.add(obj):
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -1214,7 +1217,16 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self._pending_rows:
+            try:
+                with session.no_autoflush:
+                    self._pending_rows.insert(session)
+            except Exception:
+                session.rollback()
+                raise
         session.commit()
+        if self._pending_rows is not None:
+            self._pending_rows.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1254,6 +1266,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._pending_rows is not None:
+            self._pending_rows.clear()
 
         if not self.event_session:
             return
@@ -1273,6 +1287,17 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        # The rows of each commit interval are inserted with one statement
+        # per table instead of one per row when the database can return
+        # the generated ids of a multi row insert in order
+        assert self.engine is not None
+        if (
+            self.dialect_name in BULK_INSERT_DIALECTS
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            self._pending_rows = PendingRows()
+        else:
+            self._pending_rows = None
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
@@ -321,7 +321,7 @@ class Events(Base):
             time_fired=None,
             time_fired_ts=event.time_fired_timestamp,
             context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
+            context_id_bin=context.id_bin,
             context_user_id=None,
             context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
             context_parent_id=None,
@@ -535,7 +535,7 @@ class States(Base):
             entity_id=event.data["entity_id"],
             attributes=None,
             context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
+            context_id_bin=context.id_bin,
             context_user_id=None,
             context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
             context_parent_id=None,
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,12 +40,51 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # entity_id -> (attributes, state_info, shared_attrs_bytes)
+        #
+        # Attributes are immutable, so the last serialized result of an
+        # entity can be reused as long as its new state has the very same
+        # attributes object and state info. Only identity is checked, since
+        # equal attributes do not always serialize identically, e.g. 0.0
+        # and -0.0 compare equal.
+        self._serialized: LRU[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes | None]
+        ] = LRU(CACHE_SIZE)
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        serialized = self._serialized
+        if new_size > serialized.get_size():
+            serialized.set_size(new_size)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            self._serialized.pop(entity_id, None)
+        else:
+            attributes = new_state.attributes
+            state_info = new_state.state_info
+            if (
+                (cached := self._serialized.get(entity_id)) is not None
+                and cached[0] is attributes
+                and cached[1] is state_info
+            ):
+                return cached[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
-                event, self.recorder.dialect_name
+            shared_attrs_bytes: bytes | None = (
+                StateAttributes.shared_attrs_bytes_from_event(
+                    event, self.recorder.dialect_name
+                )
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
             _LOGGER.warning(
@@ -50,7 +92,10 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 event.data["new_state"],
                 ex,
             )
-            return None
+            shared_attrs_bytes = None
+        if new_state is not None:
+            self._serialized[entity_id] = (attributes, state_info, shared_attrs_bytes)
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -136,12 +181,23 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        # Entities that are gone only leave their last state here
+        self._serialized.clear()
         id_map = self._id_map
         state_attributes_ids_reversed = {
             attributes_id: shared_attrs
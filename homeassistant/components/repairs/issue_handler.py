@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.integration_platform import (
+    async_load_integration_platforms,
     async_process_integration_platforms,
 )
 
@@ -67,6 +68,8 @@ class RepairsFlowManager(data_entry_flow.FlowManager):
 
         if "platforms" not in self.hass.data[DOMAIN]:
             await async_process_repairs_platforms(self.hass)
+        else:
+            await async_load_integration_platforms(self.hass, DOMAIN)
 
         platforms: dict[str, RepairsProtocol] = self.hass.data[DOMAIN]["platforms"]
         if handler_key not in platforms:
@@ -105,8 +108,9 @@ async def async_process_repairs_platforms(hass: HomeAssistant) -> None:
     hass.data[DOMAIN]["platforms"] = {}
 
     await async_process_integration_platforms(
-        hass, DOMAIN, _register_repairs_platform, wait_for_platforms=True
+        hass, DOMAIN, _register_repairs_platform, lazy=True
     )
+    await async_load_integration_platforms(hass, DOMAIN)
 
 
 @callback
@@ -382,9 +382,17 @@ async def _async_process_config(
         """
         script_matches: set[int] = set()
         config_matches: set[int] = set()
+        script_configs_by_key: dict[str, list[tuple[int, ScriptEntityConfig]]] = {}
+
+        for config_idx, script_config in enumerate(script_configs):
+            script_configs_by_key.setdefault(script_config.key, []).append(
+                (config_idx, script_config)
+            )
 
         for script_idx, script in enumerate(scripts):
-            for config_idx, script_config in enumerate(script_configs):
+            for config_idx, script_config in script_configs_by_key.get(
+                script.unique_id or "", ()
+            ):
                 if config_idx in config_matches:
                     # Only allow a script config to match at most once
                     continue
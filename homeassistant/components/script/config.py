@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from contextlib import suppress
 from enum import StrEnum
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -33,6 +34,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.reload import async_get_config_item_cache
 from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     async_validate_actions_config,
@@ -293,17 +295,42 @@ async def async_validate_config_item(
     return await _async_validate_config_item(hass, object_id, config, True, False)
 
 
+def _is_cacheable(script_config: ScriptConfig) -> bool:
+    """Return if a validated script can be reused when its config is unchanged.
+
+    Blueprints can change without the script config changing.
+    """
+    return (
+        script_config.validation_status is ValidationStatus.OK
+        and script_config.raw_blueprint_inputs is None
+    )
+
+
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
-    """Validate config."""
+    """Validate config.
+
+    Scripts are only validated again when their config changed.
+    """
+    cache = async_get_config_item_cache(hass, DOMAIN)
     scripts = {}
-    for _, p_config in config_per_platform(config, DOMAIN):
-        for object_id, cfg in p_config.items():
-            if object_id in scripts:
-                LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
-                continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
-            if cfg is not None:
-                scripts[object_id] = cfg
+    try:
+        for _, p_config in config_per_platform(config, DOMAIN):
+            for object_id, cfg in p_config.items():
+                if object_id in scripts:
+                    LOGGER.warning(
+                        "Duplicate script detected with name: '%s'", object_id
+                    )
+                    continue
+                cfg = await cache.async_validate(
+                    object_id,
+                    cfg,
+                    partial(_try_async_validate_config_item, hass, object_id, cfg),
+                    _is_cacheable,
+                )
+                if cfg is not None:
+                    scripts[object_id] = cfg
+    finally:
+        cache.async_finish()
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
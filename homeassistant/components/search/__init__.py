@@ -157,14 +157,10 @@ class Searcher:
             # Scripts referencing this device
             self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
 
-            # Entities of this device
-            for entity_entry in er.async_entries_for_device(
-                self._entity_registry, device.id
-            ):
-                # Skip the entity if it's in a different area
-                if entity_entry.area_id is not None:
-                    continue
-                entity_entries.append(entity_entry)
+            # Entities of this device, skipping those in a different area
+            entity_entries.extend(
+                self._entity_registry.entities.get_entries_for_device_area(device.id)
+            )
 
         # Process entities in this area
         for entity_entry in entity_entries:
@@ -6,6 +6,7 @@ of entities and react to changes.
 
 from __future__ import annotations
 
+from array import array
 import asyncio
 from collections import UserDict, defaultdict
 from collections.abc import (
@@ -13,21 +14,26 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
+    MutableMapping,
     ValuesView,
 )
 import concurrent.futures
+from copy import copy
 from dataclasses import dataclass
 import datetime
 import enum
 import functools
 import inspect
 import logging
+import math
 import re
 import threading
 import time
 from time import monotonic
+from types import NoneType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -39,6 +45,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -100,12 +107,23 @@ from .util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 from .util.event_type import EventType
-from .util.executor import InterruptibleThreadPoolExecutor
+from .util.executor import (
+    EXECUTOR_POOL_IMPORT,
+    ExecutorPools,
+    JobPriority,
+    executor_job_priority,
+)
 from .util.hass_dict import HassDict
+from .util.job_stats import JobStats
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
-from .util.ulid import ulid_at_time, ulid_now
+from .util.ulid import (
+    bytes_to_ulid,
+    ulid_at_time_bytes,
+    ulid_now_bytes,
+    ulid_to_bytes_or_none,
+)
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -332,7 +350,7 @@ class HassJob[**_P, _R_co]:
     we run the job.
     """
 
-    __slots__ = ("target", "name", "_cancel_on_shutdown", "_cache")
+    __slots__ = ("target", "name", "priority", "_cancel_on_shutdown", "_cache")
 
     def __init__(
         self,
@@ -341,10 +359,15 @@ class HassJob[**_P, _R_co]:
         *,
         cancel_on_shutdown: bool | None = None,
         job_type: HassJobType | None = None,
+        priority: JobPriority | None = None,
     ) -> None:
-        """Create a job object."""
+        """Create a job object.
+
+        The priority is used when the job is run in the executor.
+        """
         self.target: Final = target
         self.name = name
+        self.priority = priority
         self._cancel_on_shutdown = cancel_on_shutdown
         self._cache: dict[str, Any] = {}
         if job_type:
@@ -362,6 +385,16 @@ class HassJob[**_P, _R_co]:
         """Return if the job should be cancelled on shutdown."""
         return self._cancel_on_shutdown
 
+    @under_cached_property
+    def target_name(self) -> str:
+        """Return the qualified name of the target."""
+        target = self.target
+        while isinstance(target, functools.partial):
+            target = target.func
+        if (qualname := getattr(target, "__qualname__", None)) is None:
+            return repr(target)
+        return f"{getattr(target, '__module__', None)}.{qualname}"
+
     def __repr__(self) -> str:
         """Return the job."""
         return f"<Job {self.name} {self.job_type} {self.target}>"
@@ -413,7 +446,7 @@ class HomeAssistant:
     http: HomeAssistantHTTP = None  # type: ignore[assignment]
     config_entries: ConfigEntries = None  # type: ignore[assignment]
 
-    def __new__(cls, config_dir: str) -> Self:
+    def __new__(cls, config_dir: str, *, compact_states: bool = False) -> Self:
         """Set the _hass thread local data."""
         hass = super().__new__(cls)
         _hass.hass = hass
@@ -423,7 +456,7 @@ class HomeAssistant:
         """Return the representation."""
         return f"<HomeAssistant {self.state}>"
 
-    def __init__(self, config_dir: str) -> None:
+    def __init__(self, config_dir: str, *, compact_states: bool = False) -> None:
         """Initialize new Home Assistant object."""
         # pylint: disable-next=import-outside-toplevel
         from . import loader
@@ -438,7 +471,7 @@ class HomeAssistant:
         self._background_tasks: set[asyncio.Future[Any]] = set()
         self.bus = EventBus(self)
         self.services = ServiceRegistry(self)
-        self.states = StateMachine(self.bus, self.loop)
+        self.states = StateMachine(self.bus, self.loop, compact_states)
         self.config = Config(self, config_dir)
         self.config.async_initialize()
         self.components = loader.Components(self)
@@ -451,10 +484,10 @@ class HomeAssistant:
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
-        self.import_executor = InterruptibleThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="ImportExecutor"
-        )
+        self.executor_pools = ExecutorPools()
+        self.import_executor = self.executor_pools.get(EXECUTOR_POOL_IMPORT)
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        self._job_stats: JobStats | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -768,7 +801,11 @@ class HomeAssistant:
         else:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            task = self.loop.run_in_executor(None, hassjob.target, *args)
+            if (priority := hassjob.priority) is None:
+                task = self.loop.run_in_executor(None, hassjob.target, *args)
+            else:
+                with executor_job_priority(priority):
+                    task = self.loop.run_in_executor(None, hassjob.target, *args)
 
         task_bucket = self._background_tasks if background else self._tasks
         task_bucket.add(task)
@@ -874,10 +911,45 @@ class HomeAssistant:
 
     @callback
     def async_add_executor_job[*_Ts, _T](
+        self,
+        target: Callable[[*_Ts], _T],
+        *args: *_Ts,
+        priority: JobPriority | None = None,
+        pool: str | None = None,
+    ) -> asyncio.Future[_T]:
+        """Add an executor job from within the event loop.
+
+        When all executor workers are busy, queued jobs with a higher
+        priority are started first. If a pool is passed, the job runs in
+        that pool from executor_pools instead of the default executor.
+        """
+        executor = None if pool is None else self.executor_pools.get(pool)
+        if priority is None:
+            task = self.loop.run_in_executor(executor, target, *args)
+        else:
+            with executor_job_priority(priority):
+                task = self.loop.run_in_executor(executor, target, *args)
+
+        tracked = asyncio.current_task() in self._tasks
+        task_bucket = self._tasks if tracked else self._background_tasks
+        task_bucket.add(task)
+        task.add_done_callback(task_bucket.remove)
+
+        return task
+
+    @callback
+    def async_add_process_job[*_Ts, _T](
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add a job to be run in a worker process from within the event loop.
+
+        Use this for CPU bound work that would otherwise hold the GIL.
+        The target must be a module level function and the arguments
+        and the result must be picklable.
+        """
+        task = self.loop.run_in_executor(
+            self.executor_pools.get_process_pool(), target, *args
+        )
 
         tracked = asyncio.current_task() in self._tasks
         task_bucket = self._tasks if tracked else self._background_tasks
@@ -886,6 +958,28 @@ class HomeAssistant:
 
         return task
 
+    async def async_run_integration_executor_job[*_Ts, _T](
+        self,
+        domain: str,
+        target: Callable[[*_Ts], _T],
+        *args: *_Ts,
+        priority: JobPriority | None = None,
+        pool: str | None = None,
+    ) -> _T:
+        """Run an executor job within the executor quota of an integration.
+
+        If the integration already has as many jobs queued or running as
+        its quota allows, this waits for one of them to finish first.
+        """
+        if (quota := self.executor_pools.async_get_quota(domain)) is None:
+            return await self.async_add_executor_job(
+                target, *args, priority=priority, pool=pool
+            )
+        async with quota:
+            return await self.async_add_executor_job(
+                target, *args, priority=priority, pool=pool
+            )
+
     @callback
     def async_add_import_executor_job[*_Ts, _T](
         self, target: Callable[[*_Ts], _T], *args: *_Ts
@@ -930,6 +1024,10 @@ class HomeAssistant:
         hassjob: HassJob
         args: parameters for method to call.
         """
+        if self._job_stats is not None:
+            return self._async_run_hass_job_with_stats(
+                self._job_stats, hassjob, args, background
+            )
         # This code path is performance sensitive and uses
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
@@ -942,6 +1040,35 @@ class HomeAssistant:
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def _async_run_hass_job_with_stats[_R](
+        self,
+        job_stats: JobStats,
+        hassjob: HassJob[..., Coroutine[Any, Any, _R] | _R],
+        args: tuple[Any, ...],
+        background: bool,
+    ) -> asyncio.Future[_R] | None:
+        """Run a HassJob and record how long it blocked the event loop."""
+        start = time.perf_counter()
+        try:
+            if hassjob.job_type is HassJobType.Callback:
+                hassjob.target(*args)
+                return None
+            return self._async_add_hass_job(hassjob, *args, background=background)
+        finally:
+            job_stats.record(hassjob.target_name, time.perf_counter() - start)
+
+    @callback
+    def async_set_job_stats(self, job_stats: JobStats | None) -> None:
+        """Set the collector for the run time of jobs.
+
+        When set, the time each job run with async_run_hass_job blocks the
+        event loop is recorded. Pass None to stop recording.
+
+        This method must be run in the event loop.
+        """
+        self._job_stats = job_stats
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1222,7 +1349,7 @@ class HomeAssistant:
             self._async_log_running_tasks("close")
 
         self.set_state(CoreState.stopped)
-        self.import_executor.shutdown()
+        self.executor_pools.shutdown()
 
         if self._stopped is not None:
             self._stopped.set()
@@ -1247,32 +1374,61 @@ class HomeAssistant:
 class Context:
     """The context that triggered something."""
 
-    __slots__ = ("id", "user_id", "parent_id", "origin_event", "_cache")
+    __slots__ = ("_id", "_id_bin", "user_id", "parent_id", "origin_event", "_cache")
 
     def __init__(
         self,
         user_id: str | None = None,
         parent_id: str | None = None,
         id: str | None = None,  # pylint: disable=redefined-builtin
+        id_bin: bytes | None = None,
     ) -> None:
-        """Init the context."""
-        self.id = id or ulid_now()
+        """Init the context.
+
+        A new context only generates the raw 16 byte ULID, the string
+        representation of the id is created the first time it is accessed.
+        """
+        if id:
+            self._id: str | None = id
+            self._id_bin = id_bin
+        else:
+            self._id = None
+            self._id_bin = id_bin or ulid_now_bytes()
         self.user_id = user_id
         self.parent_id = parent_id
         self.origin_event: Event[Any] | None = None
         self._cache: dict[str, Any] = {}
 
+    @property
+    def id(self) -> str:
+        """Return the id of the context."""
+        if (id_ := self._id) is None:
+            # _id_bin is always set when _id is not
+            id_ = self._id = bytes_to_ulid(self._id_bin)  # type: ignore[arg-type]
+        return id_
+
+    @property
+    def id_bin(self) -> bytes | None:
+        """Return the id as raw 16 bytes or None if the id is not a ULID."""
+        if (id_bin := self._id_bin) is None:
+            id_bin = self._id_bin = ulid_to_bytes_or_none(self._id)
+        return id_bin
+
     def __eq__(self, other: object) -> bool:
         """Compare contexts."""
-        return isinstance(other, Context) and self.id == other.id
+        if not isinstance(other, Context):
+            return False
+        if self._id is None and other._id is None:
+            return self._id_bin == other._id_bin
+        return self.id == other.id
 
     def __copy__(self) -> Context:
         """Create a shallow copy of this context."""
-        return Context(user_id=self.user_id, parent_id=self.parent_id, id=self.id)
+        return Context(self.user_id, self.parent_id, self._id, self._id_bin)
 
     def __deepcopy__(self, memo: dict[int, Any]) -> Context:
         """Create a deep copy of this context."""
-        return Context(user_id=self.user_id, parent_id=self.parent_id, id=self.id)
+        return Context(self.user_id, self.parent_id, self._id, self._id_bin)
 
     @under_cached_property
     def _as_dict(self) -> dict[str, str | None]:
@@ -1344,7 +1500,7 @@ class Event(Generic[_DataT]):
         self.origin = origin
         self.time_fired_timestamp = time_fired_timestamp or time.time()
         if not context:
-            context = Context(id=ulid_at_time(self.time_fired_timestamp))
+            context = Context(id_bin=ulid_at_time_bytes(self.time_fired_timestamp))
         self.context = context
         if not context.origin_event:
             context.origin_event = self
@@ -1460,13 +1616,24 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_listeners",
+        "_keyed_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # event_type -> data key -> data value -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1484,7 +1651,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, keyed_listeners in self._keyed_listeners.items():
+            jobs = {
+                id(filterable_job)
+                for jobs_by_value in keyed_listeners.values()
+                for jobs in jobs_by_value.values()
+                for filterable_job in jobs
+            }
+            listeners[key] = listeners.get(key, 0) + len(jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1550,6 +1726,18 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if (
+            event_data is not None
+            and (keyed_listeners := self._keyed_listeners.get(event_type)) is not None
+        ):
+            for data_key, jobs_by_value in keyed_listeners.items():
+                try:
+                    keyed_jobs = jobs_by_value.get(event_data.get(data_key))
+                except TypeError:
+                    # Unhashable values never match a key
+                    continue
+                if keyed_jobs is not None:
+                    listeners = listeners + keyed_jobs
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1642,6 +1830,44 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        data_values: Iterable[Any],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with specific event data.
+
+        The listener only runs for events where the value of data_key in
+        the event data is one of data_values, e.g. an entity_id, domain or
+        device_id. Unlike an event_filter, the matching listeners are found
+        with a dict lookup so the cost of firing an event does not grow with
+        the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require a specific event type")
+        values = frozenset(data_values)
+        filterable_job: _FilterableJobType[Any] = (
+            HassJob(listener, f"listen {event_type} {data_key}"),
+            None,
+        )
+        jobs_by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        for data_value in values:
+            jobs_by_value.setdefault(data_value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            data_key,
+            values,
+            filterable_job,
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1742,6 +1968,40 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        data_values: frozenset[Any],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            jobs_by_value = keyed_listeners[data_key]
+            for data_value in data_values:
+                jobs = jobs_by_value[data_value]
+                jobs.remove(filterable_job)
+                if not jobs:
+                    del jobs_by_value[data_value]
+        except (KeyError, ValueError):
+            # KeyError is key event_type, data_key or data_value did not exist
+            # ValueError if listener did not exist within data_value
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+
+        # delete the indexes if they are empty
+        if not jobs_by_value:
+            del keyed_listeners[data_key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1780,6 +2040,7 @@ class State:
         "object_id",
         "last_updated_timestamp",
         "_cache",
+        "__weakref__",
     )
 
     def __init__(
@@ -2064,17 +2325,255 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Attribute values of these types serialize identically when they compare
+# equal and have the same type, so attribute dicts made only of them can be
+# shared. The only exception is -0.0, which compares equal to 0.0.
+_INTERNABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, NoneType})
+
+type _AttributesInternKey = tuple[tuple[tuple[str, Any], ...], tuple[type, ...]]
+
+
+def _attributes_intern_key(
+    attributes: Mapping[str, Any],
+) -> _AttributesInternKey | None:
+    """Return a hashable key for the attributes or None if they can't be shared.
+
+    The value types are part of the key since 1, 1.0 and True compare equal.
+    """
+    value_types = tuple(map(type, attributes.values()))
+    if not _INTERNABLE_ATTRIBUTE_TYPES.issuperset(value_types):
+        return None
+    if float in value_types and any(
+        value == 0.0 and math.copysign(1.0, value) < 0
+        for value in attributes.values()
+        if type(value) is float
+    ):
+        return None
+    return tuple(attributes.items()), value_types
+
+
+class CompactStates(MutableMapping[str, State]):
+    """Columnar container for states, maps entity_id -> State.
+
+    Instead of keeping a State object alive for every entity, the data of
+    each state is stored in a row of parallel columns:
+    - timestamps are stored as floats in arrays
+    - context ids are stored as raw 16 byte ULIDs in a bytearray
+    - attribute dicts are stored as is, the state machine already shares
+      identical ones between states
+
+    State objects are materialized on access and kept in a weak cache so
+    the same object is returned as long as something holds a reference
+    to it, e.g. an event that is still being processed.
+
+    Maintains an additional index:
+    - domain -> dict[str, int]
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._domain_index: defaultdict[str, dict[str, int]] = defaultdict(dict)
+        self._entity_ids: list[str | None] = []
+        self._states: list[str] = []
+        self._attributes: list[ReadOnlyDict[str, Any]] = []
+        self._state_infos: list[StateInfo | None] = []
+        self._last_changed = array("d")
+        self._last_updated = array("d")
+        self._last_reported = array("d")
+        self._context_ids = bytearray()
+        # Contexts that can not be stored as a plain ULID in _context_ids
+        self._contexts: dict[int, Context] = {}
+        self._materialized: weakref.WeakValueDictionary[str, State] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity_ids."""
+        return iter(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a state exists for an entity_id."""
+        return key in self._rows
+
+    def __getitem__(self, key: str) -> State:
+        """Return the state for an entity_id."""
+        if (state := self._materialized.get(key)) is not None:
+            return state
+        return self._materialize(key, self._rows[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the state for an entity_id or default."""
+        if (state := self._materialized.get(key)) is not None:
+            return state
+        if (row := self._rows.get(key)) is None:
+            return default
+        return self._materialize(key, row)
+
+    def values(self) -> list[State]:  # type: ignore[override]
+        """Return all states."""
+        return [self[entity_id] for entity_id in self._rows]
+
+    def __setitem__(self, key: str, entry: State) -> None:
+        """Add an item."""
+        if (row := self._rows.get(key)) is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = self._append_row()
+            self._rows[key] = row
+            self._domain_index[entry.domain][key] = row
+        self._entity_ids[row] = key
+        self._states[row] = entry.state
+        self._attributes[row] = entry.attributes
+        self._state_infos[row] = entry.state_info
+        self._last_changed[row] = entry.last_changed_timestamp
+        self._last_updated[row] = entry.last_updated_timestamp
+        self._last_reported[row] = entry.last_reported_timestamp
+        self._set_context(row, entry.context)
+        self._materialized[key] = entry
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        row = self._rows.pop(key)
+        del self._domain_index[split_entity_id(key)[0]][key]
+        self._materialized.pop(key, None)
+        self._contexts.pop(row, None)
+        self._entity_ids[row] = None
+        self._states[row] = ""
+        self._attributes[row] = ReadOnlyDict()
+        self._state_infos[row] = None
+        self._free_rows.append(row)
+
+    @callback
+    def async_set_last_reported(self, key: str, timestamp: float) -> None:
+        """Update the last reported timestamp of an existing state."""
+        self._last_reported[self._rows[key]] = timestamp
+
+    def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
+        """Get all entity_ids for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return self._domain_index[key].keys()
+
+    def domain_states(self, key: str) -> list[State] | tuple[()]:
+        """Get all states for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return [self[entity_id] for entity_id in self._domain_index[key]]
+
+    def _append_row(self) -> int:
+        """Grow all columns by one row and return the new row."""
+        row = len(self._entity_ids)
+        self._entity_ids.append(None)
+        self._states.append("")
+        self._attributes.append(ReadOnlyDict())
+        self._state_infos.append(None)
+        self._last_changed.append(0.0)
+        self._last_updated.append(0.0)
+        self._last_reported.append(0.0)
+        self._context_ids.extend(bytes(16))
+        return row
+
+    def _set_context(self, row: int, context: Context) -> None:
+        """Store the context of a row."""
+        if (
+            context.user_id is None
+            and context.parent_id is None
+            and (context_id_bin := context.id_bin) is not None
+            # Ids that were not generated from the raw bytes must
+            # round trip to be rebuilt from them
+            and (
+                (context_id := context._id) is None  # noqa: SLF001
+                or bytes_to_ulid(context_id_bin) == context_id
+            )
+        ):
+            self._context_ids[row * 16 : row * 16 + 16] = context_id_bin
+            self._contexts.pop(row, None)
+            return
+        # Only keep the ids to avoid holding a reference to the
+        # origin event of the context.
+        self._contexts[row] = copy(context)
+
+    def _get_context(self, row: int) -> Context:
+        """Build the context of a row."""
+        if (context := self._contexts.get(row)) is not None:
+            return copy(context)
+        return Context(id_bin=bytes(self._context_ids[row * 16 : row * 16 + 16]))
+
+    def _materialize(self, key: str, row: int) -> State:
+        """Build the State object for a row."""
+        utc_from_timestamp = dt_util.utc_from_timestamp
+        last_updated_timestamp = self._last_updated[row]
+        last_updated = utc_from_timestamp(last_updated_timestamp)
+        last_changed_timestamp = self._last_changed[row]
+        last_reported_timestamp = self._last_reported[row]
+        state = State(
+            key,
+            self._states[row],
+            self._attributes[row],
+            last_updated
+            if last_changed_timestamp == last_updated_timestamp
+            else utc_from_timestamp(last_changed_timestamp),
+            last_updated
+            if last_reported_timestamp == last_updated_timestamp
+            else utc_from_timestamp(last_reported_timestamp),
+            last_updated,
+            self._get_context(row),
+            False,
+            self._state_infos[row],
+            last_updated_timestamp,
+        )
+        self._materialized[key] = state
+        return state
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_compact",
+        "_shared_attributes",
+        "_reservations",
+        "_bus",
+        "_loop",
+    )
 
-    def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
-        """Initialize state machine."""
-        self._states = States()
+    def __init__(
+        self,
+        bus: EventBus,
+        loop: asyncio.events.AbstractEventLoop,
+        compact: bool = False,
+    ) -> None:
+        """Initialize state machine.
+
+        If compact is set, states are stored in a CompactStates container
+        which trades some read speed for a much smaller memory footprint.
+        """
+        self._compact = compact
+        # Identical attribute dicts are shared between states so they
+        # use less memory and consumers can compare them by identity.
+        self._shared_attributes: weakref.WeakValueDictionary[
+            _AttributesInternKey, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+        self._states: States | CompactStates
         # _states_data is used to access the States backing dict directly to speed
         # up read operations
-        self._states_data = self._states.data
+        self._states_data: Mapping[str, State]
+        if compact:
+            self._states = self._states_data = CompactStates()
+        else:
+            self._states = States()
+            self._states_data = self._states.data
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -2283,6 +2782,110 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states are validated before any of them is stored so an invalid
+        state will leave the state machine untouched. All states are stored
+        before the state_changed events are fired so listeners will see the
+        result of the whole batch. The updates share a single timestamp and,
+        if none is passed, a single context.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        self.async_set_many_internal(
+            [
+                (
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+                for entity_id, new_state, attributes in states
+            ]
+        )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Collection[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+                float,
+            ]
+        ],
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is a collection of tuples with the arguments of
+        async_set_internal.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        if not states:
+            return
+        states_data = self._states_data
+        for entity_id, new_state, *_ in states:
+            validate_state(new_state)
+            if entity_id not in states_data and not valid_entity_id(entity_id):
+                raise InvalidEntityFormatError(
+                    f"Invalid entity id encountered: {entity_id}. "
+                    "Format should be <domain>.<object_id>"
+                )
+
+        shared_context: Context | None = None
+        events: list[tuple[EventType[Any], Mapping[str, Any], Context, float]] = []
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+        ) in states:
+            if context is None:
+                if shared_context is None:
+                    shared_context = Context(id_bin=ulid_at_time_bytes(timestamp))
+                context = shared_context
+            event_type, event_data = self._async_store_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+            )
+            events.append((event_type, event_data, context, timestamp))
+
+        fire = self._bus.async_fire_internal
+        for event_type, event_data, context, timestamp in events:
+            fire(event_type, event_data, context=context, time_fired=timestamp)
+
     @callback
     def async_set_internal(
         self,
@@ -2303,6 +2906,51 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        if context is None:
+            context = Context(id_bin=ulid_at_time_bytes(timestamp))
+        event_type, event_data = self._async_store_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+        )
+        self._bus.async_fire_internal(
+            event_type, event_data, context=context, time_fired=timestamp
+        )
+
+    @callback
+    def _async_share_attributes(
+        self, attributes: Mapping[str, Any] | None
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared instance of identical attributes if there is one."""
+        # State only creates and expects a ReadOnlyDict so
+        # there is no need to check for subclassing with
+        # isinstance here so we can use the faster type check.
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes or {})
+        if (key := _attributes_intern_key(attributes)) is None:
+            return attributes
+        return self._shared_attributes.setdefault(key, attributes)
+
+    @callback
+    def _async_store_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+    ) -> tuple[EventType[Any], Mapping[str, Any]]:
+        """Store the state of an entity and return the event to fire.
+
+        Returns a state_reported event if only last_reported changed,
+        otherwise a state_changed event.
+        """
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2333,31 +2981,26 @@ class StateMachine:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
         now = dt_util.utc_from_timestamp(timestamp)
 
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            if self._compact:
+                self._states.async_set_last_reported(entity_id, timestamp)  # type: ignore[union-attr]
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
-                EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
-                context=context,
-                time_fired=timestamp,
-            )
-            return
+            return EVENT_STATE_REPORTED, {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._async_share_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2381,12 +3024,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return EVENT_STATE_CHANGED, state_changed_data
 
 
 class SupportsResponse(enum.StrEnum):
@@ -2842,7 +3480,13 @@ class ServiceRegistry:
             return target(service_call)
         if TYPE_CHECKING:
             target = cast(Callable[..., ServiceResponse], target)
-        return await self._hass.async_add_executor_job(target, service_call)
+        return await self._hass.async_add_executor_job(
+            target,
+            service_call,
+            priority=JobPriority.INTERACTIVE
+            if service_call.context.user_id
+            else JobPriority.AUTOMATION,
+        )
 
 
 # These can be removed if no deprecated constant are in this module anymore
@@ -64,6 +64,7 @@ from .helpers.frame import ReportBehavior, report_usage
 from .helpers.storage import Store
 from .helpers.typing import UNDEFINED, UndefinedType
 from .util import dt as dt_util, location
+from .util.executor import EXECUTOR_POOL_CPU, EXECUTOR_POOL_IO
 from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.unit_system import (
@@ -84,6 +85,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_CUSTOMIZE: HassKey[EntityValues] = HassKey("hass_customize")
 
 CONF_CREDENTIAL: Final = "credential"
+CONF_EXECUTOR_POOLS: Final = "executor_pools"
+CONF_EXECUTOR_QUOTAS: Final = "executor_quotas"
 CONF_ICE_SERVERS: Final = "ice_servers"
 CONF_WEBRTC: Final = "webrtc"
 
@@ -324,6 +327,14 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_EXECUTOR_POOLS): {
+                # Importing is not thread safe, the import pool keeps one worker
+                vol.Optional(pool): vol.All(vol.Coerce(int), vol.Range(min=1))
+                for pool in (EXECUTOR_POOL_CPU, EXECUTOR_POOL_IO)
+            },
+            vol.Optional(CONF_EXECUTOR_QUOTAS): cv.schema_with_slug_keys(
+                vol.All(vol.Coerce(int), vol.Range(min=1))
+            ),
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -416,6 +427,12 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
     if config.get(CONF_DEBUG):
         hac.debug = True
 
+    executor_pools = hass.executor_pools
+    for name, max_workers in config.get(CONF_EXECUTOR_POOLS, {}).items():
+        executor_pools.set_size(name, max_workers)
+    for domain, limit in config.get(CONF_EXECUTOR_QUOTAS, {}).items():
+        executor_pools.async_set_quota(domain, limit)
+
     if CONF_WEBRTC in config:
         hac.webrtc.ice_servers = [
             RTCIceServer(
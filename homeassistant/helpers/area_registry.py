@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -231,6 +231,16 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
             return area
         return self.async_create(name)
 
+    @callback
+    def async_bulk_get_or_create(self, names: Iterable[str]) -> list[AreaEntry]:
+        """Get or create many areas, saving once.
+
+        The create events are fired once all areas are processed.
+        """
+        self.hass.verify_event_loop_thread("area_registry.async_bulk_get_or_create")
+        with self._async_batch():
+            return [self.async_get_or_create(name) for name in names]
+
     def _generate_id(self, name: str) -> str:
         """Generate area ID."""
         return self.areas.generate_id_from_name(name)
@@ -267,8 +277,9 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
         self.areas[area_id] = area
         self.async_schedule_save()
 
-        self.hass.bus.async_fire_internal(
+        self._async_fire_updated(
             EVENT_AREA_REGISTRY_UPDATED,
+            area_id,
             EventAreaRegistryUpdatedData(action="create", area_id=area_id),
         )
         return area
@@ -284,8 +295,9 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
 
         del self.areas[area_id]
 
-        self.hass.bus.async_fire_internal(
+        self._async_fire_updated(
             EVENT_AREA_REGISTRY_UPDATED,
+            area_id,
             EventAreaRegistryUpdatedData(action="remove", area_id=area_id),
         )
 
@@ -317,12 +329,30 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
         # an event even if nothing has changed we cannot use async_fire_internal
         # here because we do not know if the thread safety check already
         # happened or not in _async_update.
-        self.hass.bus.async_fire(
-            EVENT_AREA_REGISTRY_UPDATED,
-            EventAreaRegistryUpdatedData(action="update", area_id=area_id),
-        )
+        data = EventAreaRegistryUpdatedData(action="update", area_id=area_id)
+        if self._batch is not None:
+            self._async_fire_updated(EVENT_AREA_REGISTRY_UPDATED, area_id, data)
+        else:
+            self.hass.bus.async_fire(EVENT_AREA_REGISTRY_UPDATED, data)
         return updated
 
+    @callback
+    def async_bulk_update(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> list[AreaEntry]:
+        """Update many areas, saving once.
+
+        updates maps area IDs to the keyword arguments of async_update.
+        The update events are compacted to one per area and fired once
+        all updates are applied.
+        """
+        self.hass.verify_event_loop_thread("area_registry.async_bulk_update")
+        with self._async_batch():
+            return [
+                self.async_update(area_id, **changes)
+                for area_id, changes in updates.items()
+            ]
+
     @callback
     def _async_update(
         self,
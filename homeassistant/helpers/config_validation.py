@@ -92,6 +92,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_ANY,
     ENTITY_MATCH_NONE,
+    MAX_EXPECTED_ENTITY_IDS,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
     WEEKDAYS,
@@ -359,6 +360,8 @@ def ensure_list[_T](value: _T | None) -> list[_T] | list[Any]:
 
 def entity_id(value: Any) -> str:
     """Validate Entity ID."""
+    if type(value) is str or type(value) is NodeStrClass:  # noqa: E721
+        return _entity_id_str(value)
     str_value = string(value).lower()
     if valid_entity_id(str_value):
         return str_value
@@ -366,6 +369,20 @@ def entity_id(value: Any) -> str:
     raise vol.Invalid(f"Entity ID {value} is an invalid entity ID")
 
 
+@functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
+def _entity_id_str(value: str) -> str:
+    """Validate an Entity ID string.
+
+    Entity IDs are repeated across many actions, triggers and conditions
+    so the result is cached.
+    """
+    str_value = value.lower()
+    if valid_entity_id(str_value):
+        return str_value
+
+    raise vol.Invalid(f"Entity ID {value} is an invalid entity ID")
+
+
 def entity_id_or_uuid(value: Any) -> str:
     """Validate Entity specified by entity_id or uuid."""
     with contextlib.suppress(vol.Invalid):
@@ -380,12 +397,19 @@ def _entity_ids(value: str | list, allow_uuid: bool) -> list[str]:
     if value is None:
         raise vol.Invalid("Entity IDs cannot be None")
     if isinstance(value, str):
-        value = [ent_id.strip() for ent_id in value.split(",")]
+        return list(_entity_ids_str(value, allow_uuid))
 
     validator = entity_id_or_uuid if allow_uuid else entity_id
     return [validator(ent_id) for ent_id in value]
 
 
+@functools.lru_cache(1024)
+def _entity_ids_str(value: str, allow_uuid: bool) -> tuple[str, ...]:
+    """Help validate a comma separated string of entity IDs or UUIDs."""
+    validator = entity_id_or_uuid if allow_uuid else entity_id
+    return tuple(validator(ent_id.strip()) for ent_id in value.split(","))
+
+
 def entity_ids(value: str | list) -> list[str]:
     """Validate Entity IDs."""
     return _entity_ids(value, False)
@@ -555,7 +579,15 @@ def time_period_str(value: str) -> timedelta:
         raise vol.Invalid("Make sure you wrap time values in quotes")
     if not isinstance(value, str):
         raise vol.Invalid(TIME_PERIOD_ERROR.format(value))
+    return _time_period_str(value)
 
+
+@functools.lru_cache(512)
+def _time_period_str(value: str) -> timedelta:
+    """Parse a time offset string.
+
+    The result is immutable so it is cached and shared between configs.
+    """
     negative_offset = False
     if value.startswith("-"):
         negative_offset = True
@@ -1056,6 +1088,17 @@ def removed(
     )
 
 
+def _compile_validator[_T: Callable[[Any], Any]](validator: _T) -> _T:
+    """Wrap All and Any validators in a schema so they are compiled once.
+
+    Calling them directly builds a new schema for each of their
+    validators on every call.
+    """
+    if isinstance(validator, (vol.All, vol.Any)):
+        return cast(_T, vol.Schema(validator))
+    return validator
+
+
 def key_value_schemas(
     key: str,
     value_schemas: dict[Hashable, VolSchemaType | Callable[[Any], dict[str, Any]]],
@@ -1066,6 +1109,11 @@ def key_value_schemas(
 
     This gives better error messages.
     """
+    compiled_schemas = {
+        key_value: _compile_validator(schema)
+        for key_value, schema in value_schemas.items()
+    }
+    compiled_default_schema = default_schema and _compile_validator(default_schema)
 
     def key_value_validator(value: Any) -> dict[Hashable, Any]:
         if not isinstance(value, dict):
@@ -1073,12 +1121,12 @@ def key_value_schemas(
 
         key_value = value.get(key)
 
-        if isinstance(key_value, Hashable) and key_value in value_schemas:
-            return cast(dict[Hashable, Any], value_schemas[key_value](value))
+        if isinstance(key_value, Hashable) and key_value in compiled_schemas:
+            return cast(dict[Hashable, Any], compiled_schemas[key_value](value))
 
-        if default_schema:
+        if compiled_default_schema:
             with contextlib.suppress(vol.Invalid):
-                return cast(dict[Hashable, Any], default_schema(value))
+                return cast(dict[Hashable, Any], compiled_default_schema(value))
 
         alternatives = ", ".join(str(alternative) for alternative in value_schemas)
         if default_description:
@@ -1415,7 +1463,7 @@ def script_action(value: Any) -> dict:
     return ACTION_TYPE_SCHEMAS[action](value)
 
 
-SCRIPT_SCHEMA = vol.All(ensure_list, [script_action])
+SCRIPT_SCHEMA: vol.Schema = vol.Schema(vol.All(ensure_list, [script_action]))
 
 SCRIPT_ACTION_BASE_SCHEMA: VolDictType = {
     vol.Optional(CONF_ALIAS): string,
@@ -1450,31 +1498,35 @@ def _backward_compat_service_schema(value: Any | None) -> Any:
     return value
 
 
-SERVICE_SCHEMA = vol.All(
-    _backward_compat_service_schema,
-    vol.Schema(
-        {
-            **SCRIPT_ACTION_BASE_SCHEMA,
-            vol.Exclusive(CONF_ACTION, "service name"): vol.Any(
-                service, dynamic_template
-            ),
-            vol.Exclusive(CONF_SERVICE_TEMPLATE, "service name"): vol.Any(
-                service, dynamic_template
-            ),
-            vol.Optional(CONF_SERVICE_DATA): vol.Any(
-                template, vol.All(dict, template_complex)
-            ),
-            vol.Optional(CONF_SERVICE_DATA_TEMPLATE): vol.Any(
-                template, vol.All(dict, template_complex)
-            ),
-            vol.Optional(CONF_ENTITY_ID): comp_entity_ids,
-            vol.Optional(CONF_TARGET): vol.Any(TARGET_SERVICE_FIELDS, dynamic_template),
-            vol.Optional(CONF_RESPONSE_VARIABLE): str,
-            # The frontend stores data here. Don't use in core.
-            vol.Remove("metadata"): dict,
-        }
-    ),
-    has_at_least_one_key(CONF_ACTION, CONF_SERVICE_TEMPLATE),
+SERVICE_SCHEMA: vol.Schema = vol.Schema(
+    vol.All(
+        _backward_compat_service_schema,
+        vol.Schema(
+            {
+                **SCRIPT_ACTION_BASE_SCHEMA,
+                vol.Exclusive(CONF_ACTION, "service name"): vol.Any(
+                    service, dynamic_template
+                ),
+                vol.Exclusive(CONF_SERVICE_TEMPLATE, "service name"): vol.Any(
+                    service, dynamic_template
+                ),
+                vol.Optional(CONF_SERVICE_DATA): vol.Any(
+                    template, vol.All(dict, template_complex)
+                ),
+                vol.Optional(CONF_SERVICE_DATA_TEMPLATE): vol.Any(
+                    template, vol.All(dict, template_complex)
+                ),
+                vol.Optional(CONF_ENTITY_ID): comp_entity_ids,
+                vol.Optional(CONF_TARGET): vol.Any(
+                    TARGET_SERVICE_FIELDS, dynamic_template
+                ),
+                vol.Optional(CONF_RESPONSE_VARIABLE): str,
+                # The frontend stores data here. Don't use in core.
+                vol.Remove("metadata"): dict,
+            }
+        ),
+        has_at_least_one_key(CONF_ACTION, CONF_SERVICE_TEMPLATE),
+    )
 )
 
 NUMERIC_STATE_THRESHOLD_SCHEMA = vol.Any(
@@ -1731,7 +1783,7 @@ CONDITION_SCHEMA: vol.Schema = vol.Schema(
     )
 )
 
-CONDITIONS_SCHEMA = vol.All(ensure_list, [CONDITION_SCHEMA])
+CONDITIONS_SCHEMA: vol.Schema = vol.Schema(vol.All(ensure_list, [CONDITION_SCHEMA]))
 
 dynamic_template_condition_action = vol.All(
     # Wrap a shorthand template condition action in a template condition
@@ -1830,10 +1882,12 @@ def _base_trigger_validator(value: Any) -> Any:
     return value
 
 
-TRIGGER_SCHEMA = vol.All(
-    ensure_list,
-    _base_trigger_list_flatten,
-    [vol.All(_trigger_pre_validator, _base_trigger_validator)],
+TRIGGER_SCHEMA: vol.Schema = vol.Schema(
+    vol.All(
+        ensure_list,
+        _base_trigger_list_flatten,
+        [vol.All(_trigger_pre_validator, _base_trigger_validator)],
+    )
 )
 
 _SCRIPT_DELAY_SCHEMA = vol.Schema(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from enum import StrEnum
 from functools import lru_cache
@@ -517,22 +517,29 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
     """Container for device registry items, maps device id -> entry.
 
     Maintains two additional indexes:
-    - (connection_type, connection identifier) -> entry
-    - (DOMAIN, identifier) -> entry
+    - (connection_type, connection identifier) -> key
+    - (DOMAIN, identifier) -> key
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._connections: dict[tuple[str, str], _EntryTypeT] = {}
-        self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self._connections: dict[tuple[str, str], str] = {}
+        self._identifiers: dict[tuple[str, str], str] = {}
 
     def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
         """Index an entry."""
         for connection in entry.connections:
-            self._connections[connection] = entry
+            self._connections[connection] = key
         for identifier in entry.identifiers:
-            self._identifiers[identifier] = entry
+            self._identifiers[identifier] = key
+
+    def _index_stored_entry(self, key: str, stored: dict[str, Any]) -> None:
+        """Index a pending entry from its stored form."""
+        for connection in stored["connections"]:
+            self._connections[tuple(connection)] = key
+        for identifier in stored["identifiers"]:
+            self._identifiers[tuple(identifier)] = key
 
     def _unindex_entry(
         self, key: str, replacement_entry: _EntryTypeT | None = None
@@ -553,12 +560,12 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
         if identifiers:
             for identifier in identifiers:
                 if identifier in self._identifiers:
-                    return self._identifiers[identifier]
+                    return self[self._identifiers[identifier]]
         if not connections:
             return None
         for connection in _normalize_connections(connections):
             if connection in self._connections:
-                return self._connections[connection]
+                return self[self._connections[connection]]
         return None
 
 
@@ -589,6 +596,16 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         for config_entry_id in entry.config_entries:
             self._config_entry_id_index[config_entry_id][key] = True
 
+    def _index_stored_entry(self, key: str, stored: dict[str, Any]) -> None:
+        """Index a pending entry from its stored form."""
+        super()._index_stored_entry(key, stored)
+        if (area_id := stored["area_id"]) is not None:
+            self._area_id_index[area_id][key] = True
+        for label in stored["labels"]:
+            self._labels_index[label][key] = True
+        for config_entry_id in stored["config_entries"]:
+            self._config_entry_id_index[config_entry_id][key] = True
+
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
     ) -> None:
@@ -605,24 +622,61 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
         """Get devices for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return [self[key] for key in self._area_id_index.get(area_id, ())]
 
     def get_devices_for_label(self, label: str) -> list[DeviceEntry]:
         """Get devices for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return [self[key] for key in self._labels_index.get(label, ())]
 
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[DeviceEntry]:
         """Get devices for config entry."""
-        data = self.data
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            self[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
 
+def _device_entry_from_stored(device: dict[str, Any]) -> DeviceEntry:
+    """Decode a device entry from its stored form."""
+    return DeviceEntry(
+        area_id=device["area_id"],
+        config_entries=set(device["config_entries"]),
+        configuration_url=device["configuration_url"],
+        # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
+        connections={
+            tuple(conn)  # type: ignore[misc]
+            for conn in device["connections"]
+        },
+        created_at=datetime.fromisoformat(device["created_at"]),
+        disabled_by=(
+            DeviceEntryDisabler(device["disabled_by"])
+            if device["disabled_by"]
+            else None
+        ),
+        entry_type=(
+            DeviceEntryType(device["entry_type"]) if device["entry_type"] else None
+        ),
+        hw_version=device["hw_version"],
+        id=device["id"],
+        identifiers={
+            tuple(iden)  # type: ignore[misc]
+            for iden in device["identifiers"]
+        },
+        labels=set(device["labels"]),
+        manufacturer=device["manufacturer"],
+        model=device["model"],
+        model_id=device["model_id"],
+        modified_at=datetime.fromisoformat(device["modified_at"]),
+        name_by_user=device["name_by_user"],
+        name=device["name"],
+        primary_config_entry=device["primary_config_entry"],
+        serial_number=device["serial_number"],
+        sw_version=device["sw_version"],
+        via_device_id=device["via_device_id"],
+    )
+
+
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
 
@@ -639,6 +693,8 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
+            fast_load=True,
         )
 
     @callback
@@ -646,9 +702,10 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         """Get device.
 
         We retrieve the DeviceEntry from the underlying dict to avoid
-        the overhead of the UserDict __getitem__.
+        the overhead of the UserDict __getitem__ and only fall back to it
+        for devices that have not been decoded yet.
         """
-        return self._device_data.get(device_id)
+        return self._device_data.get(device_id) or self.devices.get(device_id)
 
     @callback
     def async_get_device(
@@ -845,6 +902,37 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         assert device
         return device
 
+    @callback
+    def async_bulk_get_or_create(
+        self, items: Iterable[Mapping[str, Any]]
+    ) -> list[DeviceEntry]:
+        """Get or create many devices, saving once.
+
+        Each item holds the keyword arguments of async_get_or_create.
+        The updated events are compacted to at most one per device and
+        fired once all items are processed.
+        """
+        self.hass.verify_event_loop_thread("device_registry.async_bulk_get_or_create")
+        with self._async_batch():
+            return [self.async_get_or_create(**item) for item in items]
+
+    @callback
+    def async_bulk_update(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> list[DeviceEntry | None]:
+        """Update many devices, saving once.
+
+        updates maps device IDs to the keyword arguments of
+        async_update_device. The updated events are compacted to at
+        most one per device and fired once all updates are applied.
+        """
+        self.hass.verify_event_loop_thread("device_registry.async_bulk_update")
+        with self._async_batch():
+            return [
+                self.async_update_device(device_id, **changes)
+                for device_id, changes in updates.items()
+            ]
+
     @callback
     def async_update_device(  # noqa: C901
         self,
@@ -1054,7 +1142,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         else:
             data = {"action": "update", "device_id": new.id, "changes": old_values}
 
-        self.hass.bus.async_fire_internal(EVENT_DEVICE_REGISTRY_UPDATED, data)
+        self._async_fire_updated(EVENT_DEVICE_REGISTRY_UPDATED, new.id, data)
 
         return new
 
@@ -1121,8 +1209,9 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         for other_device in list(self.devices.values()):
             if other_device.via_device_id == device_id:
                 self.async_update_device(other_device.id, via_device_id=None)
-        self.hass.bus.async_fire_internal(
+        self._async_fire_updated(
             EVENT_DEVICE_REGISTRY_UPDATED,
+            device_id,
             _EventDeviceRegistryUpdatedData_CreateRemove(
                 action="remove", device_id=device_id
             ),
@@ -1136,48 +1225,12 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         data = await self._store.async_load()
 
         devices = ActiveDeviceRegistryItems()
+        stored_devices: dict[str, dict[str, Any]] = {}
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
-                devices[device["id"]] = DeviceEntry(
-                    area_id=device["area_id"],
-                    config_entries=set(device["config_entries"]),
-                    configuration_url=device["configuration_url"],
-                    # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
-                    connections={
-                        tuple(conn)  # type: ignore[misc]
-                        for conn in device["connections"]
-                    },
-                    created_at=datetime.fromisoformat(device["created_at"]),
-                    disabled_by=(
-                        DeviceEntryDisabler(device["disabled_by"])
-                        if device["disabled_by"]
-                        else None
-                    ),
-                    entry_type=(
-                        DeviceEntryType(device["entry_type"])
-                        if device["entry_type"]
-                        else None
-                    ),
-                    hw_version=device["hw_version"],
-                    id=device["id"],
-                    identifiers={
-                        tuple(iden)  # type: ignore[misc]
-                        for iden in device["identifiers"]
-                    },
-                    labels=set(device["labels"]),
-                    manufacturer=device["manufacturer"],
-                    model=device["model"],
-                    model_id=device["model_id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
-                    name_by_user=device["name_by_user"],
-                    name=device["name"],
-                    primary_config_entry=device["primary_config_entry"],
-                    serial_number=device["serial_number"],
-                    sw_version=device["sw_version"],
-                    via_device_id=device["via_device_id"],
-                )
+                stored_devices[device["id"]] = device
             # Introduced in 0.111
             for device in data["deleted_devices"]:
                 deleted_devices[device["id"]] = DeletedDeviceEntry(
@@ -1190,6 +1243,8 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
                     orphaned_timestamp=device["orphaned_timestamp"],
                 )
 
+        # Devices are decoded when they are first accessed
+        devices.load_pending(stored_devices, _device_entry_from_stored)
         self.devices = devices
         self.deleted_devices = deleted_devices
         self._device_data = devices.data
@@ -1198,7 +1253,9 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of device registry to store in a file."""
         return {
-            "devices": [entry.as_storage_fragment for entry in self.devices.values()],
+            "devices": self.devices.as_storage_fragments(
+                lambda entry: entry.as_storage_fragment
+            ),
             "deleted_devices": [
                 entry.as_storage_fragment for entry in self.deleted_devices.values()
             ],
@@ -47,6 +47,7 @@ from homeassistant.core import (
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.core_config import DATA_CUSTOMIZE
 from homeassistant.exceptions import (
@@ -56,6 +57,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
+from homeassistant.util.executor import JobPriority
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
 
 from . import device_registry as dr, entity_registry as er, singleton
@@ -75,6 +77,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_INTEGRATION_ENTITY_IDS = "entity_info_integration_entity_ids"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +103,19 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+@singleton.singleton(DATA_INTEGRATION_ENTITY_IDS)
+def _integration_entity_ids(hass: HomeAssistant) -> dict[str, dict[str, None]]:
+    """Get the entity ids of the entity sources of each integration."""
+    return {}
+
+
+@callback
+def async_integration_entity_ids(hass: HomeAssistant, domain: str) -> list[str]:
+    """Return the entity ids of the entity sources of an integration."""
+    return list(_integration_entity_ids(hass).get(domain, ()))
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -196,6 +212,31 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine at once.
+
+    This is intended for integrations that update many entities in a single
+    poll cycle. All states are stored before any state_changed event is fired
+    so listeners see the result of the whole update.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+    state_writes = []
+    for entity in entities:
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        if (state_write := entity._async_prepare_state_write()) is None:  # noqa: SLF001
+            continue
+        try:
+            validate_state(state_write[1])
+        except InvalidStateError:
+            entity._async_write_unknown_state()  # noqa: SLF001
+            continue
+        state_writes.append(state_write)
+    hass.states.async_set_many_internal(state_writes)
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -213,6 +254,12 @@ class StateInfo(TypedDict):
     unrecorded_attributes: frozenset[str]
 
 
+# The arguments for StateMachine.async_set_internal
+type StateWrite = tuple[
+    str, str, dict[str, Any], bool, Context | None, StateInfo | None, float
+]
+
+
 class EntityPlatformState(Enum):
     """The platform state of an entity."""
 
@@ -1123,9 +1170,33 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (state_write := self._async_prepare_state_write()) is None:
+            return
+        try:
+            self.hass.states.async_set_internal(*state_write)
+        except InvalidStateError:
+            self._async_write_unknown_state()
+
+    @callback
+    def _async_write_unknown_state(self) -> None:
+        """Write the unknown state after the calculated state was invalid."""
+        _LOGGER.exception(
+            "Failed to set state for %s, fall back to %s", self.entity_id, STATE_UNKNOWN
+        )
+        self.hass.states.async_set(
+            self.entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+        )
+
+    @callback
+    def _async_prepare_state_write(self) -> StateWrite | None:
+        """Calculate the state to write to the state machine.
+
+        Returns the arguments for StateMachine.async_set_internal or None
+        if the state should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1141,7 +1212,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1223,23 +1294,15 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return (
+            entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+            time_now,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -1317,7 +1380,18 @@ class Entity(
             if hasattr(self, "async_update"):
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if self.platform:
+                    # Jobs of an integration are limited by its executor
+                    # quota so it can not occupy all workers
+                    await hass.async_run_integration_executor_job(
+                        self.platform.platform_name,
+                        self.update,
+                        priority=JobPriority.POLLING,
+                    )
+                else:
+                    await hass.async_add_executor_job(
+                        self.update, priority=JobPriority.POLLING
+                    )
             else:
                 return
         finally:
@@ -1473,6 +1547,9 @@ class Entity(
             entity_info["config_entry"] = self.platform.config_entry.entry_id
 
         entity_sources(self.hass)[self.entity_id] = entity_info
+        _integration_entity_ids(self.hass).setdefault(entity_info["domain"], {})[
+            self.entity_id
+        ] = None
 
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
@@ -1502,7 +1579,12 @@ class Entity(
         # The check for self.platform guards against integrations not using an
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
-            del entity_sources(self.hass)[self.entity_id]
+            entity_info = entity_sources(self.hass).pop(self.entity_id)
+            integration_entity_ids = _integration_entity_ids(self.hass)
+            entity_ids = integration_entity_ids[entity_info["domain"]]
+            del entity_ids[self.entity_id]
+            if not entity_ids:
+                del integration_entity_ids[entity_info["domain"]]
 
     @callback
     def _async_registry_updated(
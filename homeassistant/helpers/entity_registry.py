@@ -11,7 +11,7 @@ timer.
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections.abc import Callable, Container, Hashable, Iterable, KeysView, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
@@ -561,26 +561,69 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._entry_ids: dict[str, RegistryEntry] = {}
+        self._entry_ids: dict[str, str] = {}
         self._index: dict[tuple[str, str, str], str] = {}
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        # Entries of a device which inherit the area of the device
+        self._device_area_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
-        self._entry_ids[entry.id] = entry
-        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_values(
+            key,
+            entry.id,
+            entry.domain,
+            entry.platform,
+            entry.unique_id,
+            entry.config_entry_id,
+            entry.device_id,
+            entry.area_id,
+            entry.labels,
+        )
+
+    def _index_stored_entry(self, key: str, stored: dict[str, Any]) -> None:
+        """Index a pending entry from its stored form."""
+        self._index_values(
+            key,
+            stored["id"],
+            split_entity_id(key)[0],
+            stored["platform"],
+            stored["unique_id"],
+            stored["config_entry_id"],
+            stored["device_id"],
+            stored["area_id"],
+            stored["labels"],
+        )
+
+    def _index_values(
+        self,
+        key: str,
+        entry_id: str,
+        domain: str,
+        platform: str,
+        unique_id: str,
+        config_entry_id: str | None,
+        device_id: str | None,
+        area_id: str | None,
+        labels: Iterable[str],
+    ) -> None:
+        """Index the values of an entry."""
+        self._entry_ids[entry_id] = key
+        self._index[(domain, platform, unique_id)] = key
         # python has no ordered set, so we use a dict with True values
         # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
-        if (config_entry_id := entry.config_entry_id) is not None:
+        if config_entry_id is not None:
             self._config_entry_id_index[config_entry_id][key] = True
-        if (device_id := entry.device_id) is not None:
+        if device_id is not None:
             self._device_id_index[device_id][key] = True
-        if (area_id := entry.area_id) is not None:
+            if area_id is None:
+                self._device_area_index[device_id][key] = True
+        if area_id is not None:
             self._area_id_index[area_id][key] = True
-        for label in entry.labels:
+        for label in labels:
             self._labels_index[label][key] = True
 
     def _unindex_entry(
@@ -594,6 +637,8 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
         if device_id := entry.device_id:
             self._unindex_entry_value(key, device_id, self._device_id_index)
+            if entry.area_id is None:
+                self._unindex_entry_value(key, device_id, self._device_area_index)
         if area_id := entry.area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
         if labels := entry.labels:
@@ -610,37 +655,45 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
-        return self._entry_ids.get(key)
+        if (entity_id := self._entry_ids.get(key)) is None:
+            return None
+        return self[entity_id]
 
     def get_entries_for_device_id(
         self, device_id: str, include_disabled_entities: bool = False
     ) -> list[RegistryEntry]:
         """Get entries for device."""
-        data = self.data
         return [
             entry
             for key in self._device_id_index.get(device_id, ())
-            if not (entry := data[key]).disabled_by or include_disabled_entities
+            if not (entry := self[key]).disabled_by or include_disabled_entities
         ]
 
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            self[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return [self[key] for key in self._area_id_index.get(area_id, ())]
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return [self[key] for key in self._labels_index.get(label, ())]
+
+    def get_entries_for_device_area(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device which inherit the area of the device."""
+        return [
+            entry
+            for key in self._device_area_index.get(device_id, ())
+            if not (entry := self[key]).disabled_by or include_disabled_entities
+        ]
 
 
 def _validate_item(
@@ -697,6 +750,46 @@ def _validate_item(
         )
 
 
+def _registry_entry_from_stored(entity: dict[str, Any]) -> RegistryEntry:
+    """Decode a registry entry from its stored form."""
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        previous_unique_id=entity["previous_unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
 
@@ -713,6 +806,8 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
+            fast_load=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -729,10 +824,13 @@ class EntityRegistry(BaseRegistry):
         """Get EntityEntry for an entity_id or entity entry id.
 
         We retrieve the RegistryEntry from the underlying dict to avoid
-        the overhead of the UserDict __getitem__.
+        the overhead of the UserDict __getitem__ and only fall back to it
+        for entries that have not been decoded yet.
         """
-        return self._entities_data.get(entity_id_or_uuid) or self.entities.get_entry(
-            entity_id_or_uuid
+        return (
+            self._entities_data.get(entity_id_or_uuid)
+            or self.entities.get_entry(entity_id_or_uuid)
+            or self.entities.get(entity_id_or_uuid)
         )
 
     @callback
@@ -918,8 +1016,9 @@ class EntityRegistry(BaseRegistry):
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
         self.async_schedule_save()
 
-        self.hass.bus.async_fire_internal(
+        self._async_fire_updated(
             EVENT_ENTITY_REGISTRY_UPDATED,
+            entry.id,
             _EventEntityRegistryUpdatedData_CreateRemove(
                 action="create", entity_id=entity_id
             ),
@@ -927,6 +1026,20 @@ class EntityRegistry(BaseRegistry):
 
         return entry
 
+    @callback
+    def async_bulk_get_or_create(
+        self, items: Iterable[Mapping[str, Any]]
+    ) -> list[RegistryEntry]:
+        """Get or create many entities, saving once.
+
+        Each item holds the keyword arguments of async_get_or_create.
+        The updated events are compacted to at most one per entity and
+        fired once all items are processed.
+        """
+        self.hass.verify_event_loop_thread("entity_registry.async_bulk_get_or_create")
+        with self._async_batch():
+            return [self.async_get_or_create(**item) for item in items]
+
     @callback
     def async_remove(self, entity_id: str) -> None:
         """Remove an entity from registry."""
@@ -945,8 +1058,9 @@ class EntityRegistry(BaseRegistry):
             platform=entity.platform,
             unique_id=entity.unique_id,
         )
-        self.hass.bus.async_fire_internal(
+        self._async_fire_updated(
             EVENT_ENTITY_REGISTRY_UPDATED,
+            entity.id,
             _EventEntityRegistryUpdatedData_CreateRemove(
                 action="remove", entity_id=entity_id
             ),
@@ -1143,7 +1257,7 @@ class EntityRegistry(BaseRegistry):
         if old.entity_id != entity_id:
             data["old_entity_id"] = old.entity_id
 
-        self.hass.bus.async_fire_internal(EVENT_ENTITY_REGISTRY_UPDATED, data)
+        self._async_fire_updated(EVENT_ENTITY_REGISTRY_UPDATED, new.id, data)
 
         return new
 
@@ -1202,6 +1316,23 @@ class EntityRegistry(BaseRegistry):
             unit_of_measurement=unit_of_measurement,
         )
 
+    @callback
+    def async_bulk_update(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> list[RegistryEntry]:
+        """Update many entities, saving once.
+
+        updates maps entity IDs to the keyword arguments of
+        async_update_entity. The updated events are compacted to at
+        most one per entity and fired once all updates are applied.
+        """
+        self.hass.verify_event_loop_thread("entity_registry.async_bulk_update")
+        with self._async_batch():
+            return [
+                self.async_update_entity(entity_id, **changes)
+                for entity_id, changes in updates.items()
+            ]
+
     @callback
     def async_update_entity_platform(
         self,
@@ -1260,6 +1391,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
+        stored_entities: dict[str, dict[str, Any]] = {}
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
 
         if data is not None:
@@ -1289,42 +1421,7 @@ class EntityRegistry(BaseRegistry):
                     )
                     continue
 
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+                stored_entities[entity["entity_id"]] = entity
             for entity in data["deleted_entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1353,6 +1450,8 @@ class EntityRegistry(BaseRegistry):
                     unique_id=entity["unique_id"],
                 )
 
+        # Entries are decoded when they are first accessed
+        entities.load_pending(stored_entities, _registry_entry_from_stored)
         self.deleted_entities = deleted_entities
         self.entities = entities
         self._entities_data = entities.data
@@ -1361,7 +1460,9 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
+            "entities": self.entities.as_storage_fragments(
+                lambda entry: entry.as_storage_fragment
+            ),
             "deleted_entities": [
                 entry.as_storage_fragment for entry in self.deleted_entities.values()
             ],
@@ -1450,10 +1551,24 @@ def async_entries_for_device(
 
 @callback
 def async_entries_for_area(
-    registry: EntityRegistry, area_id: str
+    registry: EntityRegistry, area_id: str, include_device_area: bool = False
 ) -> list[RegistryEntry]:
-    """Return entries that match an area."""
-    return registry.entities.get_entries_for_area_id(area_id)
+    """Return entries that match an area.
+
+    With include_device_area, enabled entries without an area of their own
+    whose device is in the area are returned as well.
+    """
+    entries = registry.entities.get_entries_for_area_id(area_id)
+    if include_device_area:
+        entities = registry.entities
+        entries.extend(
+            entry
+            for device in dr.async_entries_for_area(
+                dr.async_get(registry.hass), area_id
+            )
+            for entry in entities.get_entries_for_device_area(device.id)
+        )
+    return entries
 
 
 @callback
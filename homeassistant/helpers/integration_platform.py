@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -23,12 +23,23 @@ from homeassistant.setup import ATTR_COMPONENT, EventComponentLoaded
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.logging import catch_log_exception
 
+from .start import async_at_started
+
 _LOGGER = logging.getLogger(__name__)
 DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
     "integration_platforms"
 )
 
 
+@dataclass(slots=True)
+class PendingIntegrationPlatforms:
+    """Components with a lazy integration platform that is not loaded yet."""
+
+    components: set[str] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+    lazy: bool = True
+
+
 @dataclass(slots=True, frozen=True)
 class IntegrationPlatform:
     """An integration platform."""
@@ -36,6 +47,7 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    pending: PendingIntegrationPlatforms | None = None
 
 
 @callback
@@ -55,6 +67,15 @@ def _async_integration_platform_component_loaded(
         if component_name in integration_platform.seen_components:
             continue
         integration_platform.seen_components.add(component_name)
+        # Lazy platforms are processed when they are first needed
+        # unless the platform was already imported.
+        if (
+            (pending := integration_platform.pending)
+            and pending.lazy
+            and not integration.get_platform_cached(integration_platform.platform_name)
+        ):
+            pending.components.add(component_name)
+            continue
         integration_platforms_by_name[integration_platform.platform_name] = (
             integration_platform
         )
@@ -160,8 +181,17 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    *,
+    lazy: bool = False,
+    prefetch: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If lazy is set, the platforms are not imported when an integration is
+    loaded. Call async_load_integration_platforms before the processed
+    platforms are needed. If prefetch is also set, the platforms are loaded
+    in the background once Home Assistant is running.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,10 +205,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    # Tell the loader that it should try to pre-load the integration
-    # for any future components that are loaded so we can reduce the
-    # amount of import executor usage.
-    async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -187,6 +213,25 @@ async def async_process_integration_platforms(
         ),
         f"process_platform {platform_name}",
     )
+
+    if lazy:
+        pending = PendingIntegrationPlatforms(top_level_components.copy())
+        integration_platforms.append(
+            IntegrationPlatform(
+                platform_name, process_job, top_level_components, pending
+            )
+        )
+        if prefetch:
+            async_at_started(
+                hass,
+                partial(_async_prefetch_integration_platforms, pending, platform_name),
+            )
+        return
+
+    # Tell the loader that it should try to pre-load the integration
+    # for any future components that are loaded so we can reduce the
+    # amount of import executor usage.
+    async_register_preload_platform(hass, platform_name)
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -255,3 +300,63 @@ async def _async_process_integration_platforms(
 
     if futures:
         await asyncio.gather(*futures)
+
+
+async def async_load_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Load and process lazy integration platforms that are still pending."""
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if integration_platform.platform_name == platform_name and (
+            pending := integration_platform.pending
+        ):
+            await _async_load_pending_integration_platforms(
+                hass, integration_platform, pending
+            )
+
+
+async def _async_load_pending_integration_platforms(
+    hass: HomeAssistant,
+    integration_platform: IntegrationPlatform,
+    pending: PendingIntegrationPlatforms,
+) -> None:
+    """Load the pending platforms of a lazy integration platform.
+
+    Callers that arrive while the platforms are loading wait for the
+    same task.
+    """
+    while (task := pending.task) is not None or pending.components:
+        if task is None:
+            components = pending.components.copy()
+            pending.components.clear()
+            task = pending.task = hass.async_create_task_internal(
+                _async_process_integration_platforms(
+                    hass,
+                    integration_platform.platform_name,
+                    components,
+                    integration_platform.process_job,
+                ),
+                f"load integration platforms {integration_platform.platform_name}",
+                eager_start=True,
+            )
+        try:
+            await asyncio.shield(task)
+        finally:
+            if pending.task is task and task.done():
+                pending.task = None
+
+
+@callback
+def _async_prefetch_integration_platforms(
+    pending: PendingIntegrationPlatforms, platform_name: str, hass: HomeAssistant
+) -> None:
+    """Load lazy integration platforms in the background once running.
+
+    Integrations loaded after this point have their platform processed
+    right away.
+    """
+    pending.lazy = False
+    hass.async_create_background_task(
+        async_load_integration_platforms(hass, platform_name),
+        f"prefetch integration platforms {platform_name}",
+    )
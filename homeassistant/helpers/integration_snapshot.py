@@ -0,0 +1,115 @@
+"""Persist a snapshot of the resolved built-in integrations."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import hashlib
+import logging
+import pathlib
+from typing import Any
+
+from homeassistant import loader
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+
+from .json import json_bytes_sorted
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.integration_snapshot"
+STORAGE_VERSION = 1
+
+DATA_INTEGRATION_SNAPSHOT_STORE: HassKey[IntegrationSnapshotStore] = HassKey(
+    "integration_snapshot_store"
+)
+
+
+def _async_custom_components_fingerprint(
+    custom_components: dict[str, loader.Integration],
+) -> str:
+    """Return a fingerprint of the manifests of the custom integrations."""
+    manifests = {
+        domain: integration.manifest
+        for domain, integration in custom_components.items()
+    }
+    return hashlib.sha256(json_bytes_sorted(manifests)).hexdigest()
+
+
+def _get_file_state(domains: Iterable[str]) -> dict[str, list[int] | None]:
+    """Return the modification times of built-in integration directories."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components
+
+    root = pathlib.Path(components.__path__[0])
+    file_state: dict[str, list[int] | None] = {}
+    for domain in domains:
+        path = root / domain
+        try:
+            file_state[domain] = [
+                path.stat().st_mtime_ns,
+                (path / "manifest.json").stat().st_mtime_ns,
+            ]
+        except OSError:
+            file_state[domain] = None
+    return file_state
+
+
+class IntegrationSnapshotStore:
+    """Store a snapshot of the resolved built-in integrations.
+
+    The snapshot holds the manifest, top level files, resolved
+    dependencies and missing platforms of each built-in integration
+    that was loaded. It is only restored when it was saved by the same
+    version of Home Assistant with the same custom integrations and
+    none of the integration directories changed since.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot store."""
+        self.hass = hass
+        self._store = Store[dict[str, Any]](hass, STORAGE_VERSION, STORAGE_KEY)
+        self._custom_components: str | None = None
+        self._restored: dict[str, loader.IntegrationSnapshot] | None = None
+
+    async def async_load(self) -> bool:
+        """Restore the snapshot if it is still valid."""
+        hass = self.hass
+        self._custom_components = _async_custom_components_fingerprint(
+            await loader.async_get_custom_components(hass)
+        )
+        if (data := await self._store.async_load()) is None:
+            return False
+        if (
+            data["version"] != __version__
+            or data["custom_components"] != self._custom_components
+        ):
+            _LOGGER.debug("Integration snapshot is for a different installation")
+            return False
+        snapshot: dict[str, loader.IntegrationSnapshot] = data["integrations"]
+        file_state = await hass.async_add_executor_job(_get_file_state, snapshot)
+        if file_state != data["file_state"]:
+            _LOGGER.debug("Integration snapshot is out of date")
+            return False
+        self._restored = snapshot
+        loader.async_restore_integration_snapshot(hass, dict(snapshot))
+        return True
+
+    async def async_save(self) -> None:
+        """Save the snapshot if the loaded integrations changed."""
+        if self._custom_components is None:
+            return
+        snapshot = loader.async_get_integration_snapshot(self.hass)
+        if snapshot == self._restored:
+            return
+        file_state = await self.hass.async_add_executor_job(_get_file_state, snapshot)
+        await self._store.async_save(
+            {
+                "version": __version__,
+                "custom_components": self._custom_components,
+                "file_state": file_state,
+                "integrations": snapshot,
+            }
+        )
+        self._restored = snapshot
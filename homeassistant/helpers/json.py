@@ -199,8 +199,12 @@ def save_json(
     *,
     encoder: type[json.JSONEncoder] | None = None,
     atomic_writes: bool = False,
-) -> None:
-    """Save JSON data to a file."""
+    sync_directory: bool = True,
+) -> str | bytes:
+    """Save JSON data to a file and return the JSON that was written.
+
+    sync_directory is passed to write_utf8_file_atomic for atomic writes.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -224,8 +228,13 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
+    if atomic_writes:
+        write_utf8_file_atomic(
+            filename, json_data, private, mode=mode, sync_directory=sync_directory
+        )
+    else:
+        write_utf8_file(filename, json_data, private, mode=mode)
+    return json_data
 
 
 def find_paths_unserializable_data(
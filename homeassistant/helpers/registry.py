@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Callable, Generator, Iterator, Mapping, Sequence, ValuesView
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.util.event_type import EventType
+
+from .json import json_bytes, json_fragment
 
 if TYPE_CHECKING:
     from .storage import Store
@@ -19,14 +23,115 @@ type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
 
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
-    """Base class for registry items."""
+    """Base class for registry items.
+
+    Stored entries can be loaded as pending entries, which are indexed
+    from their stored form and only decoded when they are first accessed.
+    """
 
     data: dict[str, _DataT]
 
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_order: dict[str, None] | None = None
+        self._decode: Callable[[dict[str, Any]], _DataT] | None = None
+
+    def load_pending(
+        self,
+        stored_entries: dict[str, dict[str, Any]],
+        decode: Callable[[dict[str, Any]], _DataT],
+    ) -> None:
+        """Load stored entries that are decoded on first access."""
+        self._decode = decode
+        self._pending = stored_entries
+        self._pending_order = dict.fromkeys(stored_entries)
+        for key, stored in stored_entries.items():
+            self._index_stored_entry(key, stored)
+
+    def _index_stored_entry(self, key: str, stored: dict[str, Any]) -> None:
+        """Index a pending entry from its stored form."""
+        raise NotImplementedError
+
+    def _decode_pending(self, key: str) -> _DataT:
+        """Decode a pending entry."""
+        assert self._decode is not None
+        entry = self.data[key] = self._decode(self._pending.pop(key))
+        if not self._pending:
+            self._restore_order()
+        return entry
+
+    def _decode_all_pending(self) -> None:
+        """Decode all pending entries."""
+        assert self._decode is not None
+        data = self.data
+        decode = self._decode
+        for key, stored in self._pending.items():
+            data[key] = decode(stored)
+        self._pending.clear()
+        self._restore_order()
+
+    def _restore_order(self) -> None:
+        """Restore the load order of the entries once none are pending."""
+        if (pending_order := self._pending_order) is None:
+            return
+        self._pending_order = None
+        data = self.data
+        ordered = {key: data.pop(key) for key in pending_order if key in data}
+        ordered.update(data)
+        data.clear()
+        data.update(ordered)
+
+    def __missing__(self, key: str) -> _DataT:
+        """Decode a pending entry on first access."""
+        if key in self._pending:
+            return self._decode_pending(key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the key is in the registry."""
+        return key in self.data or key in self._pending
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._pending)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in load order without decoding entries."""
+        if (pending_order := self._pending_order) is None:
+            return iter(self.data)
+        data = self.data
+        pending = self._pending
+        return iter(
+            [
+                *(key for key in pending_order if key in data or key in pending),
+                *(key for key in data if key not in pending_order),
+            ]
+        )
+
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
+        if self._pending:
+            self._decode_all_pending()
         return self.data.values()
 
+    def as_storage_fragments(self, fragment: Callable[[_DataT], Any]) -> list[Any]:
+        """Return the storage fragments of the entries.
+
+        Pending entries are stored as loaded without decoding them.
+        """
+        if not self._pending:
+            return [fragment(entry) for entry in self.data.values()]
+        data = self.data
+        pending = self._pending
+        return [
+            json_fragment(json_bytes(pending[key]))
+            if key in pending
+            else fragment(data[key])
+            for key in self
+        ]
+
     @abstractmethod
     def _index_entry(self, key: str, entry: _DataT) -> None:
         """Index an entry."""
@@ -37,6 +142,8 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
 
     def __setitem__(self, key: str, entry: _DataT) -> None:
         """Add an item."""
+        if key in self._pending:
+            self._decode_pending(key)
         data = self.data
         if key in data:
             self._unindex_entry(key, entry)
@@ -59,8 +166,85 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
+        if key in self._pending:
+            self._decode_pending(key)
         self._unindex_entry(key)
         super().__delitem__(key)
+        if self._pending_order is not None:
+            self._pending_order.pop(key, None)
+
+
+class _RegistryBatch:
+    """Collect the saves and updated events of a bulk registry operation.
+
+    Events are compacted per entry, a create followed by updates is
+    fired as a single create, consecutive updates are merged keeping
+    the oldest value of each change and a create followed by a remove
+    is not fired at all.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the batch."""
+        self.save = False
+        self._events: list[tuple[EventType[Any], dict[str, Any]] | None] = []
+        self._event_index: dict[str, int] = {}
+
+    def add_event(
+        self, event_type: EventType[Any], key: str, data: Mapping[str, Any]
+    ) -> None:
+        """Add an updated event for the entry with key."""
+        if (idx := self._event_index.get(key)) is not None:
+            event = self._events[idx]
+            assert event is not None
+            pending = event[1]
+            if (merged := _merge_events(pending, data)) is not None:
+                self._events[idx] = (event_type, merged)
+                return
+            if pending["action"] == "create" and data["action"] == "remove":
+                self._events[idx] = None
+                del self._event_index[key]
+                return
+        self._event_index[key] = len(self._events)
+        self._events.append((event_type, dict(data)))
+
+    def events(self) -> Iterator[tuple[EventType[Any], dict[str, Any]]]:
+        """Return the compacted events in the order they happened."""
+        return (event for event in self._events if event is not None)
+
+
+def _merge_events(
+    pending: dict[str, Any], data: Mapping[str, Any]
+) -> dict[str, Any] | None:
+    """Merge an updated event into the pending event for the same entry.
+
+    Returns None if the events can not be merged.
+    """
+    pending_action = pending["action"]
+    action = data["action"]
+    if action == "update" and pending_action == "create":
+        # Entries can be renamed, so the create carries the latest id
+        merged = {
+            key: value
+            for key, value in data.items()
+            if key not in ("changes", "old_entity_id")
+        }
+        merged["action"] = "create"
+        return merged
+    if action == "update" and pending_action == "update":
+        merged = dict(data)
+        if "changes" in pending:
+            merged["changes"] = {**data["changes"], **pending["changes"]}
+        if "old_entity_id" in pending:
+            merged["old_entity_id"] = pending["old_entity_id"]
+            if merged["old_entity_id"] == merged["entity_id"]:
+                del merged["old_entity_id"]
+        return merged
+    if action == "remove" and pending_action == "update":
+        if "old_entity_id" in pending:
+            # Listeners only know the entry by its old id
+            return None
+        return dict(data)
+    return None
 
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
@@ -68,10 +252,49 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
 
     hass: HomeAssistant
     _store: Store[_StoreDataT]
+    _batch: _RegistryBatch | None = None
+
+    @contextmanager
+    def _async_batch(self) -> Generator[None]:
+        """Save once and fire compacted events for the changes made in the block.
+
+        Changes made before an exception is raised are kept, so they are
+        still saved and their events are still fired.
+        """
+        if self._batch is not None:
+            # Nested bulk operations are part of the outer batch
+            yield
+            return
+        batch = self._batch = _RegistryBatch()
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch.save:
+                self.async_schedule_save()
+            fire = self.hass.bus.async_fire_internal
+            for event_type, data in batch.events():
+                fire(event_type, data)
+
+    @callback
+    def _async_fire_updated[_DataT: Mapping[str, Any]](
+        self, event_type: EventType[_DataT], key: str, data: _DataT
+    ) -> None:
+        """Fire an updated event, or add it to the running batch.
+
+        key identifies the entry and must not change when it is renamed.
+        """
+        if self._batch is not None:
+            self._batch.add_event(event_type, key, data)
+            return
+        self.hass.bus.async_fire_internal(event_type, data)
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the registry."""
+        if self._batch is not None:
+            self._batch.save = True
+            return
         # Schedule the save past startup to avoid writing
         # the file while the system is starting.
         delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable
+from copy import deepcopy
 import logging
 from typing import Any, Literal, overload
 
 from homeassistant import config as conf_util
 from homeassistant.const import SERVICE_RELOAD
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.hass_dict import HassKey
 
+from . import device_registry as dr, entity_registry as er
 from .entity import Entity
 from .entity_component import EntityComponent
 from .entity_platform import EntityPlatform, async_get_platforms
@@ -24,6 +27,10 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORM_RESET_LOCK = "lock_async_reset_platform_{}"
 
+DATA_CONFIG_ITEM_CACHES: HassKey[dict[str, ConfigItemCache[Any]]] = HassKey(
+    "reload_config_item_caches"
+)
+
 
 async def async_reload_integration_platforms(
     hass: HomeAssistant, integration_domain: str, platform_domains: Iterable[str]
@@ -209,3 +216,106 @@ def setup_reload_service(
         async_setup_reload_service(hass, domain, platforms),
         hass.loop,
     ).result()
+
+
+class ConfigItemCache[_T]:
+    """Remember validated config items by unique id.
+
+    A reload only validates the items whose raw config changed since
+    they were last validated. Each validation pass over the config of a
+    domain must end with async_finish.
+
+    Validation also resolves entity registry ids and device triggers,
+    conditions and actions, so all caches are cleared when an entity is
+    renamed or removed or when a device is updated or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._items: dict[str, tuple[Any, _T]] = {}
+        self._seen: set[str] = set()
+
+    async def async_validate(
+        self,
+        unique_id: str | None,
+        config: Any,
+        validate: Callable[[], Awaitable[_T | None]],
+        cacheable: Callable[[_T], bool],
+    ) -> _T | None:
+        """Return the validated config item, validating it if it changed.
+
+        Items without a unique id, or with a unique id that was already seen in
+        this pass, are always validated. Only results accepted by cacheable are
+        remembered.
+        """
+        if unique_id is None or unique_id in self._seen:
+            return await validate()
+        self._seen.add(unique_id)
+        if (item := self._items.get(unique_id)) is not None and item[0] == config:
+            return item[1]
+        result = await validate()
+        if result is not None and cacheable(result):
+            # Copy the config as callers may modify it in place before the next pass
+            self._items[unique_id] = (deepcopy(config), result)
+        else:
+            self._items.pop(unique_id, None)
+        return result
+
+    @callback
+    def async_clear(self) -> None:
+        """Forget all items so they are validated again."""
+        self._items.clear()
+
+    @callback
+    def async_finish(self) -> None:
+        """Finish a validation pass and forget items that are gone."""
+        for unique_id in self._items.keys() - self._seen:
+            del self._items[unique_id]
+        self._seen = set()
+
+
+@callback
+def _entity_registry_changed_filter(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Filter entity registry events which can change a validation result."""
+    return event_data["action"] == "remove" or (
+        event_data["action"] == "update" and "entity_id" in event_data["changes"]
+    )
+
+
+@callback
+def _device_registry_changed_filter(
+    event_data: dr.EventDeviceRegistryUpdatedData,
+) -> bool:
+    """Filter device registry events which can change a validation result."""
+    return event_data["action"] != "create"
+
+
+@callback
+def async_get_config_item_cache(
+    hass: HomeAssistant, domain: str
+) -> ConfigItemCache[Any]:
+    """Return the config item cache for a domain."""
+    if (caches := hass.data.get(DATA_CONFIG_ITEM_CACHES)) is None:
+        caches = hass.data[DATA_CONFIG_ITEM_CACHES] = {}
+
+        @callback
+        def _async_clear_caches(_: Event[Any]) -> None:
+            """Clear all config item caches."""
+            for cache in caches.values():
+                cache.async_clear()
+
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _async_clear_caches,
+            event_filter=_entity_registry_changed_filter,
+        )
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            _async_clear_caches,
+            event_filter=_device_registry_changed_filter,
+        )
+    if (cache := caches.get(domain)) is None:
+        cache = caches[domain] = ConfigItemCache()
+    return cache
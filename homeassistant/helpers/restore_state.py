@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
@@ -15,9 +16,9 @@ from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import json_loads
 
 from . import start
-from .entity import Entity
+from .entity import Entity, StateWrite
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -34,6 +35,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between dumps that encode all states again instead of only the
+# states of entities that changed since the previous dump
+FULL_DUMP_INTERVAL = timedelta(hours=6)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -107,6 +112,19 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
     return RestoreStateData(hass)
 
 
+def _encode_stored_state(stored_state: dict[str, Any]) -> Any:
+    """Encode a stored state so it is not encoded again when saving."""
+    return json_fragment(json_bytes(stored_state))
+
+
+def _encode_stored_states(stored_states: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Encode the stored states of a full dump."""
+    return {
+        entity_id: _encode_stored_state(stored_state)
+        for entity_id, stored_state in stored_states.items()
+    }
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -123,6 +141,14 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Encoded stored states of the previous dump and the entities that
+        # changed since, so a dump only encodes the states that changed
+        self._encoded_states: dict[str, Any] = {}
+        self._changed_entity_ids: set[str] = set()
+        self._last_full_dump: datetime | None = None
+        # A full dump replaces the encoded states after encoding them in the
+        # executor, so dumps must not overlap
+        self._dump_lock = asyncio.Lock()
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -198,18 +224,87 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
-        _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime, expiration_time: datetime
+    ) -> StoredState | None:
+        """Return the state of an entity which should be stored, if any."""
+        state = self.hass.states.get(entity_id)
+        if state is not None and not state.attributes.get(ATTR_RESTORED):
+            # Entities currently backed by an entity object
+            if (entity := self.entities.get(entity_id)) is None:
+                return None
+            return StoredState(state, entity.extra_restore_state_data, now)
+        if (
+            last_state := self.last_states.get(entity_id)
+        ) is None or last_state.last_seen < expiration_time:
+            # Don't save old states that have expired
+            return None
+        return last_state
+
+    async def _async_encode_stored_states(self, incremental: bool) -> list[Any]:
+        """Encode the states which should be stored.
+
+        An incremental dump only encodes the states of the entities that
+        changed since the previous dump, the encoded states of the other
+        entities are reused. A full dump encodes all states again in the
+        executor, which also expires old states and refreshes when entities
+        were last seen.
+        """
+        now = dt_util.utcnow()
+        expiration_time = now - STATE_EXPIRATION
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+        if (
+            incremental
+            and self._last_full_dump is not None
+            and now - self._last_full_dump <= FULL_DUMP_INTERVAL
+        ):
+            encoded_states = self._encoded_states
+            for entity_id in changed_entity_ids:
+                if (
+                    stored_state := self._async_get_stored_state(
+                        entity_id, now, expiration_time
+                    )
+                ) is None:
+                    encoded_states.pop(entity_id, None)
+                else:
+                    encoded_states[entity_id] = _encode_stored_state(
+                        stored_state.as_dict()
+                    )
+            return list(encoded_states.values())
+
+        self._last_full_dump = now
+        # Most restore entities also have a state from the previous run
+        stored_states = {
+            entity_id: stored_state.as_dict()
+            for entity_id in dict.fromkeys((*self.entities, *self.last_states))
+            if (
+                stored_state := self._async_get_stored_state(
+                    entity_id, now, expiration_time
+                )
             )
-        except HomeAssistantError as exc:
-            _LOGGER.error("Error saving current states", exc_info=exc)
+            is not None
+        }
+        self._encoded_states = await self.hass.async_add_executor_job(
+            _encode_stored_states, stored_states
+        )
+        return list(self._encoded_states.values())
+
+    async def async_dump_states(self, incremental: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        An incremental dump only encodes the states of entities that
+        changed since the previous dump.
+        """
+        _LOGGER.debug("Dumping states")
+        async with self._dump_lock:
+            try:
+                await self.store.async_save(
+                    await self._async_encode_stored_states(incremental)
+                )
+            except HomeAssistantError as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -218,6 +313,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_states(incremental=True)
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -228,7 +326,7 @@ class RestoreStateData:
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
@@ -246,6 +344,12 @@ class RestoreStateData:
     def async_restore_entity_added(self, entity: RestoreEntity) -> None:
         """Store this entity's state when hass is shutdown."""
         self.entities[entity.entity_id] = entity
+        self._changed_entity_ids.add(entity.entity_id)
+
+    @callback
+    def async_restore_entity_changed(self, entity_id: str) -> None:
+        """Encode this entity's state again at the next dump."""
+        self._changed_entity_ids.add(entity_id)
 
     @callback
     def async_restore_entity_removed(
@@ -266,23 +370,38 @@ class RestoreStateData:
             )
 
         del self.entities[entity_id]
+        self._changed_entity_ids.add(entity_id)
 
 
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
+    # Set when the entity is added to hass
+    _restore_state_data: RestoreStateData | None = None
+
     async def async_internal_added_to_hass(self) -> None:
         """Register this entity as a restorable entity."""
         await super().async_internal_added_to_hass()
-        async_get(self.hass).async_restore_entity_added(self)
+        self._restore_state_data = async_get(self.hass)
+        self._restore_state_data.async_restore_entity_added(self)
 
     async def async_internal_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
-        async_get(self.hass).async_restore_entity_removed(
-            self.entity_id, self.extra_restore_state_data
-        )
+        if self._restore_state_data is not None:
+            self._restore_state_data.async_restore_entity_removed(
+                self.entity_id, self.extra_restore_state_data
+            )
         await super().async_internal_will_remove_from_hass()
 
+    @callback
+    def _async_prepare_state_write(self) -> StateWrite | None:
+        """Calculate the state to write and mark the entity as changed."""
+        if (
+            state_write := super()._async_prepare_state_write()
+        ) is not None and self._restore_state_data is not None:
+            self._restore_state_data.async_restore_entity_changed(self.entity_id)
+        return state_write
+
     @callback
     def _async_get_restored_data(self) -> StoredState | None:
         """Get data stored for an entity, if any."""
@@ -6,12 +6,16 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
+from functools import partial
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from propcache import cached_property
 
@@ -32,8 +36,10 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.executor import EXECUTOR_POOL_IO, JobPriority
+from homeassistant.util.file import WriteError, fsync_directory, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -49,6 +55,51 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the store file once it grows beyond
+# this share of the size of the store file
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_MIN_COMPACT_SIZE = 64 * 1024
+
+SIDECAR_SUFFIX = ".marshal"
+SIDECAR_VERSION = 1
+
+
+@dataclass(slots=True)
+class StoreWriteStat:
+    """Write statistics of a store.
+
+    The latency of a write is the time from queueing the write until
+    it is durable, which includes waiting for the other writes of its
+    batch.
+    """
+
+    count: int = 0
+    bytes: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {
+            "count": self.count,
+            "bytes": self.bytes,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class _StoreWrite(NamedTuple):
+    """The result of writing a store to disk."""
+
+    size: int
+    # The directory that has to be synced for the write to be durable
+    sync_directory: str | None
+
+
+type _JournalValue = bytes | list[bytes]
+type _JournalSnapshot = dict[str, _JournalValue] | _JournalValue
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -90,6 +141,62 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+def _load_sidecar(path: str) -> Any:
+    """Load the marshal copy of a store file if it matches the store file."""
+    try:
+        with open(f"{path}{SIDECAR_SUFFIX}", "rb") as sidecar_file:
+            version, marshal_version, digest, payload = marshal.load(sidecar_file)
+        with open(path, "rb") as store_file:
+            json_data = store_file.read()
+        if (
+            version != SIDECAR_VERSION
+            or marshal_version != marshal.version
+            or hashlib.sha256(json_data).digest() != digest
+        ):
+            _LOGGER.debug("Ignoring outdated fast load file for %s", path)
+            return None
+        return marshal.loads(payload)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as err:
+        _LOGGER.debug("Ignoring invalid fast load file for %s: %s", path, err)
+        return None
+
+
+def _load_store_file(path: str) -> json_util.JsonValueType:
+    """Load a store file, preferring its marshal copy."""
+    if (data := _load_sidecar(path)) is not None:
+        return data
+    return json_util.load_json(path)
+
+
+def _write_sidecar(path: str, json_data: bytes | str, private: bool) -> None:
+    """Write a marshal copy of a store file that loads faster than JSON.
+
+    The copy is built from the JSON that was written to the store file and
+    records its hash so it is ignored once the store file is written
+    without it.
+    """
+    if isinstance(json_data, str):
+        json_data = json_data.encode()
+    try:
+        write_utf8_file(
+            f"{path}{SIDECAR_SUFFIX}",
+            marshal.dumps(
+                (
+                    SIDECAR_VERSION,
+                    marshal.version,
+                    hashlib.sha256(json_data).digest(),
+                    marshal.dumps(json_util.json_loads(json_data)),
+                )
+            ),
+            private,
+            mode="wb",
+        )
+    except (OSError, ValueError, WriteError) as err:
+        _LOGGER.debug("Unable to write fast load file for %s: %s", path, err)
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -103,6 +210,105 @@ def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     return hass.data[STORAGE_MANAGER]
 
 
+@callback
+def async_get_store_write_stats(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the write statistics of each store key."""
+    if (manager := hass.data.get(STORAGE_MANAGER)) is None:
+        return {}
+    return {key: stat.as_dict() for key, stat in manager.writer.stats.items()}
+
+
+def _fsync_directories(directories: Iterable[str]) -> None:
+    """Sync the directories of the atomic writes of a batch."""
+    for directory in directories:
+        try:
+            fsync_directory(directory)
+        except OSError as err:
+            _LOGGER.warning("Unable to sync directory %s: %s", directory, err)
+
+
+type _PendingStoreWrite = tuple[
+    str, asyncio.Future[_StoreWrite], asyncio.Future[None], float
+]
+
+
+class _StoreWriter:
+    """Write stores in parallel and group their durability barriers.
+
+    Each write starts in the io executor pool as soon as it is queued
+    and writes queued in the same event loop iteration form a batch.
+    Atomic writes skip syncing their directory and each directory is
+    synced once after all writes of the batch finished, before any of
+    them is reported done.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store writer."""
+        self._hass = hass
+        self._pending: list[_PendingStoreWrite] = []
+        self.stats: dict[str, StoreWriteStat] = {}
+
+    async def async_write(self, key: str, job: Callable[[], _StoreWrite]) -> None:
+        """Start a write and wait until it is durable."""
+        hass = self._hass
+        loop = hass.loop
+        if not self._pending:
+            loop.call_soon(self._async_finish_pending)
+        write = hass.async_add_executor_job(
+            job, priority=JobPriority.BACKGROUND, pool=EXECUTOR_POOL_IO
+        )
+        done: asyncio.Future[None] = loop.create_future()
+        self._pending.append((key, write, done, loop.time()))
+        await done
+
+    @callback
+    def _async_finish_pending(self) -> None:
+        """Finish the started writes as a batch."""
+        batch = self._pending
+        self._pending = []
+        self._hass.async_create_task_internal(
+            self._async_finish_batch(batch), "store write batch", eager_start=True
+        )
+
+    async def _async_finish_batch(self, batch: list[_PendingStoreWrite]) -> None:
+        """Wait for the writes of a batch and sync their directories."""
+        hass = self._hass
+        try:
+            results = await asyncio.gather(
+                *(write for _, write, _, _ in batch), return_exceptions=True
+            )
+            if directories := {
+                result.sync_directory
+                for result in results
+                if isinstance(result, _StoreWrite) and result.sync_directory
+            }:
+                await hass.async_add_executor_job(
+                    _fsync_directories,
+                    directories,
+                    priority=JobPriority.BACKGROUND,
+                    pool=EXECUTOR_POOL_IO,
+                )
+        except BaseException:
+            for _, _, done, _ in batch:
+                done.cancel()
+            raise
+        now = hass.loop.time()
+        for (key, _, done, queued), result in zip(batch, results, strict=True):
+            if done.done():
+                continue
+            if isinstance(result, BaseException):
+                done.set_exception(result)
+                continue
+            if (stat := self.stats.get(key)) is None:
+                stat = self.stats[key] = StoreWriteStat()
+            latency = now - queued
+            stat.count += 1
+            stat.bytes += result.size
+            stat.total += latency
+            stat.max = max(latency, stat.max)
+            done.set_result(None)
+
+
 class _StoreManager:
     """Class to help storing data.
 
@@ -117,6 +323,7 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self.writer = _StoreWriter(hass)
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -217,7 +424,7 @@ class _StoreManager:
             storage_file: Path = storage_path.joinpath(key)
             try:
                 if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
+                    data_preload[key] = _load_store_file(str(storage_file))
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
 
@@ -227,6 +434,218 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _journal_encode(value: Any) -> _JournalValue:
+    """Encode a value or the items of a list for the journal."""
+    if isinstance(value, list):
+        return [json_helper.json_bytes(item) for item in value]
+    return json_helper.json_bytes(value)
+
+
+def _journal_fragment(value: _JournalValue) -> Any:
+    """Return an encoded value as a JSON fragment."""
+    if isinstance(value, list):
+        return [json_helper.json_fragment(item) for item in value]
+    return json_helper.json_fragment(value)
+
+
+def _journal_snapshot(data: Any) -> _JournalSnapshot:
+    """Encode the data of a store so it can be compared to a later version."""
+    if isinstance(data, dict):
+        return {key: _journal_encode(value) for key, value in data.items()}
+    return _journal_encode(data)
+
+
+def _journal_diff_value(
+    old: _JournalValue, new: _JournalValue, path: list[str]
+) -> list[list[Any]]:
+    """Return the journal operations to change an encoded value."""
+    if old == new:
+        return []
+    if not isinstance(old, list) or not isinstance(new, list):
+        return [["set", path, _journal_fragment(new)]]
+    # Replace the range between the common prefix and suffix
+    start = 0
+    shortest = min(len(old), len(new))
+    while start < shortest and old[start] == new[start]:
+        start += 1
+    end = 0
+    while end < shortest - start and old[-end - 1] == new[-end - 1]:
+        end += 1
+    return [
+        [
+            "splice",
+            path,
+            start,
+            len(old) - end,
+            _journal_fragment(new[start : len(new) - end]),
+        ]
+    ]
+
+
+def _journal_diff(old: _JournalSnapshot, new: _JournalSnapshot) -> list[list[Any]]:
+    """Return the journal operations to change the data of a store."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return _journal_diff_value(old, new, [])  # type: ignore[arg-type]
+    operations: list[list[Any]] = [["delete", [key]] for key in old if key not in new]
+    for key, value in new.items():
+        if key not in old:
+            operations.append(["set", [key], _journal_fragment(value)])
+        else:
+            operations.extend(_journal_diff_value(old[key], value, [key]))
+    return operations
+
+
+def _journal_apply(data: Any, operation: list[Any]) -> Any:
+    """Apply a journal operation to the data of a store."""
+    kind, path, *args = operation
+    if kind == "set":
+        if not path:
+            return args[0]
+        data[path[0]] = args[0]
+    elif kind == "delete":
+        del data[path[0]]
+    else:
+        start, end, items = args
+        (data[path[0]] if path else data)[start:end] = items
+    return data
+
+
+class _StoreJournal:
+    """Append the changes of a store to a journal and compact it.
+
+    The store file holds a compacted document that names the journal
+    generation it was written with and each line of the journal holds
+    the changes of a write. Lines of another generation were compacted
+    into the store file before a crash could remove the journal, and a
+    partial last line is the result of a crash during an append; both
+    are skipped when loading.
+    """
+
+    def __init__(self, private: bool, fast_load: bool) -> None:
+        """Initialize the journal."""
+        self._private = private
+        self._fast_load = fast_load
+        self._generation: str | None = None
+        self._header: tuple[int, int] | None = None
+        self._snapshot: _JournalSnapshot | None = None
+        self._store_size = 0
+        self._journal_size = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Return if the journal holds changes that are not compacted."""
+        return bool(self._journal_size)
+
+    @staticmethod
+    def load(path: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal to the data loaded from the store file."""
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        try:
+            with open(journal_path, "rb") as journal_file:
+                lines = journal_file.readlines()
+        except FileNotFoundError:
+            return data
+        generation = data["journal"]
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                _LOGGER.warning("Ignoring incomplete record in %s", journal_path)
+                break
+            if record["generation"] != generation:
+                continue
+            changes: list[list[Any]] = record["changes"]  # type: ignore[assignment]
+            for operation in changes:
+                data["data"] = _journal_apply(data["data"], operation)
+        return data
+
+    def write(self, path: str, data: dict[str, Any]) -> _StoreWrite:
+        """Append the changes since the last write or compact the journal.
+
+        The first write of a run always compacts as the journal does
+        not know what the store file holds until it wrote it.
+        """
+        header = (data["version"], data["minor_version"])
+        try:
+            snapshot = _journal_snapshot(data["data"])
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}: {err}"
+            ) from err
+        if self._snapshot is None or header != self._header:
+            return self._compact(path, data, snapshot)
+        if not (changes := _journal_diff(self._snapshot, snapshot)):
+            return _StoreWrite(0, None)
+        line = (
+            json_helper.json_bytes({"generation": self._generation, "changes": changes})
+            + b"\n"
+        )
+        if self._journal_size + len(line) > max(
+            JOURNAL_MIN_COMPACT_SIZE, self._store_size * JOURNAL_COMPACT_RATIO
+        ):
+            return self._compact(path, data, snapshot)
+        _LOGGER.debug("Appending changes for %s to the journal", data["key"])
+        try:
+            fd = os.open(
+                f"{path}{JOURNAL_SUFFIX}",
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "wb") as journal_file:
+                journal_file.write(line)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+        except OSError as err:
+            raise WriteError(err) from err
+        # Creating the journal adds it to the directory
+        created = not self._journal_size
+        self._journal_size += len(line)
+        self._snapshot = snapshot
+        return _StoreWrite(len(line), os.path.dirname(path) if created else None)
+
+    def compact(self, path: str, key: str) -> _StoreWrite:
+        """Compact the changes in the journal into the store file."""
+        if not self._journal_size or self._snapshot is None or self._header is None:
+            return _StoreWrite(0, None)
+        version, minor_version = self._header
+        return self._compact(
+            path,
+            {"version": version, "minor_version": minor_version, "key": key},
+            self._snapshot,
+        )
+
+    def _compact(
+        self, path: str, data: dict[str, Any], snapshot: _JournalSnapshot
+    ) -> _StoreWrite:
+        """Write the data to the store file and remove the journal."""
+        generation = ulid_now()
+        _LOGGER.debug("Compacting journal for %s", data["key"])
+        document = {
+            "version": data["version"],
+            "minor_version": data["minor_version"],
+            "key": data["key"],
+            "journal": generation,
+            "data": (
+                {key: _journal_fragment(value) for key, value in snapshot.items()}
+                if isinstance(snapshot, dict)
+                else _journal_fragment(snapshot)
+            ),
+        }
+        json_data = json_helper.save_json(
+            path, document, self._private, atomic_writes=True, sync_directory=False
+        )
+        if self._fast_load:
+            _write_sidecar(path, json_data, self._private)
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+        self._generation = generation
+        self._header = (data["version"], data["minor_version"])
+        self._snapshot = snapshot
+        self._store_size = os.path.getsize(path)
+        self._journal_size = 0
+        return _StoreWrite(self._store_size, os.path.dirname(path))
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -242,8 +661,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
+        fast_load: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changes of each write to a journal
+        next to the store file and compacts it once it grows too large.
+
+        A fast load store also writes a marshal copy of the store file
+        which is loaded instead of the JSON while it matches the file.
+        """
+        if (journal or fast_load) and encoder not in (None, json_helper.JSONEncoder):
+            raise ValueError("Journaled and fast load stores need the JSON encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +689,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._fast_load = fast_load
+        self._journal = _StoreJournal(private, fast_load) if journal else None
 
     @cached_property
     def path(self):
@@ -329,7 +761,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    _load_store_file, self.path, pool=EXECUTOR_POOL_IO
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -388,6 +820,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if "journal" in data:
+            if self._journal is None and await self.hass.async_add_executor_job(
+                os.path.exists, f"{self.path}{JOURNAL_SUFFIX}", pool=EXECUTOR_POOL_IO
+            ):
+                _LOGGER.warning(
+                    "Storage for %s was written with a journal; applying the "
+                    "journal although the store is not journaled",
+                    self.key,
+                )
+            data = await self.hass.async_add_executor_job(
+                _StoreJournal.load, self.path, data, pool=EXECUTOR_POOL_IO
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -516,9 +961,28 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         await self._async_handle_write_data()
 
     async def _async_callback_final_write(self, _event: Event) -> None:
-        """Handle a write because Home Assistant is in final write state."""
+        """Handle a write because Home Assistant is in final write state.
+
+        A journaled store is compacted so a clean stop leaves a complete
+        store file.
+        """
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journal is not None:
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Compact the journal into the store file."""
+        assert self._journal is not None
+        async with self._write_lock:
+            if not self._journal.has_changes:
+                return
+            try:
+                await self._manager.writer.async_write(
+                    self.key, partial(self._journal.compact, self.path, self.key)
+                )
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -542,23 +1006,41 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.has_changes:
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self._manager.writer.async_write(
+            self.key, partial(self._write_data, path, data)
+        )
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+    def _write_data(self, path: str, data: dict) -> _StoreWrite:
+        """Write the data.
+
+        Atomic writes leave syncing the directory to the store writer.
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal is not None:
+            return self._journal.write(path, data)
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
+        json_data = json_helper.save_json(
             path,
             data,
             self._private,
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
+            sync_directory=False,
+        )
+        if self._fast_load:
+            _write_sidecar(path, json_data, self._private)
+        return _StoreWrite(
+            os.path.getsize(path), directory if self._atomic_writes else None
         )
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
@@ -570,6 +1052,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._manager.async_invalidate(self.key)
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        if self._journal is not None:
+            # The next write must compact as there is no store file to append to
+            self._journal = _StoreJournal(self._private, self._fast_load)
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        for suffix, enabled in (
+            (JOURNAL_SUFFIX, self._journal is not None),
+            (SIDECAR_SUFFIX, self._fast_load),
+        ):
+            if not enabled:
+                continue
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{suffix}"
+                )
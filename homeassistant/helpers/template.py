@@ -1361,7 +1361,8 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
     if not entry_name:
         return []
 
-    # first try if there are any config entries with a matching title
+    # first try if there are any config entries with a matching title, there
+    # is no index of config entries by title so this walks all config entries
     entities: list[str] = []
     ent_reg = entity_registry.async_get(hass)
     for entry in hass.config_entries.async_entries():
@@ -1376,13 +1377,9 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
 
     # fallback to just returning all entities for a domain
     # pylint: disable-next=import-outside-toplevel
-    from .entity import entity_sources
+    from .entity import async_integration_entity_ids
 
-    return [
-        entity_id
-        for entity_id, info in entity_sources(hass).items()
-        if info["domain"] == entry_name
-    ]
+    return async_integration_entity_ids(hass, entry_name)
 
 
 def config_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
@@ -1615,22 +1612,14 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
     if _area_id is None:
         return []
     ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
-    dev_reg = device_registry.async_get(hass)
     # We also need to add entities tied to a device in the area that don't themselves
     # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
+    return [
+        entry.entity_id
+        for entry in entity_registry.async_entries_for_area(
+            ent_reg, _area_id, include_device_area=True
+        )
+    ]
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -0,0 +1,150 @@
+"""Record a timeline of spans and export it as a Chrome trace."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TIMELINE: HassKey[Timeline] = HassKey("startup_timeline")
+
+TRACK_BOOTSTRAP = "bootstrap"
+
+
+@dataclass(slots=True, frozen=True)
+class Span:
+    """A named span of time on a track."""
+
+    name: str
+    track: str
+    start: float
+    end: float
+    args: dict[str, Any] | None = None
+
+
+class Timeline:
+    """Collect spans until the timeline is finished.
+
+    Spans may be added from executor threads; appending to
+    a list is atomic so no lock is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.origin = time.monotonic()
+        self.spans: list[Span] = []
+        self.finished: float | None = None
+
+    def add(
+        self,
+        name: str,
+        track: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span with monotonic start and end times."""
+        if self.finished is None:
+            self.spans.append(Span(name, track, start, end, args))
+
+    @contextmanager
+    def span(
+        self, name: str, track: str, args: dict[str, Any] | None = None
+    ) -> Generator[None]:
+        """Record the time spent inside the context manager."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, track, start, time.monotonic(), args)
+
+    def wrap_executor_job[*_Ts, _T](
+        self, name: str, track: str, target: Callable[[*_Ts], _T]
+    ) -> Callable[[*_Ts], _T]:
+        """Wrap a job that is about to be submitted to an executor.
+
+        The time between wrapping and the job starting in a worker is
+        recorded as a wait span and the time the job runs as a run span.
+        """
+        submitted = time.monotonic()
+
+        def _run_job(*args: *_Ts) -> _T:
+            started = time.monotonic()
+            try:
+                return target(*args)
+            finally:
+                ended = time.monotonic()
+                self.add(f"{name} (wait)", track, submitted, started)
+                self.add(
+                    f"{name} (run)",
+                    track,
+                    started,
+                    ended,
+                    {"wait": started - submitted, "run": ended - started},
+                )
+
+        return _run_job
+
+    def finish(self) -> None:
+        """Stop recording spans."""
+        if self.finished is None:
+            self.finished = time.monotonic()
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        The result can be loaded in chrome://tracing or Perfetto. Each
+        track is shown as a thread so integrations form a waterfall.
+        """
+        origin = self.origin
+        tids: dict[str, int] = {TRACK_BOOTSTRAP: 1}
+        events: list[dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            if (tid := tids.get(span.track)) is None:
+                tid = tids[span.track] = len(tids) + 1
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.track,
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((span.start - origin) * 1_000_000),
+                "dur": round((span.end - span.start) * 1_000_000),
+            }
+            if span.args:
+                event["args"] = span.args
+            events.append(event)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": track},
+            }
+            for track, tid in tids.items()
+        ]
+        return {"traceEvents": [*metadata, *events], "displayTimeUnit": "ms"}
+
+
+@callback
+def async_get_startup_timeline(hass: HomeAssistant) -> Timeline | None:
+    """Return the startup timeline if one is being recorded."""
+    return hass.data.get(DATA_STARTUP_TIMELINE)
+
+
+@contextmanager
+def async_startup_timeline_span(
+    hass: HomeAssistant, name: str, track: str, args: dict[str, Any] | None = None
+) -> Generator[None]:
+    """Record a span on the startup timeline if one is being recorded."""
+    if (timeline := hass.data.get(DATA_STARTUP_TIMELINE)) is None:
+        yield
+        return
+    with timeline.span(name, track, args):
+        yield
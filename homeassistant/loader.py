@@ -40,6 +40,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.timeline import DATA_STARTUP_TIMELINE
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -68,7 +69,6 @@ BASE_PRELOAD_PLATFORMS = [
     "backup",
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "hardware",
@@ -76,8 +76,6 @@ BASE_PRELOAD_PLATFORMS = [
     "logbook",
     "media_source",
     "recorder",
-    "repairs",
-    "system_health",
     "trigger",
 ]
 
@@ -133,6 +131,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_SNAPSHOT: HassKey[dict[str, IntegrationSnapshot]] = HassKey(
+    "integration_snapshot"
+)
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -264,6 +265,15 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class IntegrationSnapshot(TypedDict):
+    """Resolved state of a built-in integration."""
+
+    manifest: Manifest
+    top_level_files: list[str]
+    all_dependencies: list[str] | None
+    missing_platforms: list[str]
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -742,6 +752,26 @@ class Integration:
 
         return None
 
+    @classmethod
+    def from_snapshot(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        snapshot: IntegrationSnapshot,
+    ) -> Integration:
+        """Create an integration from a snapshot without doing I/O."""
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__path__[0]) / domain,
+            snapshot["manifest"],
+            set(snapshot["top_level_files"]),
+            None
+            if (all_dependencies := snapshot["all_dependencies"]) is None
+            else set(all_dependencies),
+        )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -749,6 +779,7 @@ class Integration:
         file_path: pathlib.Path,
         manifest: Manifest,
         top_level_files: set[str] | None = None,
+        all_dependencies: set[str] | None = None,
     ) -> None:
         """Initialize an integration."""
         self.hass = hass
@@ -758,9 +789,14 @@ class Integration:
         manifest["is_built_in"] = self.is_built_in
         manifest["overwrites_built_in"] = self.overwrites_built_in
 
-        if self.dependencies:
-            self._all_dependencies_resolved: bool | None = None
-            self._all_dependencies: set[str] | None = None
+        self._all_dependencies_resolved: bool | None
+        self._all_dependencies: set[str] | None
+        if all_dependencies is not None:
+            self._all_dependencies_resolved = True
+            self._all_dependencies = all_dependencies
+        elif self.dependencies:
+            self._all_dependencies_resolved = None
+            self._all_dependencies = None
         else:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
@@ -993,6 +1029,10 @@ class Integration:
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
 
+        timeline = self.hass.data.get(DATA_STARTUP_TIMELINE)
+        if timeline is not None:
+            timeline_start = time.monotonic()
+
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
         load_executor = self.import_executor and (
@@ -1001,6 +1041,14 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
+            if timeline is not None:
+                timeline.add(
+                    "import",
+                    domain,
+                    timeline_start,
+                    time.monotonic(),
+                    {"loaded_executor": False},
+                )
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
@@ -1010,10 +1058,13 @@ class Integration:
             return comp
 
         self._component_future = self.hass.loop.create_future()
+        get_component: Callable[[bool], ComponentProtocol] = self._get_component
+        if timeline is not None:
+            get_component = timeline.wrap_executor_job("import", domain, get_component)
         try:
             try:
                 comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
+                    get_component, True
                 )
             except ModuleNotFoundError:
                 raise
@@ -1037,6 +1088,15 @@ class Integration:
         finally:
             self._component_future = None
 
+        if timeline is not None:
+            timeline.add(
+                "import",
+                domain,
+                timeline_start,
+                time.monotonic(),
+                {"loaded_executor": load_executor},
+            )
+
         if debug:
             _LOGGER.debug(
                 "Component %s import took %.3f seconds (loaded_executor=%s)",
@@ -1204,6 +1264,31 @@ class Integration:
 
         return platforms
 
+    def as_snapshot(self) -> IntegrationSnapshot:
+        """Return a snapshot of the resolved integration.
+
+        Only platforms missing from the integration directory are
+        included as other missing platforms may have failed to import
+        because a requirement was not installed yet.
+        """
+        files = self._top_level_files
+        prefix = f"{self.domain}."
+        return {
+            "manifest": self.manifest,
+            "top_level_files": sorted(files),
+            "all_dependencies": sorted(self._all_dependencies)
+            if self._all_dependencies_resolved and self._all_dependencies is not None
+            else None,
+            "missing_platforms": sorted(
+                platform_name
+                for full_name in self._missing_platforms_cache
+                if full_name.startswith(prefix)
+                and (platform_name := full_name.removeprefix(prefix))
+                and f"{platform_name}.py" not in files
+                and platform_name not in files
+            ),
+        }
+
     def _get_platform_cached_or_raise(self, platform_name: str) -> ModuleType | None:
         """Return a platform for an integration from cache."""
         full_name = f"{self.domain}.{platform_name}"
@@ -1411,10 +1496,22 @@ async def async_get_integrations(
         if domain in needed:
             del needed[domain]
 
+    if not needed:
+        return results
+
+    from . import components  # pylint: disable=import-outside-toplevel
+
+    # Built-in integrations restored from a snapshot do not need
+    # to read their manifest from disk
+    if snapshot := hass.data.get(DATA_INTEGRATION_SNAPSHOT):
+        for domain in [domain for domain in needed if domain in snapshot]:
+            results[domain] = cache[domain] = Integration.from_snapshot(
+                hass, components, domain, snapshot.pop(domain)
+            )
+            needed.pop(domain).set_result(None)
+
     # Now the rest use resolve_from_root
     if needed:
-        from . import components  # pylint: disable=import-outside-toplevel
-
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
@@ -1435,6 +1532,34 @@ async def async_get_integrations(
     return results
 
 
+@callback
+def async_restore_integration_snapshot(
+    hass: HomeAssistant, snapshot: dict[str, IntegrationSnapshot]
+) -> None:
+    """Restore built-in integrations from a snapshot.
+
+    The integrations are created from the snapshot when they are first
+    requested instead of resolving them from disk.
+    """
+    hass.data[DATA_INTEGRATION_SNAPSHOT] = snapshot
+    missing_platforms = hass.data[DATA_MISSING_PLATFORMS]
+    for domain, integration_snapshot in snapshot.items():
+        for platform_name in integration_snapshot["missing_platforms"]:
+            missing_platforms[f"{domain}.{platform_name}"] = True
+
+
+@callback
+def async_get_integration_snapshot(
+    hass: HomeAssistant,
+) -> dict[str, IntegrationSnapshot]:
+    """Return a snapshot of the loaded built-in integrations."""
+    return {
+        domain: int_or_fut.as_snapshot()
+        for domain, int_or_fut in sorted(hass.data[DATA_INTEGRATIONS].items())
+        if type(int_or_fut) is Integration and int_or_fut.is_built_in
+    }
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable
+from contextlib import suppress
 import dataclasses
+import gc
+import importlib
 import logging
+import os
+import pathlib
+import signal
 import subprocess
+import sys
 import threading
 from time import monotonic
 import traceback
+from types import FrameType
 from typing import Any
 
 import packaging.tags
 
 from . import bootstrap
+from .const import RESTART_EXIT_CODE, Platform
 from .core import callback
 from .helpers.frame import warn_use
+from .loader import BASE_PRELOAD_PLATFORMS, PACKAGE_BUILTIN
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.thread import deadlock_safe_shutdown
 
@@ -32,6 +43,9 @@ from .util.thread import deadlock_safe_shutdown
 MAX_EXECUTOR_WORKERS = 64
 TASK_CANCELATION_TIMEOUT = 5
 
+# Signals the zygote forwards to its workers
+ZYGOTE_FORWARD_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -55,6 +69,10 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    compact_states: bool = False
+
+    trace_startup: bool = False
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
@@ -162,6 +180,105 @@ def run(runtime_config: RuntimeConfig) -> int:
             loop.close()
 
 
+def _preload_integrations(domains: Iterable[str]) -> None:
+    """Import integrations and their platforms before forking workers."""
+    for domain in domains:
+        try:
+            component = importlib.import_module(f"{PACKAGE_BUILTIN}.{domain}")
+        except ImportError as err:
+            _LOGGER.warning("Unable to preload integration %s: %s", domain, err)
+            continue
+        path = pathlib.Path(component.__path__[0])
+        for platform_name in (*Platform, *BASE_PRELOAD_PLATFORMS):
+            if (path / f"{platform_name}.py").exists():
+                with suppress(ImportError):
+                    importlib.import_module(f"{component.__name__}.{platform_name}")
+
+
+def _fork_worker(
+    config_dir: str,
+    worker: Callable[[str], int],
+    handlers: dict[signal.Signals, Any],
+) -> int:
+    """Fork a worker process and return its pid."""
+    if pid := os.fork():
+        return pid
+    exit_code = 1
+    try:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+        exit_code = worker(config_dir)
+    except SystemExit as err:
+        # Mirror how the interpreter turns the code of sys.exit into a status
+        if err.code is None:
+            exit_code = 0
+        elif isinstance(err.code, int):
+            exit_code = err.code
+        else:
+            print(err.code, file=sys.stderr)  # noqa: T201
+            exit_code = 1
+    except BaseException:  # noqa: BLE001
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)  # noqa: SLF001
+
+
+def run_zygote(
+    config_dirs: list[str],
+    preload_integrations: Iterable[str],
+    worker: Callable[[str], int],
+) -> int:
+    """Preload Home Assistant once and fork a worker per config directory.
+
+    The workers share the memory of the preloaded modules copy-on-write.
+    A worker that exits to restart is forked again from the zygote so
+    it does not have to import the preloaded modules again.
+    """
+    _enable_posix_spawn()
+    _preload_integrations(preload_integrations)
+    # Keep the collector of the workers from touching the preloaded
+    # objects, which would copy the pages they live on
+    gc.freeze()
+
+    workers: dict[int, str] = {}
+    stopping = False
+
+    def _forward_signal(signum: int, frame: FrameType | None) -> None:
+        """Forward a signal to the workers."""
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            with suppress(ProcessLookupError):
+                os.kill(pid, signum)
+
+    handlers = {
+        signum: signal.signal(signum, _forward_signal)
+        for signum in ZYGOTE_FORWARD_SIGNALS
+    }
+    for config_dir in config_dirs:
+        workers[_fork_worker(config_dir, worker, handlers)] = config_dir
+
+    exit_code = 0
+    while workers:
+        pid, status = os.wait()
+        if pid not in workers:
+            continue
+        config_dir = workers.pop(pid)
+        worker_exit_code = os.waitstatus_to_exitcode(status)
+        if worker_exit_code == RESTART_EXIT_CODE and not stopping:
+            _LOGGER.info("Restarting worker for %s", config_dir)
+            workers[_fork_worker(config_dir, worker, handlers)] = config_dir
+            continue
+        if worker_exit_code:
+            _LOGGER.error(
+                "Worker for %s exited with code %s", config_dir, worker_exit_code
+            )
+            exit_code = worker_exit_code
+    return exit_code
+
+
 def _cancel_all_tasks_with_timeout(
     loop: asyncio.AbstractEventLoop, timeout: int
 ) -> None:
@@ -7,10 +7,12 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import tempfile
 from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import config_validation as cv, storage
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -116,6 +118,71 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+async def _fire_events_with_listeners(hass, listen):
+    """Fire 10k events at 1k, 10k and 100k listeners registered with listen."""
+    total = 0.0
+    events_to_fire = 10**4
+    event_name = "benchmark_event"
+
+    for listener_count in (10**3, 10**4, 10**5):
+        count = 0
+
+        @core.callback
+        def listener(_):
+            """Handle event."""
+            nonlocal count
+            count += 1
+
+        unsubs = [
+            listen(event_name, f"light.kitchen{idx}", listener)
+            for idx in range(listener_count)
+        ]
+
+        start = timer()
+        for idx in range(events_to_fire):
+            hass.bus.async_fire(
+                event_name, {"entity_id": f"light.kitchen{idx % listener_count}"}
+            )
+        await hass.async_block_till_done()
+        runtime = timer() - start
+
+        assert count == events_to_fire
+        print(f"{listener_count} listeners: {runtime}s")
+        total += runtime
+
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
+@benchmark
+async def fire_events_filtered_listeners(hass):
+    """Fire 10k events at up to 100k listeners with an entity_id filter."""
+
+    def listen(event_name, entity_id, listener):
+        @core.callback
+        def event_filter(event_data):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        return hass.bus.async_listen(event_name, listener, event_filter=event_filter)
+
+    return await _fire_events_with_listeners(hass, listen)
+
+
+@benchmark
+async def fire_events_keyed_listeners(hass):
+    """Fire 10k events at up to 100k listeners keyed on entity_id."""
+
+    def listen(event_name, entity_id, listener):
+        return hass.bus.async_listen_keyed(
+            event_name, "entity_id", (entity_id,), listener
+        )
+
+    return await _fire_events_with_listeners(hass, listen)
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +375,120 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def validate_script_actions(hass):
+    """Validate a thousand scripts of typical actions."""
+    actions = [
+        {
+            "action": "light.turn_on",
+            "target": {"entity_id": "light.kitchen, light.living_room"},
+        },
+        {"delay": "00:00:05"},
+        {
+            "condition": "state",
+            "entity_id": ["binary_sensor.door", "binary_sensor.window"],
+            "state": "off",
+            "for": "00:01:00",
+        },
+        {"wait_template": "{{ is_state('light.kitchen', 'on') }}"},
+        {"event": "benchmark_event", "event_data": {"value": 1}},
+    ] * 10
+
+    start = timer()
+    for _ in range(10**3):
+        cv.SCRIPT_SCHEMA(actions)
+    return timer() - start
+
+
+async def _async_time_store_loads(hass, key, data):
+    """Time loading a store from JSON and from its fast load copy."""
+    runtimes = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for fast_load in (False, True):
+            store = storage.Store(hass, 1, key, fast_load=fast_load)
+            await store.async_save(data)
+            start = timer()
+            for _ in range(10):
+                await store.async_load()
+            runtimes[fast_load] = timer() - start
+            await store.async_remove()
+    print(f"Loading {key} ten times from JSON took {runtimes[False]}s")
+    return runtimes[True]
+
+
+@benchmark
+async def load_entity_registry(hass):
+    """Load an entity registry with 10000 entities ten times."""
+    entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "categories": {},
+            "capabilities": {"state_class": "measurement"},
+            "config_entry_id": f"{idx:026}",
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "device_class": None,
+            "device_id": f"{idx:032x}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.temperature_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"{idx:032x}",
+            "has_entity_name": True,
+            "labels": [],
+            "modified_at": "2024-01-01T00:00:00+00:00",
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "original_device_class": "temperature",
+            "original_icon": None,
+            "original_name": "Temperature",
+            "platform": "mqtt",
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": f"temperature_{idx}",
+            "previous_unique_id": None,
+            "unit_of_measurement": "°C",
+        }
+        for idx in range(10**4)
+    ]
+    return await _async_time_store_loads(
+        hass, "core.entity_registry", {"entities": entities, "deleted_entities": []}
+    )
+
+
+@benchmark
+async def load_device_registry(hass):
+    """Load a device registry with 2000 devices ten times."""
+    devices = [
+        {
+            "area_id": None,
+            "config_entries": [f"{idx:026}"],
+            "configuration_url": None,
+            "connections": [["mac", f"00:00:00:00:{idx // 256:02x}:{idx % 256:02x}"]],
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "disabled_by": None,
+            "entry_type": None,
+            "hw_version": None,
+            "id": f"{idx:032x}",
+            "identifiers": [["mqtt", f"device_{idx}"]],
+            "labels": [],
+            "manufacturer": "Manufacturer",
+            "model": "Model",
+            "model_id": None,
+            "modified_at": "2024-01-01T00:00:00+00:00",
+            "name_by_user": None,
+            "name": f"Device {idx}",
+            "primary_config_entry": f"{idx:026}",
+            "serial_number": None,
+            "sw_version": "1.0.0",
+            "via_device_id": None,
+        }
+        for idx in range(2 * 10**3)
+    ]
+    return await _async_time_store_loads(
+        hass, "core.device_registry", {"devices": devices, "deleted_devices": []}
+    )
@@ -31,6 +31,7 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.timeline import DATA_STARTUP_TIMELINE
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -709,8 +710,11 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        ended = time.monotonic()
+        time_taken = ended - started
         integration, group = running
+        if timeline := hass.data.get(DATA_STARTUP_TIMELINE):
+            timeline.add(phase, integration, started, ended, {"group": group})
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -770,8 +774,11 @@ def async_start_setup(
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        ended = time.monotonic()
+        time_taken = ended - started
         del setup_started[current]
+        if timeline := hass.data.get(DATA_STARTUP_TIMELINE):
+            timeline.add(phase, integration, started, ended, {"group": group})
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from collections import deque
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 import contextlib
+from enum import IntEnum
 import logging
+import multiprocessing
+import os
+import queue
 import sys
+import threading
 from threading import Thread
 import time
 import traceback
 from typing import Any
+import weakref
 
 from .thread import async_raise
 
@@ -21,6 +30,143 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+EXECUTOR_POOL_CPU = "cpu"
+EXECUTOR_POOL_IMPORT = "import"
+EXECUTOR_POOL_IO = "io"
+
+DEFAULT_EXECUTOR_POOL_SIZES: Mapping[str, int] = {
+    EXECUTOR_POOL_CPU: os.cpu_count() or 1,
+    # Importing is not thread safe, see async_add_import_executor_job
+    EXECUTOR_POOL_IMPORT: 1,
+    EXECUTOR_POOL_IO: 8,
+}
+
+DEFAULT_PROCESS_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+# Jobs of a single integration that may be queued or running at once
+# unless the integration has its own quota
+DEFAULT_INTEGRATION_QUOTA = 16
+
+# Queued jobs are started after higher priority jobs passed them over this often
+MAX_PRIORITY_SKIPS = 8
+
+
+class JobPriority(IntEnum):
+    """Priority class of a job run in an executor.
+
+    When all workers of an executor are busy, queued jobs are started
+    in priority order and in submission order within a priority. A
+    queued job that was passed over MAX_PRIORITY_SKIPS times by higher
+    priority jobs is started next, so lower priorities are never starved.
+    """
+
+    INTERACTIVE = 0
+    AUTOMATION = 1
+    POLLING = 2
+    BACKGROUND = 3
+
+
+# Jobs submitted without a priority are assumed to be triggered by
+# an automation or an integration reacting to an event.
+DEFAULT_JOB_PRIORITY = JobPriority.AUTOMATION
+
+_submit_priority = threading.local()
+
+_EXECUTORS: weakref.WeakSet[InterruptibleThreadPoolExecutor] = weakref.WeakSet()
+
+
+@contextlib.contextmanager
+def executor_job_priority(priority: JobPriority) -> Generator[None]:
+    """Submit jobs with the given priority from the current thread."""
+    previous = getattr(_submit_priority, "value", DEFAULT_JOB_PRIORITY)
+    _submit_priority.value = priority
+    try:
+        yield
+    finally:
+        _submit_priority.value = previous
+
+
+def get_executor_stats() -> dict[str, dict[str, Any]]:
+    """Return how busy each executor is."""
+    return {
+        executor.name: executor.stats()
+        for executor in sorted(_EXECUTORS, key=lambda executor: executor.name)
+    }
+
+
+class _PriorityWorkQueue:
+    """Work queue of a thread pool that hands out work items by priority.
+
+    The None sentinel used to wake up the workers at shutdown is handed out
+    after all work items so queued work is not abandoned.
+    """
+
+    __slots__ = ("_not_empty", "_queues", "_sentinels", "_skips")
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._not_empty = threading.Condition(threading.Lock())
+        self._queues: tuple[deque[Any], ...] = tuple(deque() for _ in JobPriority)
+        # How often the oldest work item of each priority was passed over
+        self._skips = [0] * len(JobPriority)
+        self._sentinels = 0
+
+    def put(self, item: Any) -> None:
+        """Add a work item with the priority of the submitting thread."""
+        with self._not_empty:
+            if item is None:
+                self._sentinels += 1
+            else:
+                self._queues[
+                    getattr(_submit_priority, "value", DEFAULT_JOB_PRIORITY)
+                ].append(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True) -> Any:
+        """Remove and return the work item with the highest priority."""
+        with self._not_empty:
+            while True:
+                if (priority := self._next_priority()) is not None:
+                    self._skips[priority] = 0
+                    return self._queues[priority].popleft()
+                if self._sentinels:
+                    self._sentinels -= 1
+                    return None
+                if not block:
+                    raise queue.Empty
+                self._not_empty.wait()
+
+    def _next_priority(self) -> int | None:
+        """Return the priority to hand out the next work item from.
+
+        Must be called with the lock held.
+        """
+        next_priority: int | None = None
+        starving: int | None = None
+        skips = self._skips
+        for priority, work_items in enumerate(self._queues):
+            if not work_items:
+                continue
+            if next_priority is None:
+                next_priority = priority
+                continue
+            skips[priority] += 1
+            if starving is None and skips[priority] > MAX_PRIORITY_SKIPS:
+                starving = priority
+        return next_priority if starving is None else starving
+
+    def get_nowait(self) -> Any:
+        """Remove and return a work item without blocking."""
+        return self.get(block=False)
+
+    def depths(self) -> dict[str, int]:
+        """Return the number of queued work items per priority."""
+        with self._not_empty:
+            return {
+                priority.name.lower(): len(self._queues[priority])
+                for priority in JobPriority
+            }
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -61,7 +207,68 @@ def join_or_interrupt_threads(
 
 
 class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
-    """A ThreadPoolExecutor instance that will not deadlock on shutdown."""
+    """A ThreadPoolExecutor instance that will not deadlock on shutdown.
+
+    Queued jobs are started by priority, see executor_job_priority.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the executor."""
+        super().__init__(*args, **kwargs)
+        self._work_queue = _PriorityWorkQueue()  # type: ignore[assignment]
+        self._stats_lock = threading.Lock()
+        # Number of submitted jobs that are queued or running
+        self._pending = 0
+        # Number of jobs that were submitted while all workers were busy
+        self._saturated = 0
+        _EXECUTORS.add(self)
+
+    def submit[**_P, _T](
+        self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> Future[_T]:
+        """Submit a job and keep track of how busy the executor is."""
+        future = super().submit(fn, *args, **kwargs)
+        with self._stats_lock:
+            if self._pending >= self._max_workers:
+                self._saturated += 1
+            self._pending += 1
+        future.add_done_callback(self._job_done)
+        return future
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Change the number of workers.
+
+        Threads are started on demand, so fewer workers only take effect
+        once the executor has fewer threads than that.
+        """
+        self._max_workers = max_workers
+
+    def _job_done(self, future: Future[Any]) -> None:
+        """Account for a finished or cancelled job."""
+        with self._stats_lock:
+            self._pending -= 1
+
+    @property
+    def name(self) -> str:
+        """Return the name of the executor."""
+        return self._thread_name_prefix or ""
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of queued jobs per priority."""
+        return self._work_queue.depths()  # type: ignore[attr-defined,no-any-return]
+
+    def stats(self) -> dict[str, Any]:
+        """Return how busy the executor is."""
+        queue_depths = self.queue_depths()
+        queued = sum(queue_depths.values())
+        return {
+            "max_workers": self._max_workers,
+            "threads": len(self._threads),
+            "running": max(self._pending - queued, 0),
+            "queued": queued,
+            "queue_depths": queue_depths,
+            "saturated": self._saturated,
+        }
 
     def shutdown(
         self, *args: Any, join_threads_or_timeout: bool = True, **kwargs: Any
@@ -76,11 +283,16 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
         if join_threads_or_timeout:
             self.join_threads_or_timeout()
 
-    def join_threads_or_timeout(self) -> None:
-        """Join threads or timeout."""
+    def join_threads_or_timeout(self, timeout: float | None = None) -> None:
+        """Join threads or timeout.
+
+        If timeout is None, EXECUTOR_SHUTDOWN_TIMEOUT is used.
+        """
         remaining_threads = set(self._threads)
         start_time = time.monotonic()
-        timeout_remaining: float = EXECUTOR_SHUTDOWN_TIMEOUT
+        if timeout is None:
+            timeout = EXECUTOR_SHUTDOWN_TIMEOUT
+        timeout_remaining: float = timeout
         attempt = 0
 
         while True:
@@ -95,8 +307,148 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
                 attempt <= MAX_LOG_ATTEMPTS,
             )
 
-            timeout_remaining = EXECUTOR_SHUTDOWN_TIMEOUT - (
-                time.monotonic() - start_time
-            )
+            timeout_remaining = timeout - (time.monotonic() - start_time)
             if timeout_remaining <= 0:
                 return
+
+
+class ExecutorPools:
+    """Named executor pools that keep workloads from starving each other.
+
+    Each pool is created with its own threads the first time it is used.
+    Each integration has a quota of jobs it may have queued or running at
+    the same time. Jobs over the quota wait in the event loop instead of
+    occupying the pools.
+
+    CPU bound work runs in a pool of worker processes so it does not
+    hold the GIL of the Home Assistant process.
+    """
+
+    __slots__ = (
+        "_sizes",
+        "_pools",
+        "_process_pool",
+        "process_pool_size",
+        "_lock",
+        "integration_quota",
+        "_quotas",
+        "_quota_semaphores",
+    )
+
+    def __init__(
+        self,
+        sizes: Mapping[str, int] = DEFAULT_EXECUTOR_POOL_SIZES,
+        process_pool_size: int = DEFAULT_PROCESS_POOL_SIZE,
+        integration_quota: int | None = DEFAULT_INTEGRATION_QUOTA,
+    ) -> None:
+        """Initialize the pools."""
+        self._sizes = dict(sizes)
+        self._pools: dict[str, InterruptibleThreadPoolExecutor] = {}
+        self._process_pool: ProcessPoolExecutor | None = None
+        # If zero, process jobs run in the cpu pool instead
+        self.process_pool_size = process_pool_size
+        # The pools are created lazily from the event loop and from threads
+        self._lock = threading.Lock()
+        # If None, integrations without their own quota are not limited
+        self.integration_quota = integration_quota
+        self._quotas: dict[str, int] = {}
+        self._quota_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def add_pool(self, name: str, max_workers: int) -> None:
+        """Add a pool."""
+        if name in self._sizes:
+            raise ValueError(f"Executor pool {name} already exists")
+        self._sizes[name] = max_workers
+
+    def set_size(self, name: str, max_workers: int) -> None:
+        """Set the number of workers of a pool.
+
+        The import pool can not be resized, importing is not thread safe.
+        """
+        if name == EXECUTOR_POOL_IMPORT:
+            raise ValueError(f"Executor pool {name} can not be resized")
+        if name not in self._sizes:
+            raise ValueError(f"Unknown executor pool {name}")
+        self._sizes[name] = max_workers
+        if (pool := self._pools.get(name)) is not None:
+            pool.set_max_workers(max_workers)
+
+    def get(self, name: str) -> InterruptibleThreadPoolExecutor:
+        """Return a pool, creating it if needed."""
+        if (pool := self._pools.get(name)) is not None:
+            return pool
+        if (max_workers := self._sizes.get(name)) is None:
+            raise ValueError(f"Unknown executor pool {name}")
+        with self._lock:
+            if (pool := self._pools.get(name)) is None:
+                pool = self._pools[name] = InterruptibleThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f"{name.title()}Executor",
+                )
+        return pool
+
+    def get_process_pool(self) -> Executor:
+        """Return the process pool, creating it if needed.
+
+        Jobs submitted to the process pool must be module level functions
+        and their arguments and results must be picklable.
+        """
+        if (process_pool := self._process_pool) is not None:
+            return process_pool
+        if not self.process_pool_size:
+            return self.get(EXECUTOR_POOL_CPU)
+        with self._lock:
+            if (process_pool := self._process_pool) is None:
+                # Forking a process that runs threads is not safe, the
+                # forkserver starts the workers from a clean process.
+                process_pool = self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_pool_size,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                )
+        return process_pool
+
+    def async_set_quota(self, domain: str, limit: int | None) -> None:
+        """Set the number of jobs of an integration that may run at once.
+
+        If None, the integration uses the default quota again. Jobs that
+        already wait for or hold the previous quota are not affected.
+
+        This method must be run in the event loop.
+        """
+        if limit is None:
+            self._quotas.pop(domain, None)
+        else:
+            self._quotas[domain] = limit
+        self._quota_semaphores.pop(domain, None)
+
+    def async_get_quota(self, domain: str) -> asyncio.Semaphore | None:
+        """Return the semaphore that enforces the quota of an integration.
+
+        This method must be run in the event loop.
+        """
+        if (semaphore := self._quota_semaphores.get(domain)) is not None:
+            return semaphore
+        if (limit := self._quotas.get(domain, self.integration_quota)) is None:
+            return None
+        semaphore = self._quota_semaphores[domain] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return how busy each pool is."""
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self) -> None:
+        """Shutdown all pools.
+
+        All pools stop taking jobs first and their threads are then joined
+        against one deadline, so stopping does not wait EXECUTOR_SHUTDOWN_TIMEOUT
+        for each pool. Worker processes are not waited for.
+        """
+        pools = list(self._pools.values())
+        for pool in pools:
+            pool.shutdown(join_threads_or_timeout=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+        deadline = time.monotonic() + EXECUTOR_SHUTDOWN_TIMEOUT
+        for pool in pools:
+            pool.join_threads_or_timeout(max(deadline - time.monotonic(), 0))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 import tempfile
+from typing import IO, Any
 
 from atomicwrites import AtomicWriter
 
@@ -17,8 +18,30 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+class _DeferredSyncAtomicWriter(AtomicWriter):
+    """Atomic writer that leaves syncing the directory to the caller."""
+
+    def commit(self, f: IO[Any]) -> None:
+        """Rename the temporary file into place without syncing the directory."""
+        os.replace(f.name, self._path)  # type: ignore[attr-defined]
+
+
+def fsync_directory(path: str) -> None:
+    """Sync a directory so the files renamed into it are durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def write_utf8_file_atomic(
-    filename: str, utf8_data: bytes | str, private: bool = False, mode: str = "w"
+    filename: str,
+    utf8_data: bytes | str,
+    private: bool = False,
+    mode: str = "w",
+    *,
+    sync_directory: bool = True,
 ) -> None:
     """Write a file and rename it into place using atomicwrites.
 
@@ -31,9 +54,14 @@ def write_utf8_file_atomic(
 
     Using this function frequently will significantly
     negatively impact performance.
+
+    If sync_directory is False the rename is only durable once
+    the caller passed the directory to fsync_directory, which
+    allows syncing it once for many files.
     """
+    writer = AtomicWriter if sync_directory else _DeferredSyncAtomicWriter
     try:
-        with AtomicWriter(filename, mode=mode, overwrite=True).open() as fdesc:
+        with writer(filename, mode=mode, overwrite=True).open() as fdesc:
             if not private:
                 os.fchmod(fdesc.fileno(), 0o644)
             fdesc.write(utf8_data)
@@ -0,0 +1,119 @@
+"""Collect run time statistics for jobs and the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from dataclasses import dataclass
+import math
+from typing import Any
+
+# Upper bounds in seconds of the event loop lag histogram buckets
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, math.inf)
+
+DEFAULT_LOOP_LAG_INTERVAL = 0.5
+
+
+@dataclass(slots=True)
+class JobStat:
+    """Run time statistics of a single job."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the statistics."""
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class JobStats:
+    """Collect the time spent running jobs in the event loop.
+
+    Only the time a job blocks the event loop is recorded, which is the
+    whole run for callbacks and the time until the first await for
+    coroutines.
+    """
+
+    __slots__ = ("stats",)
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.stats: dict[str, JobStat] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        """Record a job run."""
+        if (stat := self.stats.get(name)) is None:
+            stat = self.stats[name] = JobStat()
+        stat.count += 1
+        stat.total += duration
+        stat.max = max(duration, stat.max)
+
+    def top(self, limit: int | None = None) -> list[tuple[str, JobStat]]:
+        """Return the jobs that blocked the event loop the longest in total."""
+        stats = sorted(self.stats.items(), key=lambda item: item[1].total)
+        return stats[::-1][:limit]
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        self.stats.clear()
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs scheduled callbacks.
+
+    A callback is scheduled every interval and the difference between the
+    time it was due and the time it ran is recorded in a histogram.
+    """
+
+    __slots__ = ("_loop", "_interval", "_handle", "_due", "counts", "max")
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float = DEFAULT_LOOP_LAG_INTERVAL,
+    ) -> None:
+        """Initialize the monitor."""
+        self._loop = loop
+        self._interval = interval
+        self._handle: asyncio.TimerHandle | None = None
+        self._due = 0.0
+        self.counts = [0] * len(LOOP_LAG_BUCKETS)
+        self.max = 0.0
+
+    def start(self) -> None:
+        """Start measuring."""
+        self._schedule()
+
+    def stop(self) -> None:
+        """Stop measuring."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def reset(self) -> None:
+        """Reset the histogram."""
+        self.counts = [0] * len(LOOP_LAG_BUCKETS)
+        self.max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "buckets": [
+                {"le": None if math.isinf(bound) else bound, "count": count}
+                for bound, count in zip(LOOP_LAG_BUCKETS, self.counts, strict=True)
+            ],
+            "max": self.max,
+        }
+
+    def _schedule(self) -> None:
+        """Schedule the next measurement."""
+        self._due = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._due, self._measure)
+
+    def _measure(self) -> None:
+        """Record the lag of the event loop."""
+        lag = max(self._loop.time() - self._due, 0.0)
+        self.counts[bisect_left(LOOP_LAG_BUCKETS, lag)] += 1
+        self.max = max(lag, self.max)
+        self._schedule()
@@ -6,8 +6,10 @@ from ulid_transform import (
     bytes_to_ulid,
     bytes_to_ulid_or_none,
     ulid_at_time,
+    ulid_at_time_bytes,
     ulid_hex,
     ulid_now,
+    ulid_now_bytes,
     ulid_to_bytes,
     ulid_to_bytes_or_none,
 )
@@ -16,9 +18,11 @@ __all__ = [
     "ulid",
     "ulid_hex",
     "ulid_at_time",
+    "ulid_at_time_bytes",
     "ulid_to_bytes",
     "bytes_to_ulid",
     "ulid_now",
+    "ulid_now_bytes",
     "ulid_to_bytes_or_none",
     "bytes_to_ulid_or_none",
 ]
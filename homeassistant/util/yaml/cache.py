@@ -0,0 +1,103 @@
+"""Persistent cache of parsed YAML files."""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import threading
+from typing import Any, NamedTuple
+
+from homeassistant.util.file import WriteError, write_utf8_file
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class CacheEntry(NamedTuple):
+    """A parsed YAML file and the file state it was parsed from."""
+
+    mtime_ns: int
+    size: int
+    digest: bytes
+    tree: Any
+
+
+class YamlCache:
+    """Cache parsed YAML files on disk in the marshal format.
+
+    Entries are keyed by path and validated against the mtime, size
+    and content hash of the file. The tree of an entry has tags like
+    !include and !secret left unresolved so they are resolved each
+    time the file is loaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.dirty = False
+        self._entries: dict[str, CacheEntry] | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, CacheEntry]:
+        """Load the entries from disk."""
+        try:
+            with open(self.path, "rb") as cache_file:
+                version, entries = marshal.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring invalid YAML cache %s: %s", self.path, err)
+            return {}
+        if version != CACHE_VERSION:
+            return {}
+        return {path: CacheEntry(*entry) for path, entry in entries.items()}
+
+    def _get_entries(self) -> dict[str, CacheEntry]:
+        """Return the entries, loading them on first use."""
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def get(self, fname: str) -> CacheEntry | None:
+        """Return the cache entry for a file."""
+        with self._lock:
+            return self._get_entries().get(fname)
+
+    def set(self, fname: str, entry: CacheEntry) -> None:
+        """Store the cache entry for a file.
+
+        Trees with values that can not be marshalled are not cached.
+        """
+        try:
+            marshal.dumps(entry.tree)
+        except ValueError:
+            _LOGGER.debug("Not caching %s as it contains unsupported types", fname)
+            return
+        with self._lock:
+            self._get_entries()[fname] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed.
+
+        Entries for files that no longer exist are dropped.
+        """
+        with self._lock:
+            if not self.dirty or self._entries is None:
+                return
+            self._entries = {
+                fname: entry
+                for fname, entry in self._entries.items()
+                if os.path.exists(fname)
+            }
+            data = marshal.dumps(
+                (CACHE_VERSION, {key: tuple(val) for key, val in self._entries.items()})
+            )
+            self.dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, private=True, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Unable to save YAML cache %s: %s", self.path, err)
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, overload
+from typing import Any, TextIO, cast, overload
 
 import yaml
 
@@ -26,6 +27,7 @@ from propcache import cached_property
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import CacheEntry, YamlCache
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -112,6 +114,8 @@ class _LoaderMixin:
 
     name: str
     stream: Any
+    secrets: Secrets | None
+    cache: YamlCache | None = None
 
     @cached_property
     def get_name(self) -> str:
@@ -156,14 +160,21 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    If a cache is passed, the file and the files it includes are only parsed
+    when they changed since they were cached.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
     try:
+        if cache is not None:
+            return _load_yaml_cached(os.fspath(fname), secrets, cache)
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
@@ -176,14 +187,16 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -195,25 +208,37 @@ def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
+    return _parse_yaml_fastest(content, secrets, FastSafeLoader, PythonSafeLoader)
+
+
+def _parse_yaml_fastest(
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None,
+    fast_loader: type[FastSafeLoader],
+    python_loader: type[PythonSafeLoader],
+) -> JSON_TYPE:
+    """Parse YAML with the fast loader and fall back to the python loader."""
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, python_loader)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(fast_loader, content, secrets)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, python_loader)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    python_loader: type[PythonSafeLoader] = PythonSafeLoader,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(python_loader, content, secrets)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -228,6 +253,128 @@ def _parse_yaml(
     return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
 
 
+def _load_yaml_cached(
+    fname: str, secrets: Secrets | None, cache: YamlCache
+) -> JSON_TYPE | None:
+    """Load a YAML file from the cache, parsing it only if it changed.
+
+    Files with the same mtime and size are not read. Otherwise the content
+    hash decides if the cached tree can still be used.
+    """
+    stat_result = os.stat(fname)
+    mtime_ns = stat_result.st_mtime_ns
+    size = stat_result.st_size
+    entry = cache.get(fname)
+    if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+        with open(fname, "rb") as conf_file:
+            content = conf_file.read()
+        digest = hashlib.sha256(content).digest()
+        if entry is not None and entry.digest == digest:
+            tree = entry.tree
+        else:
+            stream = StringIO(content.decode("utf-8"))
+            stream.name = fname
+            tree = _encode_tree(
+                _parse_yaml_fastest(
+                    stream, secrets, _DeferredFastSafeLoader, _DeferredPythonSafeLoader
+                )
+            )
+        cache.set(fname, CacheEntry(mtime_ns, len(content), digest, tree))
+    else:
+        tree = entry.tree
+    return _decode_tree(tree, _CachedTreeLoader(fname, secrets, cache))
+
+
+class _DeferredTag:
+    """A tag that is resolved when a cached tree is loaded."""
+
+    __slots__ = ("column", "line", "tag", "value")
+
+    def __init__(self, tag: str, value: str, line: int, column: int) -> None:
+        """Initialize the deferred tag."""
+        self.tag = tag
+        self.value = value
+        self.line = line
+        self.column = column
+
+
+class _CachedTreeLoader:
+    """Stand in for a loader when resolving the tags of a cached tree."""
+
+    __slots__ = ("cache", "get_name", "secrets")
+
+    def __init__(
+        self, name: str, secrets: Secrets | None, cache: YamlCache | None
+    ) -> None:
+        """Initialize the cached tree loader."""
+        self.get_name = name
+        self.secrets = secrets
+        self.cache = cache
+
+
+# Kinds of the tuples a tree is encoded to. Any other value is a plain scalar
+# as a YAML file never produces tuples.
+_DICT = 0
+_LIST = 1
+_STR = 2
+_TAG = 3
+
+
+def _encode_tree(obj: Any) -> Any:
+    """Encode a parsed tree with unresolved tags to marshallable values."""
+    if isinstance(obj, NodeStrClass):
+        return (_STR, getattr(obj, "__line__", None), str(obj))
+    if isinstance(obj, dict):
+        return (
+            _DICT,
+            getattr(obj, "__line__", None),
+            tuple(
+                encoded
+                for key, value in obj.items()
+                for encoded in (_encode_tree(key), _encode_tree(value))
+            ),
+        )
+    if isinstance(obj, list):
+        return (
+            _LIST,
+            getattr(obj, "__line__", None),
+            tuple(_encode_tree(value) for value in obj),
+        )
+    if isinstance(obj, _DeferredTag):
+        return (_TAG, obj.line, obj.tag, obj.value, obj.column)
+    return obj
+
+
+def _decode_tree(tree: Any, loader: _CachedTreeLoader) -> Any:
+    """Decode an encoded tree and resolve its tags."""
+    if type(tree) is not tuple:
+        if type(tree) is set:
+            return set(tree)
+        return tree
+    kind = tree[0]
+    obj: NodeDictClass | NodeListClass | NodeStrClass
+    if kind == _STR:
+        obj = NodeStrClass(tree[2])
+    elif kind == _DICT:
+        items = [_decode_tree(value, loader) for value in tree[2]]
+        obj = NodeDictClass(zip(items[::2], items[1::2], strict=True))
+    elif kind == _LIST:
+        obj = NodeListClass([_decode_tree(value, loader) for value in tree[2]])
+    else:
+        _, line, tag, value, column = tree
+        node = yaml.nodes.ScalarNode(
+            tag,
+            value,
+            yaml.Mark(loader.get_name, 0, line, column, None, None),  # type: ignore[arg-type]
+        )
+        constructor = FastSafeLoader.yaml_constructors[tag]
+        return constructor(cast(LoaderType, loader), node)
+    obj.__config_file__ = loader.get_name
+    if (line := tree[1]) is not None:
+        obj.__line__ = line
+    return obj
+
+
 @overload
 def _add_reference(
     obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
@@ -316,7 +463,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -350,7 +497,7 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -369,7 +516,7 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -385,7 +532,7 @@ def _include_dir_list_yaml(
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, loader.secrets, loader.cache)) is not None
     ]
 
 
@@ -399,7 +546,7 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -500,3 +647,32 @@ add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
 add_constructor("!include_dir_named", _include_dir_named_yaml)
 add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
 add_constructor("!input", Input.from_node)
+
+
+def _defer_tag(loader: LoaderType, node: yaml.nodes.Node) -> _DeferredTag:
+    """Leave a tag to be resolved when the cached tree is loaded."""
+    return _DeferredTag(
+        node.tag, node.value, node.start_mark.line, node.start_mark.column
+    )
+
+
+class _DeferredFastSafeLoader(FastSafeLoader):
+    """Fast safe loader that does not resolve tags that depend on other files."""
+
+
+class _DeferredPythonSafeLoader(PythonSafeLoader):
+    """Python safe loader that does not resolve tags that depend on other files."""
+
+
+for _tag, _constructor in (
+    ("!include", _raise_if_no_value(_defer_tag)),
+    ("!env_var", _defer_tag),
+    ("!secret", _defer_tag),
+    ("!include_dir_list", _raise_if_no_value(_defer_tag)),
+    ("!include_dir_merge_list", _raise_if_no_value(_defer_tag)),
+    ("!include_dir_named", _raise_if_no_value(_defer_tag)),
+    ("!include_dir_merge_named", _raise_if_no_value(_defer_tag)),
+    ("!input", _defer_tag),
+):
+    _DeferredFastSafeLoader.add_constructor(_tag, _constructor)
+    _DeferredPythonSafeLoader.add_constructor(_tag, _constructor)
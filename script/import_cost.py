@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Measure the import cost of integrations and compare it against a baseline.
+
+Each integration is imported in a fresh interpreter that already has the
+core of Home Assistant imported, so only the cost the integration adds to
+startup is measured. The component is imported first, followed by each
+of its platforms.
+
+    python3 -m script.import_cost --output import_cost.json
+    python3 -m script.import_cost --baseline import_cost.json hue zha
+
+Custom integrations are measured from the config dir passed with
+--config-dir.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import json
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+COMPONENTS_DIR = Path("homeassistant/components")
+
+# Regressions below these absolute deltas are considered noise
+MIN_TIME_DELTA = 0.02
+MIN_MEMORY_DELTA = 1024
+
+
+def _max_rss() -> int:
+    """Return the max RSS of this process in KiB."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    if sys.platform == "darwin":
+        return max_rss // 1024
+    return max_rss
+
+
+def _measure(func: Any) -> dict[str, Any]:
+    """Return the time and max RSS growth in KiB of calling func."""
+    rss = _max_rss()
+    start = time.perf_counter()
+    try:
+        func()
+    except Exception as err:  # noqa: BLE001
+        return {"error": f"{type(err).__name__}: {err}"}
+    return {
+        "time": round(time.perf_counter() - start, 6),
+        "memory": _max_rss() - rss,
+    }
+
+
+async def _async_measure_integration(
+    domain: str, config_dir: str | None
+) -> dict[str, Any]:
+    """Resolve an integration and measure importing it and its platforms."""
+    # Modules every integration relies on are imported before measuring
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import config_entries, loader  # noqa: F401
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.const import Platform
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.core import HomeAssistant
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (  # noqa: F401
+        config_validation as cv,
+        entity_platform,
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        hass = HomeAssistant(config_dir or temp_dir)
+        loader.async_setup(hass)
+        integration = await loader.async_get_integration(hass, domain)
+        result: dict[str, Any] = {"component": _measure(integration.get_component)}
+        platforms: dict[str, dict[str, Any]] = {}
+        if "error" not in result["component"]:
+            for platform_name in sorted(
+                integration.platforms_exists(
+                    {*Platform, *loader.BASE_PRELOAD_PLATFORMS}
+                )
+            ):
+                platforms[platform_name] = _measure(
+                    lambda name=platform_name: integration.get_platform(name)
+                )
+        result["platforms"] = platforms
+        return result
+
+
+def measure_integration(domain: str, config_dir: Path | None = None) -> dict[str, Any]:
+    """Measure the import cost of an integration in a fresh interpreter."""
+    args = [sys.executable, "-m", "script.import_cost", "--child", domain]
+    if config_dir is not None:
+        args.extend(["--config-dir", str(config_dir)])
+    proc = subprocess.run(
+        args,
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"Exit code {proc.returncode}"}
+    result: dict[str, Any] = json.loads(proc.stdout)
+    return result
+
+
+def total(result: dict[str, Any], key: str) -> float:
+    """Return the total of a measurement for an integration and its platforms."""
+    measurements = (result["component"], *result["platforms"].values())
+    return float(sum(measurement.get(key, 0) for measurement in measurements))
+
+
+def compare(
+    report: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return the integrations that got slower or bigger than the baseline."""
+    regressions: list[str] = []
+    for domain, result in report["integrations"].items():
+        if "error" in result or "error" in result["component"]:
+            continue
+        if (base := baseline["integrations"].get(domain)) is None or "error" in base:
+            continue
+        for key, min_delta, unit in (
+            ("time", MIN_TIME_DELTA, "s"),
+            ("memory", MIN_MEMORY_DELTA, "KiB"),
+        ):
+            new, old = total(result, key), total(base, key)
+            if new - old > max(min_delta, old * threshold):
+                regressions.append(
+                    f"{domain}: {key} increased from {old:.3f}{unit} to"
+                    f" {new:.3f}{unit}"
+                )
+    return regressions
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get parsed passed in arguments."""
+    parser = argparse.ArgumentParser(description="Measure integration import cost")
+    parser.add_argument(
+        "integrations", nargs="*", help="Integrations to measure, default all"
+    )
+    parser.add_argument("--output", type=Path, help="Write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="Report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative increase that counts as a regression",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Integrations to measure in parallel, more jobs add noise",
+    )
+    parser.add_argument(
+        "--config-dir", type=Path, help="Config dir to load custom integrations from"
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the script."""
+    args = get_arguments()
+
+    if args.child:
+        config_dir = str(args.config_dir) if args.config_dir else None
+        print(
+            json.dumps(asyncio.run(_async_measure_integration(args.child, config_dir)))
+        )
+        return 0
+
+    if not Path("requirements_all.txt").is_file():
+        print("Run this from HA root dir")
+        return 1
+
+    domains = args.integrations or sorted(
+        path.parent.name
+        for path in COMPONENTS_DIR.glob("*/manifest.json")
+        if json.loads(path.read_text()).get("integration_type") != "virtual"
+    )
+    with ThreadPoolExecutor(args.jobs) as executor:
+        results = dict(
+            zip(
+                domains,
+                executor.map(
+                    partial(measure_integration, config_dir=args.config_dir), domains
+                ),
+                strict=True,
+            )
+        )
+
+    report = {
+        "python": sys.version.split()[0],
+        "integrations": results,
+    }
+    for domain, result in results.items():
+        if "error" in result or "error" in result["component"]:
+            print(f"{domain}: failed to import")
+            continue
+        print(
+            f"{domain}: {total(result, 'time'):.3f}s"
+            f" {total(result, 'memory'):.0f}KiB"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if regressions := compare(report, baseline, args.threshold):
+        print("Import cost regressions:")
+        for regression in regressions:
+            print(f" - {regression}")
+        return 1
+    print("No import cost regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
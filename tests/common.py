@@ -202,6 +202,8 @@ async def async_test_home_assistant(
     store = auth_store.AuthStore(hass)
     hass.auth = auth.AuthManager(hass, store, {}, {})
     ensure_auth_manager_loaded(hass.auth)
+    # Run process jobs in threads so they can be patched in tests
+    hass.executor_pools.process_pool_size = 0
     INSTANCES.append(hass)
 
     orig_async_add_job = hass.async_add_job
@@ -222,7 +224,7 @@ async def async_test_home_assistant(
 
         return orig_async_add_job(target, *args, eager_start=eager_start)
 
-    def async_add_executor_job(target, *args):
+    def async_add_executor_job(target, *args, priority=None, pool=None):
         """Add executor job."""
         check_target = target
         while isinstance(check_target, ft.partial):
@@ -233,7 +235,7 @@ async def async_test_home_assistant(
             fut.set_result(target(*args))
             return fut
 
-        return orig_async_add_executor_job(target, *args)
+        return orig_async_add_executor_job(target, *args, priority=priority, pool=pool)
 
     def async_create_task_internal(coroutine, name=None, eager_start=True):
         """Create task."""
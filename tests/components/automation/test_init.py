@@ -40,7 +40,7 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.script import (
     SCRIPT_MODE_CHOICES,
@@ -1343,6 +1343,101 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_automations(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test a reload only validates automations with an id when they changed."""
+
+    def _automation(event: str, automation_id: str | None = None) -> dict[str, Any]:
+        config = {
+            "triggers": {"trigger": "event", "event_type": event},
+            "actions": {"action": "test.automation"},
+        }
+        if automation_id:
+            config["id"] = automation_id
+        return config
+
+    config = {
+        automation.DOMAIN: [
+            _automation("event_one", "one"),
+            _automation("event_two", "two"),
+            _automation("event_three"),
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    config = {
+        automation.DOMAIN: [
+            _automation("event_one", "one"),
+            _automation("event_changed", "two"),
+            _automation("event_three"),
+        ]
+    }
+    with (
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+        patch(
+            "homeassistant.components.automation.config._async_validate_config_item",
+            wraps=automation.config._async_validate_config_item,
+        ) as mock_validate,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert [call.args[1] for call in mock_validate.call_args_list] == [
+        _automation("event_changed", "two"),
+        _automation("event_three"),
+    ]
+
+    hass.bus.async_fire("event_one")
+    hass.bus.async_fire("event_two")
+    hass.bus.async_fire("event_changed")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_reload_validates_automation_after_entity_rename(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test a reload validates an automation again after an entity is renamed."""
+    entry = entity_registry.async_get_or_create(
+        "test", "hue", "1234", suggested_object_id="beer"
+    )
+    config = {
+        automation.DOMAIN: {
+            "id": "sun",
+            "triggers": {"trigger": "state", "entity_id": entry.id, "to": "on"},
+            "actions": {"action": "test.automation"},
+        }
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    async def reload() -> int:
+        with (
+            patch(
+                "homeassistant.config.load_yaml_config_file",
+                autospec=True,
+                return_value=config,
+            ),
+            patch(
+                "homeassistant.components.automation.config._async_validate_config_item",
+                wraps=automation.config._async_validate_config_item,
+            ) as mock_validate,
+        ):
+            await hass.services.async_call(
+                automation.DOMAIN, SERVICE_RELOAD, blocking=True
+            )
+        return mock_validate.call_count
+
+    assert await reload() == 0
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="test.ale")
+    await hass.async_block_till_done()
+    assert await reload() == 1
+
+
 @pytest.mark.parametrize("extra_config", [{}, {"id": "sun"}])
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls: list[ServiceCall], extra_config: dict[str, str]
@@ -6,6 +6,7 @@ import logging
 import os
 from pathlib import Path
 import sys
+import time
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -21,6 +22,7 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_JOB_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -33,11 +35,12 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -469,3 +472,64 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_job_stats(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test we can log and fetch the job statistics."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_JOB_STATS)
+
+    @callback
+    def _slow_listener(event: Event) -> None:
+        """Block the event loop."""
+        time.sleep(0.01)
+
+    hass.bus.async_listen("test_event", _slow_listener)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/job_stats", "max_jobs": 1})
+    response = await client.receive_json()
+    assert response["success"]
+    [job] = response["result"]["jobs"]
+    assert job["name"] == f"{__name__}.test_job_stats.<locals>._slow_listener"
+    assert job["count"] == 1
+    assert job["max"] >= 0.01
+    assert response["result"]["loop_lag"]["buckets"][-1]["le"] is None
+    assert response["result"]["executors"]["ImportExecutor"]["queue_depths"] == {
+        "interactive": 0,
+        "automation": 0,
+        "polling": 0,
+        "background": 0,
+    }
+    assert isinstance(response["result"]["stores"], dict)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_LOG_JOB_STATS, {"reset": True}, blocking=True
+    )
+    assert "_slow_listener: count=1" in caplog.text
+    assert "Event loop lag" in caplog.text
+    assert "Store writes" in caplog.text
+
+    await client.send_json_auto_id({"type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert "_slow_listener" not in str(response["result"]["jobs"])
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_loaded"
@@ -0,0 +1,84 @@
+"""Test state attributes table manager."""
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    StateAttributesManager,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+
+
+def _state_changed_event(new_state: State | None) -> Event:
+    """Create a state changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "light.bowl", "old_state": None, "new_state": new_state},
+    )
+
+
+async def test_serialize_from_event_reuses_unchanged_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test attributes are only serialized again when they change."""
+    manager = StateAttributesManager(MagicMock(dialect_name=None))
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    on_state = hass.states.get("light.bowl")
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    off_state = hass.states.get("light.bowl")
+    assert off_state.attributes is on_state.attributes
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        assert (
+            manager.serialize_from_event(_state_changed_event(on_state))
+            == b'{"brightness":100}'
+        )
+        assert (
+            manager.serialize_from_event(_state_changed_event(off_state))
+            == b'{"brightness":100}'
+        )
+        assert mock_serialize.call_count == 1
+
+        hass.states.async_set("light.bowl", "off", {"brightness": 50})
+        changed_state = hass.states.get("light.bowl")
+        assert (
+            manager.serialize_from_event(_state_changed_event(changed_state))
+            == b'{"brightness":50}'
+        )
+        assert mock_serialize.call_count == 2
+
+        assert manager.serialize_from_event(_state_changed_event(None)) == b"{}"
+        assert (
+            manager.serialize_from_event(_state_changed_event(changed_state))
+            == b'{"brightness":50}'
+        )
+        assert mock_serialize.call_count == 4
+
+        manager.reset()
+        manager.serialize_from_event(_state_changed_event(changed_state))
+        assert mock_serialize.call_count == 5
+
+
+async def test_evict_purged_clears_serialized(hass: HomeAssistant) -> None:
+    """Test the serialized attributes are dropped when purged rows are evicted."""
+    manager = StateAttributesManager(MagicMock(dialect_name=None))
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        manager.serialize_from_event(_state_changed_event(state))
+        manager.serialize_from_event(_state_changed_event(state))
+        assert mock_serialize.call_count == 1
+
+        manager.evict_purged(set())
+        manager.serialize_from_event(_state_changed_event(state))
+        assert mock_serialize.call_count == 2
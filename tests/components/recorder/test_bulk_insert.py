@@ -0,0 +1,184 @@
+"""Test inserting the rows of a commit interval in bulk."""
+
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import Insert, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bulk_insert import PendingRows
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture(autouse=True)
+def bulk_insert_all_dialects() -> Generator[None]:
+    """Insert in bulk with the database the tests run with."""
+    with patch(
+        "homeassistant.components.recorder.core.BULK_INSERT_DIALECTS",
+        set(SupportedDialect),
+    ):
+        yield
+
+
+def _count_inserts(instance: Recorder) -> dict[str, int]:
+    """Count the insert statements executed per table."""
+    inserts: dict[str, int] = {}
+
+    @event.listens_for(instance.engine, "before_execute")
+    def _before_execute(
+        conn: Any,
+        clauseelement: Any,
+        multiparams: Any,
+        params: Any,
+        execution_options: Any,
+    ) -> None:
+        if isinstance(clauseelement, Insert):
+            table = clauseelement.table.name
+            inserts[table] = inserts.get(table, 0) + 1
+
+    return inserts
+
+
+async def test_states_and_events_are_inserted_in_bulk(
+    async_test_recorder: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the rows of a commit interval are inserted with one statement per table."""
+    async with async_test_recorder(hass, {"commit_interval": 30}) as instance:
+        await async_wait_recording_done(hass)
+        inserts = _count_inserts(instance)
+
+        for idx in range(3):
+            hass.states.async_set("test.one", str(idx), {"idx": idx})
+            hass.states.async_set("test.two", str(idx), {"shared": True})
+            hass.bus.async_fire("test_event", {"idx": idx})
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+        assert inserts == {
+            "event_types": 1,
+            "event_data": 1,
+            "states_meta": 1,
+            "state_attributes": 1,
+            "states": 1,
+            "events": 1,
+        }
+        inserts.clear()
+
+        hass.states.async_set("test.one", "3", {"idx": 3})
+        hass.bus.async_fire("test_event", {"idx": 0})
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+        # Rows that were committed before are not inserted again
+        assert inserts == {"state_attributes": 1, "states": 1, "events": 1}
+
+        with session_scope(hass=hass, read_only=True) as session:
+            rows = (
+                session.query(
+                    States, StatesMeta.entity_id, StateAttributes.shared_attrs
+                )
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .join(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .order_by(States.state_id)
+                .all()
+            )
+            states = {
+                entity_id: [
+                    (db_state, shared_attrs)
+                    for db_state, eid, shared_attrs in rows
+                    if eid == entity_id
+                ]
+                for entity_id in ("test.one", "test.two")
+            }
+            assert [db_state.state for db_state, _ in states["test.one"]] == [
+                "0",
+                "1",
+                "2",
+                "3",
+            ]
+            assert [shared_attrs for _, shared_attrs in states["test.one"]] == [
+                '{"idx":0}',
+                '{"idx":1}',
+                '{"idx":2}',
+                '{"idx":3}',
+            ]
+            for entity_states in states.values():
+                previous: States | None = None
+                for db_state, _ in entity_states:
+                    assert db_state.old_state_id == (previous and previous.state_id)
+                    previous = db_state
+            assert {db_state.attributes_id for db_state, _ in states["test.two"]} == {
+                states["test.two"][0][0].attributes_id
+            }
+
+            events = (
+                session.query(EventTypes.event_type, EventData.shared_data)
+                .select_from(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .join(EventData, Events.data_id == EventData.data_id)
+                .filter(EventTypes.event_type == "test_event")
+                .order_by(Events.event_id)
+                .all()
+            )
+            assert [shared_data for _, shared_data in events] == [
+                '{"idx":0}',
+                '{"idx":1}',
+                '{"idx":2}',
+                '{"idx":0}',
+            ]
+
+
+async def test_bulk_insert_is_retried(
+    async_test_recorder: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the rows are inserted again when the bulk insert fails."""
+    async with async_test_recorder(hass, {"commit_interval": 30}):
+        await async_wait_recording_done(hass)
+
+        hass.states.async_set("test.one", "on")
+        hass.states.async_set("test.one", "off")
+        await async_recorder_block_till_done(hass)
+
+        insert = PendingRows.insert
+        failures = [OperationalError("insert the state", "fake params", "failed")]
+
+        def _insert_or_fail(pending_rows: PendingRows, session: Session) -> None:
+            if failures:
+                raise failures.pop()
+            insert(pending_rows, session)
+
+        with (
+            patch("time.sleep"),
+            patch.object(PendingRows, "insert", _insert_or_fail),
+        ):
+            await async_wait_recording_done(hass)
+
+        assert "Error executing query" in caplog.text
+
+        with session_scope(hass=hass, read_only=True) as session:
+            db_states = session.query(States).order_by(States.state_id).all()
+            assert [db_state.state for db_state in db_states] == ["on", "off"]
+            assert db_states[1].old_state_id == db_states[0].state_id
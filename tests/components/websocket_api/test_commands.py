@@ -25,6 +25,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.timeline import DATA_STARTUP_TIMELINE, Timeline
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -2566,6 +2567,24 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test fetching the startup timeline as a Chrome trace."""
+    await websocket_client.send_json_auto_id({"type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = Timeline()
+    timeline.add("setup", "august", timeline.origin, timeline.origin + 1.5)
+    await websocket_client.send_json_auto_id({"type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == timeline.as_chrome_trace()
+    assert msg["result"]["traceEvents"][-1]["dur"] == 1500000
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
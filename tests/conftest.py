@@ -628,8 +628,8 @@ async def stop_hass() -> AsyncGenerator[None]:
     event_loop = asyncio.get_running_loop()
     created = []
 
-    def mock_hass(*args):
-        hass_inst = orig_hass(*args)
+    def mock_hass(*args, **kwargs):
+        hass_inst = orig_hass(*args, **kwargs)
         created.append(hass_inst)
         return hass_inst
 
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from functools import partial
 from typing import Any
+from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -158,6 +159,38 @@ async def test_delete_non_existing_area(area_registry: ar.AreaRegistry) -> None:
     assert len(area_registry.areas) == 1
 
 
+async def test_bulk_get_or_create_and_update(
+    hass: HomeAssistant, area_registry: ar.AreaRegistry
+) -> None:
+    """Test bulk operations save once and fire compacted events."""
+    update_events = async_capture_events(hass, ar.EVENT_AREA_REGISTRY_UPDATED)
+    with patch.object(area_registry._store, "async_delay_save") as mock_delay_save:
+        kitchen, hallway, kitchen2 = area_registry.async_bulk_get_or_create(
+            ["Kitchen", "Hallway", "Kitchen"]
+        )
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 1
+    assert kitchen == kitchen2
+    assert [event.data for event in update_events] == [
+        {"action": "create", "area_id": kitchen.id},
+        {"action": "create", "area_id": hallway.id},
+    ]
+    update_events.clear()
+
+    with patch.object(area_registry._store, "async_delay_save") as mock_delay_save:
+        kitchen, hallway = area_registry.async_bulk_update(
+            {kitchen.id: {"icon": "mdi:fridge"}, hallway.id: {"name": "Hall"}}
+        )
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 1
+    assert kitchen.icon == "mdi:fridge"
+    assert hallway.name == "Hall"
+    assert [event.data for event in update_events] == [
+        {"action": "update", "area_id": kitchen.id},
+        {"action": "update", "area_id": hallway.id},
+    ]
+
+
 async def test_update_area(
     hass: HomeAssistant,
     area_registry: ar.AreaRegistry,
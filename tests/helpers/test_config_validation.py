@@ -240,6 +240,25 @@ def test_entity_ids(validator) -> None:
     assert schema("sensor.LIGHT, light.kitchen ") == ["sensor.light", "light.kitchen"]
 
 
+def test_entity_ids_string_cache() -> None:
+    """Test validated entity ID strings are cached but not shared."""
+    first = cv.entity_ids("sensor.LIGHT, light.kitchen")
+    second = cv.entity_ids("sensor.LIGHT, light.kitchen")
+    assert first == second == ["sensor.light", "light.kitchen"]
+    assert first is not second
+
+    first.append("light.bed")
+    assert cv.entity_ids("sensor.LIGHT, light.kitchen") == [
+        "sensor.light",
+        "light.kitchen",
+    ]
+    assert cv._entity_ids_str.cache_info().hits >= 2
+
+    for _ in range(2):
+        with pytest.raises(vol.Invalid):
+            cv.entity_ids("sensor.light,sensor_invalid")
+
+
 def test_entity_ids_or_uuids() -> None:
     """Test entity ID validation."""
     schema = vol.Schema(cv.entity_ids_or_uuids)
@@ -300,6 +300,47 @@ async def test_loading_from_storage(
     assert isinstance(entry.identifiers, set)
 
 
+async def test_devices_decoded_on_access(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test loaded devices are indexed and only decoded when accessed."""
+    registry = dr.DeviceRegistry(hass)
+    await registry.async_load()
+    entry1 = registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_update_device(
+        entry2.id, area_id="12345A", labels={"label1"}
+    )
+    await flush_store(registry._store)
+
+    registry2 = dr.DeviceRegistry(hass)
+    await registry2.async_load()
+    devices = registry2.devices
+    assert devices.data == {}
+    assert len(devices) == 2
+    assert list(devices) == [entry1.id, entry2.id]
+
+    assert (
+        registry2.async_get_device(
+            connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")}
+        )
+        == entry1
+    )
+    assert list(devices.data) == [entry1.id]
+    assert dr.async_entries_for_area(registry2, "12345A") == [entry2]
+    assert dr.async_entries_for_label(registry2, "label1") == [entry2]
+    assert registry2.async_get(entry2.id) == entry2
+    assert list(devices.data) == [entry1.id, entry2.id]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 @pytest.mark.usefixtures("freezer")
 async def test_migration_from_1_1(
@@ -1267,6 +1308,63 @@ async def test_migration_from_1_7(
     }
 
 
+async def test_bulk_get_or_create_and_update(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test bulk operations save once and fire compacted events."""
+    update_events = async_capture_events(hass, dr.EVENT_DEVICE_REGISTRY_UPDATED)
+    with patch.object(device_registry._store, "async_delay_save") as mock_delay_save:
+        entry1, entry2, entry3 = device_registry.async_bulk_get_or_create(
+            [
+                {
+                    "config_entry_id": mock_config_entry.entry_id,
+                    "identifiers": {("bridgeid", "0123")},
+                },
+                {
+                    "config_entry_id": mock_config_entry.entry_id,
+                    "identifiers": {("bridgeid", "0123")},
+                    "name": "Bridge",
+                },
+                {
+                    "config_entry_id": mock_config_entry.entry_id,
+                    "identifiers": {("bridgeid", "4567")},
+                },
+            ]
+        )
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 1
+    assert entry1.id == entry2.id
+    assert entry2.name == "Bridge"
+    assert [event.data for event in update_events] == [
+        {"action": "create", "device_id": entry1.id},
+        {"action": "create", "device_id": entry3.id},
+    ]
+    update_events.clear()
+
+    with patch.object(device_registry._store, "async_delay_save") as mock_delay_save:
+        updated1, updated3 = device_registry.async_bulk_update(
+            {
+                entry1.id: {"name_by_user": "Living room bridge"},
+                entry3.id: {"remove_config_entry_id": mock_config_entry.entry_id},
+            }
+        )
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 1
+    assert updated1.name_by_user == "Living room bridge"
+    assert updated3 is None
+    assert device_registry.async_get(entry3.id) is None
+    assert [event.data for event in update_events] == [
+        {
+            "action": "update",
+            "device_id": entry1.id,
+            "changes": {"name_by_user": None},
+        },
+        {"action": "remove", "device_id": entry3.id},
+    ]
+
+
 async def test_removing_config_entries(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
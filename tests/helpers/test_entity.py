@@ -20,12 +20,14 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
@@ -577,6 +579,30 @@ async def test_async_parallel_updates_with_one_using_executor(
     assert locked == [True, True, True]
 
 
+async def test_sync_update_uses_integration_executor_quota(
+    hass: HomeAssistant,
+) -> None:
+    """Test sync updates of an entity run within the quota of its integration."""
+    hass.executor_pools.async_set_quota("test_platform", 1)
+    quota = hass.executor_pools.async_get_quota("test_platform")
+    locked = []
+
+    class SyncEntity(entity.Entity):
+        """Test entity."""
+
+        def update(self) -> None:
+            """Test update."""
+            locked.append(quota.locked())
+
+    platform = MockEntityPlatform(hass)
+    ent = SyncEntity()
+    ent.entity_id = "test.sync"
+    await platform.async_add_entities([ent])
+    await ent.async_update_ha_state(True)
+
+    assert locked == [True]
+
+
 async def test_async_remove_no_platform(hass: HomeAssistant) -> None:
     """Test async_remove method when no platform set."""
     ent = entity.Entity()
@@ -833,10 +859,16 @@ async def test_setup_source(hass: HomeAssistant) -> None:
             "domain": "test_platform",
         },
     }
+    assert entity.async_integration_entity_ids(hass, "test_platform") == [
+        "test_domain.platform_config_source",
+        "test_domain.config_entry_source",
+    ]
+    assert entity.async_integration_entity_ids(hass, "test_domain") == []
 
     await platform.async_reset()
 
     assert entity.entity_sources(hass) == {}
+    assert entity.async_integration_entity_ids(hass, "test_platform") == []
 
 
 async def test_removing_entity_unavailable(hass: HomeAssistant) -> None:
@@ -1718,6 +1750,49 @@ async def test_invalid_state(
     assert hass.states.get("test.test").state == "x" * 255
 
 
+async def test_async_write_ha_states(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test writing the state of multiple entities at once."""
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.entity_id = f"test.test{idx}"
+        ent.hass = hass
+        ent._attr_state = f"state{idx}"
+        entities.append(ent)
+    entities[2]._attr_state = "x" * 256
+
+    seen_states = []
+
+    @callback
+    def listener(event: Event) -> None:
+        seen_states.append(
+            [hass.states.get(ent.entity_id) is not None for ent in entities]
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    entity.async_write_ha_states(hass, entities)
+
+    assert hass.states.get("test.test0").state == "state0"
+    assert hass.states.get("test.test1").state == "state1"
+    assert hass.states.get("test.test2").state == STATE_UNKNOWN
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state for test.test2, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+    # The unknown state is written first, the batch is stored before it fires
+    assert seen_states == [
+        [False, False, True],
+        [True, True, True],
+        [True, True, True],
+    ]
+    assert (
+        hass.states.get("test.test0").context is hass.states.get("test.test1").context
+    )
+
+
 async def test_suggest_report_issue_built_in(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
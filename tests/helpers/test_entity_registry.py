@@ -355,6 +355,57 @@ async def test_loading_saving_data(
     assert new_entry2.unit_of_measurement == "initial-unit_of_measurement"
 
 
+async def test_entries_decoded_on_access(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loaded entries are indexed and only decoded when accessed."""
+    registry = er.EntityRegistry(hass)
+    await registry.async_load()
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", device_id="mock-dev-id", config_entry=None
+    )
+    entry2 = registry.async_get_or_create("light", "hue", "5678")
+    entry3 = registry.async_get_or_create("light", "hue", "ABCD")
+    entry2 = registry.async_update_entity(entry2.entity_id, area_id="mock-area-id")
+    entry3 = registry.async_update_entity(entry3.entity_id, labels={"label1"})
+    await flush_store(registry._store)
+    stored = hass_storage[er.STORAGE_KEY]["data"]["entities"]
+
+    registry2 = er.EntityRegistry(hass)
+    await registry2.async_load()
+    entities = registry2.entities
+    assert entities.data == {}
+    assert len(entities) == 3
+    assert list(entities) == [entry1.entity_id, entry2.entity_id, entry3.entity_id]
+
+    assert registry2.async_get_entity_id("light", "hue", "1234") == entry1.entity_id
+    assert registry2.async_is_registered(entry2.entity_id)
+    assert entities.data == {}
+
+    assert er.async_entries_for_device(registry2, "mock-dev-id") == [entry1]
+    assert er.async_entries_for_area(registry2, "mock-area-id") == [entry2]
+    assert list(entities.data) == [entry1.entity_id, entry2.entity_id]
+
+    # Saving writes undecoded entries as loaded and keeps the order
+    registry2.async_update_entity(entry1.entity_id, name="Updated")
+    await flush_store(registry2._store)
+    saved = hass_storage[er.STORAGE_KEY]["data"]["entities"]
+    assert [entity["entity_id"] for entity in saved] == [
+        entry1.entity_id,
+        entry2.entity_id,
+        entry3.entity_id,
+    ]
+    assert saved[0]["name"] == "Updated"
+    assert saved[2] == stored[2]
+
+    assert er.async_entries_for_label(registry2, "label1") == [entry3]
+    assert list(entities.data) == [
+        entry1.entity_id,
+        entry2.entity_id,
+        entry3.entity_id,
+    ]
+
+
 def test_generate_entity_considers_registered_entities(
     entity_registry: er.EntityRegistry,
 ) -> None:
@@ -986,6 +1037,83 @@ async def test_update_entity_unique_id(entity_registry: er.EntityRegistry) -> No
     )
 
 
+async def test_bulk_get_or_create_and_update(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test bulk operations save once and fire compacted events."""
+    update_events = async_capture_events(hass, er.EVENT_ENTITY_REGISTRY_UPDATED)
+    existing = entity_registry.async_get_or_create("light", "hue", "1234")
+    await hass.async_block_till_done()
+    update_events.clear()
+
+    with patch.object(entity_registry._store, "async_delay_save") as mock_delay_save:
+        entries = entity_registry.async_bulk_get_or_create(
+            [
+                {"domain": "light", "platform": "hue", "unique_id": "5678"},
+                {
+                    "domain": "light",
+                    "platform": "hue",
+                    "unique_id": "5678",
+                    "original_name": "Kitchen",
+                },
+                {
+                    "domain": "light",
+                    "platform": "hue",
+                    "unique_id": "1234",
+                    "original_name": "Hallway",
+                },
+            ]
+        )
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 1
+    assert [entry.entity_id for entry in entries] == [
+        "light.hue_5678",
+        "light.hue_5678",
+        "light.hue_1234",
+    ]
+    assert entries[1].original_name == "Kitchen"
+    assert [event.data for event in update_events] == [
+        {"action": "create", "entity_id": "light.hue_5678"},
+        {
+            "action": "update",
+            "entity_id": existing.entity_id,
+            "changes": {"original_name": None},
+        },
+    ]
+    update_events.clear()
+
+    with patch.object(entity_registry._store, "async_delay_save") as mock_delay_save:
+        entries = entity_registry.async_bulk_update(
+            {
+                "light.hue_5678": {"name": "Kitchen light"},
+                "light.hue_1234": {"new_entity_id": "light.hallway"},
+            }
+        )
+        entity_registry.async_bulk_update({"light.hallway": {"icon": "mdi:lamp"}})
+        await hass.async_block_till_done()
+    assert mock_delay_save.call_count == 2
+    assert entries[0].name == "Kitchen light"
+    assert entity_registry.async_get("light.hallway").icon == "mdi:lamp"
+    assert [event.data for event in update_events] == [
+        {
+            "action": "update",
+            "entity_id": "light.hue_5678",
+            "changes": {"name": None},
+        },
+        {
+            "action": "update",
+            "entity_id": "light.hallway",
+            "changes": {"entity_id": "light.hue_1234"},
+            "old_entity_id": "light.hue_1234",
+        },
+        {
+            "action": "update",
+            "entity_id": "light.hallway",
+            "changes": {"icon": None},
+        },
+    ]
+
+
 async def test_update_entity_unique_id_conflict(
     entity_registry: er.EntityRegistry,
 ) -> None:
@@ -2116,6 +2244,57 @@ async def test_entries_for_label(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_label(entity_registry, "")
 
 
+async def test_entries_for_area_include_device_area(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test getting entity entries by area including the area of the device."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device_entry.id, area_id="kitchen")
+    inherited = entity_registry.async_get_or_create(
+        "light", "hue", "123", device_id=device_entry.id
+    )
+    overridden = entity_registry.async_get_or_create(
+        "light", "hue", "456", device_id=device_entry.id
+    )
+    overridden = entity_registry.async_update_entity(
+        overridden.entity_id, area_id="hallway"
+    )
+    entity_registry.async_get_or_create(
+        "light",
+        "hue",
+        "789",
+        device_id=device_entry.id,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    direct = entity_registry.async_get_or_create("light", "hue", "abc")
+    direct = entity_registry.async_update_entity(direct.entity_id, area_id="kitchen")
+
+    assert er.async_entries_for_area(entity_registry, "kitchen") == [direct]
+    assert er.async_entries_for_area(
+        entity_registry, "kitchen", include_device_area=True
+    ) == [direct, inherited]
+    assert er.async_entries_for_area(
+        entity_registry, "hallway", include_device_area=True
+    ) == [overridden]
+
+    # The index follows changes to the area and device of the entities
+    overridden = entity_registry.async_update_entity(overridden.entity_id, area_id=None)
+    inherited = entity_registry.async_update_entity(inherited.entity_id, device_id=None)
+    assert er.async_entries_for_area(
+        entity_registry, "kitchen", include_device_area=True
+    ) == [direct, overridden]
+    assert not er.async_entries_for_area(
+        entity_registry, "hallway", include_device_area=True
+    )
+
+
 async def test_removing_categories(entity_registry: er.EntityRegistry) -> None:
     """Make sure we can clear categories."""
     entry = entity_registry.async_get_or_create(
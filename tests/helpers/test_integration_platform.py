@@ -8,10 +8,11 @@ from unittest.mock import Mock, patch
 import pytest
 
 from homeassistant import loader
-from homeassistant.const import EVENT_COMPONENT_LOADED
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    async_load_integration_platforms,
     async_process_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
@@ -59,6 +60,86 @@ async def test_process_integration_platforms_with_wait(hass: HomeAssistant) -> N
     assert len(processed) == 2
 
 
+def _mock_unimported_platforms(
+    hass: HomeAssistant, platforms: dict[str, ModuleType]
+) -> list[Mock]:
+    """Mock integration platforms that have not been imported yet."""
+    import_mocks = []
+    for domain, platform in platforms.items():
+        mock_platform(hass, f"{domain}.platform_to_check", platform)
+        del hass.data[loader.DATA_COMPONENTS][f"{domain}.platform_to_check"]
+        integration = hass.data[loader.DATA_INTEGRATIONS][domain]
+        integration._import_platform = Mock(return_value=platform)
+        import_mocks.append(integration._import_platform)
+    return import_mocks
+
+
+async def test_process_integration_platforms_lazy(hass: HomeAssistant) -> None:
+    """Test lazy platforms are only imported when they are needed."""
+    loaded_platform = Mock()
+    event_platform = Mock()
+    import_mocks = _mock_unimported_platforms(
+        hass, {"loaded": loaded_platform, "event": event_platform}
+    )
+    hass.config.components.add("loaded")
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform, lazy=True
+    )
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+
+    assert processed == []
+    assert all(mock.call_count == 0 for mock in import_mocks)
+    assert "platform_to_check" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    await async_load_integration_platforms(hass, "platform_to_check")
+    assert sorted(processed) == [
+        ("event", event_platform),
+        ("loaded", loaded_platform),
+    ]
+
+    await async_load_integration_platforms(hass, "platform_to_check")
+    assert all(mock.call_count == 1 for mock in import_mocks)
+
+
+async def test_process_integration_platforms_lazy_prefetch(
+    hass: HomeAssistant,
+) -> None:
+    """Test lazy platforms are loaded in the background once started."""
+    _mock_unimported_platforms(hass, {"loaded": Mock(), "event": Mock()})
+    hass.config.components.add("loaded")
+    hass.set_state(CoreState.starting)
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append(domain)
+
+    await async_process_integration_platforms(
+        hass, "platform_to_check", _process_platform, lazy=True, prefetch=True
+    )
+    await hass.async_block_till_done()
+    assert processed == []
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert processed == ["loaded"]
+
+    # Integrations loaded once running are processed right away
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == ["loaded", "event"]
+
+
 async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     """Test processing integrations."""
     loaded_platform = Mock()
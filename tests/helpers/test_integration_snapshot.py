@@ -0,0 +1,74 @@
+"""Test the integration snapshot helper."""
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import integration_snapshot
+from homeassistant.helpers.integration_snapshot import (
+    STORAGE_KEY,
+    IntegrationSnapshotStore,
+)
+
+
+def _async_reset_loader(hass: HomeAssistant) -> None:
+    """Forget all resolved integrations as if Home Assistant restarted."""
+    hass.data[loader.DATA_INTEGRATIONS].clear()
+    hass.data[loader.DATA_MISSING_PLATFORMS].clear()
+    hass.data.pop(loader.DATA_INTEGRATION_SNAPSHOT, None)
+
+
+async def test_save_and_restore(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the snapshot is saved and restored on the next start."""
+    store = IntegrationSnapshotStore(hass)
+    assert not await store.async_load()
+    await loader.async_get_integration(hass, "hue")
+    await store.async_save()
+    assert "hue" in hass_storage[STORAGE_KEY]["data"]["integrations"]
+
+    _async_reset_loader(hass)
+    store = IntegrationSnapshotStore(hass)
+    assert await store.async_load()
+    assert "hue" in hass.data[loader.DATA_INTEGRATION_SNAPSHOT]
+    await loader.async_get_integration(hass, "hue")
+    assert "hue" not in hass.data[loader.DATA_INTEGRATION_SNAPSHOT]
+
+    # The snapshot is only written again when it changes
+    hass_storage.pop(STORAGE_KEY)
+    await store.async_save()
+    assert STORAGE_KEY not in hass_storage
+    await loader.async_get_integration(hass, "http")
+    await store.async_save()
+    assert "http" in hass_storage[STORAGE_KEY]["data"]["integrations"]
+
+
+async def test_snapshot_invalidated(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the snapshot is not restored when the installation changed."""
+    store = IntegrationSnapshotStore(hass)
+    await store.async_load()
+    await loader.async_get_integration(hass, "hue")
+    await store.async_save()
+
+    _async_reset_loader(hass)
+    with patch.object(integration_snapshot, "__version__", "2000.1.0"):
+        assert not await IntegrationSnapshotStore(hass).async_load()
+
+    with patch.object(
+        integration_snapshot,
+        "_async_custom_components_fingerprint",
+        return_value="changed",
+    ):
+        assert not await IntegrationSnapshotStore(hass).async_load()
+
+    with patch.object(
+        integration_snapshot, "_get_file_state", return_value={"hue": [1, 2]}
+    ):
+        assert not await IntegrationSnapshotStore(hass).async_load()
+
+    assert loader.DATA_INTEGRATION_SNAPSHOT not in hass.data
+    assert await IntegrationSnapshotStore(hass).async_load()
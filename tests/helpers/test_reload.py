@@ -10,9 +10,11 @@ from homeassistant import config
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigValidationError, HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.reload import (
+    async_get_config_item_cache,
     async_get_platform_without_config_entry,
     async_integration_yaml_config,
     async_reload_integration_platforms,
@@ -21,6 +23,7 @@ from homeassistant.helpers.reload import (
 from homeassistant.loader import async_get_integration
 
 from tests.common import (
+    MockConfigEntry,
     MockModule,
     MockPlatform,
     get_fixture_path,
@@ -275,3 +278,83 @@ async def test_async_integration_missing_yaml_config(hass: HomeAssistant) -> Non
         patch.object(config, "YAML_CONFIG_FILE", yaml_path),
     ):
         await async_integration_yaml_config(hass, DOMAIN)
+
+
+async def test_config_item_cache(hass: HomeAssistant) -> None:
+    """Test config items are only validated again when they change."""
+    cache = async_get_config_item_cache(hass, DOMAIN)
+    assert async_get_config_item_cache(hass, DOMAIN) is cache
+    validate = AsyncMock(side_effect=lambda: {"validated": True})
+
+    async def validate_pass(items: list[tuple[str | None, dict]]) -> None:
+        for unique_id, item in items:
+            await cache.async_validate(unique_id, item, validate, lambda _: True)
+        cache.async_finish()
+
+    await validate_pass([("one", {"a": 1}), ("two", {"b": 1}), (None, {"c": 1})])
+    assert validate.await_count == 3
+
+    # Items without an id and changed or duplicated items are validated again
+    validate.reset_mock()
+    await validate_pass(
+        [("one", {"a": 1}), ("two", {"b": 2}), ("two", {"b": 2}), (None, {"c": 1})]
+    )
+    assert validate.await_count == 3
+
+    # Items that are gone are forgotten
+    validate.reset_mock()
+    await validate_pass([("two", {"b": 2})])
+    await validate_pass([("one", {"a": 1}), ("two", {"b": 2})])
+    assert validate.await_count == 1
+
+    # Results that are not cacheable are always validated again
+    validate.reset_mock()
+    for _ in range(2):
+        await cache.async_validate("three", {"d": 1}, validate, lambda _: False)
+        cache.async_finish()
+    assert validate.await_count == 2
+
+
+async def test_config_item_cache_cleared_on_registry_changes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test config items are validated again after registry changes."""
+    cache = async_get_config_item_cache(hass, DOMAIN)
+    validate = AsyncMock(side_effect=lambda: {"validated": True})
+
+    async def validate_pass() -> None:
+        await cache.async_validate("one", {"a": 1}, validate, lambda _: True)
+        cache.async_finish()
+
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "1234")}
+    )
+    entry = entity_registry.async_get_or_create("test", "hue", "1234")
+    await hass.async_block_till_done()
+    await validate_pass()
+    validate.reset_mock()
+
+    # Changes which can not change a validation result keep the cache
+    entity_registry.async_update_entity(entry.entity_id, name="Beer")
+    await hass.async_block_till_done()
+    await validate_pass()
+    assert validate.await_count == 0
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="test.ale")
+    await hass.async_block_till_done()
+    await validate_pass()
+    assert validate.await_count == 1
+
+    entity_registry.async_remove("test.ale")
+    await hass.async_block_till_done()
+    await validate_pass()
+    assert validate.await_count == 2
+
+    device_registry.async_remove_device(device.id)
+    await hass.async_block_till_done()
+    await validate_pass()
+    assert validate.await_count == 3
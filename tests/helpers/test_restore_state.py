@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,7 +17,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    FULL_DUMP_INTERVAL,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -342,6 +346,115 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test incremental dumps only encode the states of changed entities."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity."""
+
+        extra_data_calls = 0
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return entity specific state data to be restored."""
+            self.extra_data_calls += 1
+            return RestoredExtraData({"value": self._attr_state})
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for idx in range(2):
+        entity = MockRestoreEntity()
+        entity.entity_id = f"input_boolean.b{idx}"
+        entity._attr_state = "off"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        entities[0]._attr_state = "on"
+        # State writes use the restore state data the entity was added with
+        with patch("homeassistant.helpers.restore_state.async_get") as mock_get:
+            entities[0].async_write_ha_state()
+        mock_get.assert_not_called()
+        await data.async_dump_states(incremental=True)
+
+    assert [entity.extra_data_calls for entity in entities] == [2, 1]
+    written_states = json_round_trip(mock_write_data.mock_calls[1][1][0])
+    assert [
+        (state["state"]["entity_id"], state["state"]["state"], state["extra_data"])
+        for state in written_states
+    ] == [
+        ("input_boolean.b0", "on", {"value": "on"}),
+        ("input_boolean.b1", "off", {"value": "off"}),
+    ]
+
+    # Removed entities are written from the last states
+    await entities[1].async_remove()
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(incremental=True)
+
+    assert [entity.extra_data_calls for entity in entities] == [2, 2]
+    written_states = json_round_trip(mock_write_data.mock_calls[0][1][0])
+    assert [state["state"]["entity_id"] for state in written_states] == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+    ]
+
+    # All states are encoded again once in a while
+    freezer.tick(FULL_DUMP_INTERVAL + timedelta(seconds=1))
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        await data.async_dump_states(incremental=True)
+
+    assert [entity.extra_data_calls for entity in entities] == [3, 2]
+
+
+async def test_full_dump_encodes_each_state_once(hass: HomeAssistant) -> None:
+    """Test a full dump encodes entities with a state from the last run once."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity."""
+
+        extra_data_calls = 0
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return entity specific state data to be restored."""
+            self.extra_data_calls += 1
+            return RestoredExtraData({"value": self._attr_state})
+
+    data = async_get(hass)
+    now = dt_util.utcnow()
+    data.last_states = {
+        "input_boolean.b0": StoredState(State("input_boolean.b0", "off"), None, now),
+        "input_boolean.b1": StoredState(State("input_boolean.b1", "on"), None, now),
+    }
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = MockRestoreEntity()
+    entity.entity_id = "input_boolean.b0"
+    entity._attr_state = "on"
+    await platform.async_add_entities([entity])
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    assert entity.extra_data_calls == 1
+    written_states = json_round_trip(mock_write_data.mock_calls[0][1][0])
+    assert [
+        (state["state"]["entity_id"], state["state"]["state"])
+        for state in written_states
+    ] == [("input_boolean.b0", "on"), ("input_boolean.b1", "on")]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -943,7 +943,7 @@ async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     mock_integration(hass, MockModule(domain), top_level_files={"services.yaml"})
     assert await async_setup_component(hass, domain, {})
 
-    def load_yaml(fname, secrets=None):
+    def load_yaml(fname, secrets=None, cache=None):
         with io.StringIO(service_descriptions) as file:
             return parse_yaml(file)
 
@@ -959,7 +959,7 @@ async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     ):
         descriptions = await service.async_get_all_descriptions(hass)
 
-    mock_load_yaml.assert_called_once_with("services.yaml", None)
+    mock_load_yaml.assert_called_once_with("services.yaml", None, None)
     assert proxy_load_services_files.mock_calls[0][1][1] == unordered(
         [
             await async_get_integration(hass, domain),
@@ -1015,7 +1015,7 @@ async def test_async_get_all_descriptions_filter(hass: HomeAssistant) -> None:
     mock_integration(hass, MockModule(domain), top_level_files={"services.yaml"})
     assert await async_setup_component(hass, domain, {})
 
-    def load_yaml(fname, secrets=None):
+    def load_yaml(fname, secrets=None, cache=None):
         with io.StringIO(service_descriptions) as file:
             return parse_yaml(file)
 
@@ -1031,7 +1031,7 @@ async def test_async_get_all_descriptions_filter(hass: HomeAssistant) -> None:
     ):
         descriptions = await service.async_get_all_descriptions(hass)
 
-    mock_load_yaml.assert_called_once_with("services.yaml", None)
+    mock_load_yaml.assert_called_once_with("services.yaml", None, None)
     assert proxy_load_services_files.mock_calls[0][1][1] == unordered(
         [
             await async_get_integration(hass, domain),
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -25,6 +26,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
+    ANY,
     async_fire_time_changed,
     async_fire_time_changed_exact,
     async_test_home_assistant,
@@ -1180,3 +1182,207 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_round_trip(tmp_path: Path) -> None:
+    """Test a journaled store appends changes and loads them back."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        data: dict[str, Any] = {
+            "items": [{"id": 1}, {"id": 2}, {"id": 3}],
+            "name": "first",
+            "old": True,
+        }
+        await store.async_save(data)
+        written = json.loads(Path(store.path).read_text())
+        assert written["data"] == data
+        assert not journal_path.exists()
+
+        data = {"items": [{"id": 1}, {"id": 2, "name": "two"}, {"id": 4}], "new": 1}
+        await store.async_save(data)
+        await store.async_save(data)
+        assert json.loads(Path(store.path).read_text()) == written
+        assert len(journal_path.read_bytes().splitlines()) == 1
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == data
+
+        await store.async_remove()
+        assert not journal_path.exists()
+        await hass.async_stop(force=True)
+
+
+async def test_journal_skips_stale_and_partial_records(tmp_path: Path) -> None:
+    """Test records of another generation and partial records are skipped."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": [1, 2]})
+        await store.async_save({"items": [1, 2, 3]})
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        journal = journal_path.read_bytes()
+        stale = json.dumps(
+            {"generation": "stale", "changes": [["set", ["items"], []]]}
+        ).encode()
+        journal_path.write_bytes(stale + b"\n" + journal + journal[:10])
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"items": [1, 2, 3]}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmp_path: Path) -> None:
+    """Test the journal is compacted into the store file once it is too large."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        await store.async_save({"items": list(range(10))})
+        await store.async_save({"items": list(range(11))})
+        assert journal_path.exists()
+
+        with patch.object(storage, "JOURNAL_MIN_COMPACT_SIZE", 0):
+            await store.async_save({"items": list(range(20))})
+        assert not journal_path.exists()
+        assert json.loads(Path(store.path).read_text())["data"] == {
+            "items": list(range(20))
+        }
+
+        # A new version is written to the store file
+        store = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+        await store.async_save({"items": []})
+        assert json.loads(Path(store.path).read_text())["version"] == MOCK_VERSION_2
+        await hass.async_stop(force=True)
+
+
+async def test_fast_load(tmp_path: Path) -> None:
+    """Test a fast load store loads its marshal copy while it matches."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, fast_load=True)
+        sidecar_path = Path(f"{store.path}{storage.SIDECAR_SUFFIX}")
+        await store.async_save({"items": [1, 2, 3]})
+        assert sidecar_path.exists()
+
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            side_effect=AssertionError,
+        ):
+            assert await store.async_load() == {"items": [1, 2, 3]}
+
+        # The store file was written without the marshal copy, keeping its
+        # size and modification time
+        storage_path = Path(store.path)
+        stat = storage_path.stat()
+        storage_path.write_bytes(storage_path.read_bytes().replace(b"3\n", b"4\n"))
+        os.utime(storage_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert storage_path.stat().st_size == stat.st_size
+        assert await store.async_load() == {"items": [1, 2, 4]}
+
+        sidecar_path.write_bytes(b"invalid")
+        assert await store.async_load() == {"items": [1, 2, 4]}
+
+        await store.async_remove()
+        assert not sidecar_path.exists()
+        await hass.async_stop(force=True)
+
+
+async def test_fast_load_journal(tmp_path: Path) -> None:
+    """Test the journal is applied on top of the marshal copy."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True, fast_load=True
+        )
+        await store.async_save({"items": [1, 2]})
+        await store.async_save({"items": [1, 2, 3]})
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True, fast_load=True
+        )
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            side_effect=AssertionError,
+        ):
+            assert await store.async_load() == {"items": [1, 2, 3]}
+        await hass.async_stop(force=True)
+
+
+async def test_store_writes_are_batched(tmp_path: Path) -> None:
+    """Test concurrent writes share one directory sync and record statistics."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        stores = [
+            storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_{idx}", atomic_writes=True)
+            for idx in range(3)
+        ]
+        plain_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        with patch.object(
+            storage, "fsync_directory", wraps=storage.fsync_directory
+        ) as mock_fsync_directory:
+            await asyncio.gather(
+                *(store.async_save(MOCK_DATA) for store in (*stores, plain_store))
+            )
+        mock_fsync_directory.assert_called_once_with(os.path.dirname(plain_store.path))
+        for store in (*stores, plain_store):
+            assert json.loads(Path(store.path).read_text())["data"] == MOCK_DATA
+
+        stats = storage.async_get_store_write_stats(hass)
+        assert stats[MOCK_KEY] == {
+            "count": 1,
+            "bytes": os.path.getsize(plain_store.path),
+            "total": ANY,
+            "max": ANY,
+        }
+        assert set(stats) == {MOCK_KEY, *(store.key for store in stores)}
+
+        # Plain writes do not sync the directory
+        with patch.object(storage, "fsync_directory") as mock_fsync_directory:
+            await plain_store.async_save(MOCK_DATA2)
+        assert not mock_fsync_directory.called
+        assert storage.async_get_store_write_stats(hass)[MOCK_KEY]["count"] == 2
+        await hass.async_stop(force=True)
+
+
+async def test_store_write_errors_are_not_batched(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing write does not fail the other writes of its batch."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        bad_store = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_bad")
+        await asyncio.gather(
+            store.async_save(MOCK_DATA), bad_store.async_save({"bad": object()})
+        )
+        assert json.loads(Path(store.path).read_text())["data"] == MOCK_DATA
+        assert f"Error writing config for {MOCK_KEY}_bad" in caplog.text
+        assert set(storage.async_get_store_write_stats(hass)) == {MOCK_KEY}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmp_path: Path) -> None:
+    """Test the journal is compacted into the store file on a clean stop."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(f"{store.path}{storage.JOURNAL_SUFFIX}")
+        await store.async_save({"items": [1, 2]})
+        await store.async_save({"items": [1, 2, 3]})
+        assert journal_path.exists()
+
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not journal_path.exists()
+        assert json.loads(Path(store.path).read_text())["data"] == {"items": [1, 2, 3]}
+        await hass.async_stop(force=True)
+
+
+async def test_journal_applied_by_plain_store(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a store without a journal warns about and applies a journal."""
+    async with async_test_home_assistant(config_dir=str(tmp_path)) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": [1, 2]})
+        await store.async_save({"items": [1, 2, 3]})
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {"items": [1, 2, 3]}
+        assert "was written with a journal" in caplog.text
+        await hass.async_stop(force=True)
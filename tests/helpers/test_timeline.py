@@ -0,0 +1,99 @@
+"""Test the timeline helper."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.timeline import (
+    DATA_STARTUP_TIMELINE,
+    Timeline,
+    async_get_startup_timeline,
+    async_startup_timeline_span,
+)
+
+
+def test_timeline_chrome_trace() -> None:
+    """Test spans are exported as Chrome trace events."""
+    with patch("homeassistant.helpers.timeline.time.monotonic", return_value=10.0):
+        timeline = Timeline()
+    timeline.add("stage 1", "bootstrap", 10.5, 12.0)
+    timeline.add("setup", "light", 10.25, 11.0, {"group": None})
+
+    assert timeline.as_chrome_trace() == {
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "bootstrap"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "light"},
+            },
+            {
+                "name": "setup",
+                "cat": "light",
+                "ph": "X",
+                "pid": 1,
+                "tid": 2,
+                "ts": 250000,
+                "dur": 750000,
+                "args": {"group": None},
+            },
+            {
+                "name": "stage 1",
+                "cat": "bootstrap",
+                "ph": "X",
+                "pid": 1,
+                "tid": 1,
+                "ts": 500000,
+                "dur": 1500000,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def test_timeline_finish() -> None:
+    """Test spans are no longer recorded once the timeline is finished."""
+    timeline = Timeline()
+    with timeline.span("stage 1", "bootstrap"):
+        pass
+    timeline.finish()
+    with timeline.span("stage 2", "bootstrap"):
+        pass
+
+    assert [span.name for span in timeline.spans] == ["stage 1"]
+
+
+def test_timeline_executor_job() -> None:
+    """Test executor jobs record the time waiting and running separately."""
+    timeline = Timeline()
+    job = timeline.wrap_executor_job("import", "light", lambda value: value * 2)
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(job, 21).result() == 42
+
+    wait, run = timeline.spans
+    assert (wait.name, wait.track) == ("import (wait)", "light")
+    assert (run.name, run.track) == ("import (run)", "light")
+    assert wait.end == run.start
+    assert run.args == {"wait": wait.end - wait.start, "run": run.end - run.start}
+
+
+async def test_startup_timeline_span(hass: HomeAssistant) -> None:
+    """Test spans are only recorded when a startup timeline exists."""
+    assert async_get_startup_timeline(hass) is None
+    with async_startup_timeline_span(hass, "stage 1", "bootstrap"):
+        pass
+
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = Timeline()
+    with async_startup_timeline_span(hass, "stage 1", "bootstrap"):
+        pass
+
+    assert async_get_startup_timeline(hass) is timeline
+    assert [span.name for span in timeline.spans] == ["stage 1"]
@@ -0,0 +1,108 @@
+"""Tests for the import_cost script."""
+
+import json
+from pathlib import Path
+import sys
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from script import import_cost
+
+
+def _report(**integrations: tuple[float, int]) -> dict[str, Any]:
+    """Return a report with a single platform per integration."""
+    return {
+        "integrations": {
+            domain: {
+                "component": {"time": 0.0, "memory": 0},
+                "platforms": {"sensor": {"time": time, "memory": memory}},
+            }
+            for domain, (time, memory) in integrations.items()
+        }
+    }
+
+
+def test_compare() -> None:
+    """Test regressions are reported above the threshold and noise level."""
+    baseline = _report(
+        slower=(0.1, 100), bigger=(0.1, 4096), noise=(0.01, 100), same=(0.1, 100)
+    )
+    baseline["integrations"]["broken"] = {"error": "ImportError"}
+    report = _report(
+        slower=(0.2, 100),
+        bigger=(0.1, 8192),
+        noise=(0.02, 500),
+        same=(0.11, 100),
+        broken=(1.0, 100),
+        new=(1.0, 100),
+    )
+
+    assert import_cost.compare(report, baseline, 0.25) == [
+        "slower: time increased from 0.100s to 0.200s",
+        "bigger: memory increased from 4096.000KiB to 8192.000KiB",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("platform", "max_rss", "expected"),
+    [("linux", 2048, 2048), ("darwin", 2048 * 1024, 2048)],
+)
+def test_max_rss(platform: str, max_rss: int, expected: int) -> None:
+    """Test the max RSS is reported in KiB on every platform."""
+    with (
+        patch.object(import_cost.sys, "platform", platform),
+        patch.object(
+            import_cost.resource,
+            "getrusage",
+            return_value=Mock(ru_maxrss=max_rss),
+        ),
+    ):
+        assert import_cost._max_rss() == expected
+
+
+def test_report(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test measuring an integration, writing a report and comparing it."""
+    monkeypatch.chdir(Path(__file__).parents[2])
+    config_dir = tmp_path / "config"
+    stub_dir = config_dir / "custom_components" / "stub"
+    stub_dir.mkdir(parents=True)
+    (stub_dir / "manifest.json").write_text(
+        json.dumps({"domain": "stub", "name": "Stub", "version": "1.0.0"})
+    )
+    (stub_dir / "__init__.py").write_text('"""Stub integration."""\n')
+    # Importing the platform takes long enough to stand out from the noise
+    (stub_dir / "sensor.py").write_text(
+        '"""Stub sensor platform."""\n\nimport time\n\ntime.sleep(0.05)\n'
+    )
+    output = tmp_path / "import_cost.json"
+
+    args = ["import_cost", "stub", "--config-dir", str(config_dir)]
+    with patch.object(sys, "argv", [*args, "--output", str(output)]):
+        assert import_cost.main() == 0
+
+    report = json.loads(output.read_text())
+    result = report["integrations"]["stub"]
+    assert set(result["platforms"]) == {"sensor"}
+    for measurement in (result["component"], result["platforms"]["sensor"]):
+        assert measurement["time"] >= 0
+        assert measurement["memory"] >= 0
+    assert "stub: " in capsys.readouterr().out
+
+    # The import got slower than in the baseline
+    baseline = tmp_path / "baseline.json"
+    result["platforms"]["sensor"]["time"] = 0.0
+    baseline.write_text(json.dumps(report))
+    with patch.object(sys, "argv", [*args, "--baseline", str(baseline)]):
+        assert import_cost.main() == 1
+    assert "stub: time increased from" in capsys.readouterr().out
+
+    baseline.write_text(output.read_text())
+    with patch.object(sys, "argv", [*args, "--baseline", str(baseline)]):
+        assert import_cost.main() == 0
+    assert "No import cost regressions" in capsys.readouterr().out
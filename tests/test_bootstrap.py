@@ -4,8 +4,10 @@ import asyncio
 from collections.abc import Generator, Iterable
 import contextlib
 import glob
+import json
 import logging
 import os
+from pathlib import Path
 import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -23,6 +25,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.timeline import DATA_STARTUP_TIMELINE, Timeline
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
@@ -140,6 +143,34 @@ async def test_config_does_not_turn_off_debug(hass: HomeAssistant) -> None:
     assert hass.config.debug is True
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_startup_timeline(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the startup timeline records stages and can be written as a trace."""
+    hass.set_state(CoreState.not_running)
+    timeline = hass.data[DATA_STARTUP_TIMELINE] = Timeline()
+
+    await bootstrap.async_from_config_dict({CONF_DEBUG: False}, hass)
+
+    assert timeline.finished is not None
+    bootstrap_spans = [
+        span.name for span in timeline.spans if span.track == "bootstrap"
+    ]
+    assert bootstrap_spans[:3] == [
+        "load base functionality",
+        "core integrations",
+        "resolve domains",
+    ]
+    assert "wrap up" in bootstrap_spans
+    assert {("import", "persistent_notification"), ("setup", "homeassistant")} <= {
+        (span.name, span.track) for span in timeline.spans
+    }
+
+    hass.config.config_dir = str(tmp_path)
+    await bootstrap.async_write_startup_trace(hass)
+    trace = json.loads((tmp_path / bootstrap.STARTUP_TRACE_FILE).read_text())
+    assert trace == json.loads(json.dumps(timeline.as_chrome_trace()))
+
+
 @pytest.mark.parametrize("hass_config", [{"frontend": {}}])
 @pytest.mark.usefixtures("mock_hass_config")
 async def test_asyncio_debug_on_turns_hass_debug_on(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from copy import copy, deepcopy
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -61,7 +62,10 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import JobPriority
+from homeassistant.util.job_stats import JobStats
 from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.util.ulid import bytes_to_ulid, ulid_to_bytes
 
 from .common import (
     async_capture_events,
@@ -354,7 +358,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_stats=None)
     calls = []
 
     def job():
@@ -367,7 +371,7 @@ async def test_async_run_eager_hass_job_calls_callback() -> None:
 
 async def test_async_run_eager_hass_job_calls_coro_function() -> None:
     """Test running coros from async_run_hass_job with eager_start."""
-    hass = MagicMock()
+    hass = MagicMock(_job_stats=None)
 
     async def job():
         pass
@@ -378,7 +382,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_stats=None)
     calls = []
 
     def job():
@@ -391,7 +395,7 @@ async def test_async_run_hass_job_calls_callback() -> None:
 
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_stats=None)
     calls = []
 
     def job():
@@ -1165,6 +1169,63 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening for events with specific event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    listeners = hass.bus.async_listeners()
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.hall"], listener
+    )
+    unsub_other = hass.bus.async_listen_keyed("test", "device_id", ["abc"], listener)
+    assert hass.bus.async_listeners()["test"] == listeners.get("test", 0) + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall", "device_id": "abc"})
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "light.hall", "device_id": "abc"},
+        {"entity_id": "light.hall", "device_id": "abc"},
+    ]
+
+    unsub()
+    unsub_other()
+    assert hass.bus.async_listeners() == listeners
+    assert not hass.bus._keyed_listeners
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", ["light.hall"], listener)
+
+
+async def test_eventbus_remove_unknown_keyed_listener(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs an error."""
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen"], ha.callback(lambda event: None)
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1621,154 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    seen_states = []
+
+    @callback
+    def listener(event: ha.Event) -> None:
+        seen_states.append(
+            (
+                event.data["entity_id"],
+                hass.states.get("light.bowl").state,
+                hass.states.get("light.ceiling").state,
+            )
+        )
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "off", {"brightness": 100}),
+            ("light.ceiling", "on", None),
+            ("light.desk", "on", None),
+        ]
+    )
+    assert seen_states == [
+        ("light.bowl", "off", "on"),
+        ("light.ceiling", "off", "on"),
+        ("light.desk", "off", "on"),
+    ]
+    states = [
+        hass.states.get(entity_id) for entity_id in hass.states.async_entity_ids()
+    ]
+    assert len({state.context.id for state in states[1:]}) == 1
+    assert len({state.last_updated for state in states[1:]}) == 1
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("light.ceiling", "x" * 256, None)]
+        )
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("invalid", "on", None)]
+        )
+    assert hass.states.get("light.bowl").state == "off"
+    assert len(seen_states) == 3
+
+    hass.states.async_set_many([])
+    assert len(seen_states) == 3
+    unsub()
+
+
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared between states."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100, "name": "a"})
+    hass.states.async_set("light.ceiling", "on", {"brightness": 100, "name": "a"})
+    hass.states.async_set("light.desk", "on", {"brightness": 100.0, "name": "a"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": True, "name": "a"})
+    hass.states.async_set("light.hall", "on", {"brightness": [100], "name": "a"})
+    hass.states.async_set("light.porch", "on", {"brightness": [100], "name": "a"})
+    hass.states.async_set("sensor.zero", "0", {"value": 0.0})
+    hass.states.async_set("sensor.negative_zero", "0", {"value": -0.0})
+
+    assert repr(hass.states.get("sensor.negative_zero").attributes["value"]) == "-0.0"
+    bowl = hass.states.get("light.bowl").attributes
+    assert hass.states.get("light.ceiling").attributes is bowl
+    assert hass.states.get("light.desk").attributes is not bowl
+    assert hass.states.get("light.kitchen").attributes is not bowl
+    assert hass.states.get("light.desk").attributes == bowl
+    assert (
+        hass.states.get("light.hall").attributes
+        is not hass.states.get("light.porch").attributes
+    )
+
+    hass.states.async_set("light.ceiling", "off", {"brightness": 100, "name": "a"})
+    assert hass.states.get("light.ceiling").attributes is bowl
+
+
+async def test_compact_statemachine(hass: HomeAssistant) -> None:
+    """Test the compact state machine behaves like the default one."""
+    states = ha.StateMachine(hass.bus, hass.loop, compact=True)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    states.async_set("light.Bowl", "on", {"brightness": 100})
+    states.async_set("light.ceiling", "off")
+    states.async_set("switch.ac", "off")
+    await hass.async_block_till_done()
+
+    state = states.get("light.bowl")
+    assert state is events[0].data["new_state"]
+    assert state.state == "on"
+    assert state.attributes == {"brightness": 100}
+    assert states.is_state("light.BOWL", "on")
+    assert states.async_entity_ids() == ["light.bowl", "light.ceiling", "switch.ac"]
+    assert states.async_entity_ids("light") == ["light.bowl", "light.ceiling"]
+    assert states.async_entity_ids_count(("light", "switch")) == 3
+    assert [state.entity_id for state in states.async_all("switch")] == ["switch.ac"]
+    assert len(states.async_all()) == 3
+
+    states.async_set("light.bowl", "off", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert events[-1].data["old_state"] is state
+    assert events[-1].data["new_state"].attributes is state.attributes
+
+    assert states.async_remove("light.bowl")
+    assert not states.async_remove("light.bowl")
+    assert states.get("light.bowl") is None
+    assert states.async_entity_ids("light") == ["light.ceiling"]
+
+    states.async_set("light.kitchen", "on")
+    assert states.async_entity_ids() == ["light.ceiling", "switch.ac", "light.kitchen"]
+    assert states.get("light.kitchen").state == "on"
+
+
+async def test_compact_statemachine_materializes_states(hass: HomeAssistant) -> None:
+    """Test the compact state machine rebuilds states that are no longer used."""
+    states = ha.StateMachine(hass.bus, hass.loop, compact=True)
+    user_context = ha.Context(user_id="abc", parent_id="def")
+    states.async_set("light.bowl", "on", {"brightness": 100}, context=user_context)
+    states.async_set("light.ceiling", "on", {"brightness": 100.0})
+    states.async_set("light.desk", "on", {"brightness": 100})
+    states.async_set("light.hall", "on", context=ha.Context(id="not_a_ulid"))
+    await hass.async_block_till_done()
+
+    original = states.get("light.desk").as_dict()
+    original_context_id = states.get("light.desk").context.id
+    gc.collect()
+
+    bowl = states.get("light.bowl")
+    desk = states.get("light.desk")
+    assert desk.as_dict() == original
+    assert desk.context.id == original_context_id
+    assert bowl.context.user_id == "abc"
+    assert bowl.context.parent_id == "def"
+    assert bowl.context.id == user_context.id
+    assert states.get("light.hall").context.id == "not_a_ulid"
+    assert bowl.attributes is desk.attributes
+    assert states.get("light.ceiling").attributes is not desk.attributes
+    assert states.get("light.ceiling").attributes["brightness"] == 100.0
+
+    future = dt_util.utcnow() + timedelta(hours=1)
+    with freeze_time(future):
+        states.async_set("light.desk", "on", {"brightness": 100})
+    del desk
+    gc.collect()
+    desk = states.get("light.desk")
+    assert desk.last_reported == future
+    assert desk.last_updated != future
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -1997,6 +2206,28 @@ def test_context() -> None:
     assert c.id is not None
 
 
+def test_context_lazy_id() -> None:
+    """Test the context id is only formatted when accessed."""
+    context = ha.Context()
+    id_bin = context.id_bin
+    assert len(id_bin) == 16
+    assert context._id is None
+    assert context.id == bytes_to_ulid(id_bin)
+    assert context.id_bin is id_bin
+
+    copied = copy(ha.Context(id_bin=id_bin))
+    assert copied._id is None
+    assert copied == context
+    assert copied.id == context.id
+    assert ha.Context(id_bin=id_bin) == ha.Context(id=context.id)
+    assert ha.Context(id_bin=id_bin) != ha.Context()
+
+    context = ha.Context(id="01H0D6K3RFJAYAV2093ZW30PCW")
+    assert context.id_bin == ulid_to_bytes("01H0D6K3RFJAYAV2093ZW30PCW")
+    assert deepcopy(context).id == "01H0D6K3RFJAYAV2093ZW30PCW"
+    assert ha.Context(id="not_a_ulid").id_bin is None
+
+
 def test_context_json_fragment() -> None:
     """Test context JSON fragments."""
     context1, context2 = (ha.Context(id="01H0D6K3RFJAYAV2093ZW30PCW") for _ in range(2))
@@ -2944,6 +3175,133 @@ def test_hassjob_passing_job_type() -> None:
     )
 
 
+def test_hassjob_target_name() -> None:
+    """Test the qualified name of the target of a HassJob."""
+
+    def func() -> None:
+        pass
+
+    name = f"{__name__}.test_hassjob_target_name.<locals>.func"
+    assert HassJob(func).target_name == name
+    assert HassJob(functools.partial(func)).target_name == name
+    assert HassJob(MagicMock(__qualname__=None)).target_name.startswith("<MagicMock")
+
+
+async def test_async_run_hass_job_records_job_stats(hass: HomeAssistant) -> None:
+    """Test the run time of jobs is recorded when job stats are set."""
+    job_stats = JobStats()
+    calls = []
+
+    @ha.callback
+    def callback_func() -> None:
+        calls.append("callback")
+
+    async def coro_func() -> None:
+        calls.append("coro")
+
+    @ha.callback
+    def failing_func() -> None:
+        raise ValueError
+
+    hass.async_set_job_stats(job_stats)
+    hass.async_run_hass_job(HassJob(callback_func))
+    hass.async_run_hass_job(HassJob(callback_func))
+    await hass.async_run_hass_job(HassJob(coro_func))
+    with pytest.raises(ValueError):
+        hass.async_run_hass_job(HassJob(failing_func))
+    hass.async_set_job_stats(None)
+    hass.async_run_hass_job(HassJob(callback_func))
+
+    assert calls == ["callback", "callback", "coro", "callback"]
+    assert {name.rpartition(".")[2]: stat.count for name, stat in job_stats.top()} == {
+        "callback_func": 2,
+        "coro_func": 1,
+        "failing_func": 1,
+    }
+
+
+async def test_executor_jobs_are_submitted_with_priority(
+    hass: HomeAssistant,
+) -> None:
+    """Test executor jobs are submitted with the priority of the job."""
+
+    def executor_func() -> None:
+        """Run in the executor."""
+
+    def service_handler(call: ServiceCall) -> None:
+        """Handle a service call in the executor."""
+
+    hass.services.async_register("test", "executor", service_handler)
+
+    with patch(
+        "homeassistant.core.executor_job_priority",
+        wraps=ha.executor_job_priority,
+    ) as mock_priority:
+        await hass.async_add_executor_job(executor_func)
+        assert mock_priority.call_count == 0
+
+        await hass.async_add_executor_job(
+            executor_func, priority=JobPriority.BACKGROUND
+        )
+        await hass.async_run_hass_job(
+            HassJob(executor_func, priority=JobPriority.POLLING)
+        )
+        await hass.services.async_call("test", "executor", blocking=True)
+        await hass.services.async_call(
+            "test",
+            "executor",
+            blocking=True,
+            context=ha.Context(user_id="abc"),
+        )
+
+    assert [call.args[0] for call in mock_priority.call_args_list] == [
+        JobPriority.BACKGROUND,
+        JobPriority.POLLING,
+        JobPriority.AUTOMATION,
+        JobPriority.INTERACTIVE,
+    ]
+
+
+async def test_executor_jobs_in_pools(hass: HomeAssistant) -> None:
+    """Test executor jobs can run in a pool and within an integration quota."""
+    assert hass.import_executor is hass.executor_pools.get("import")
+    assert (
+        await hass.async_add_executor_job(threading.current_thread, pool="io")
+    ).name.startswith("IoExecutor_")
+
+    hass.executor_pools.async_set_quota("demo", 1)
+    started = threading.Event()
+    release = threading.Event()
+    running = []
+
+    def blocking_job(name: str) -> None:
+        running.append(name)
+        started.set()
+        release.wait()
+
+    first = hass.async_create_task(
+        hass.async_run_integration_executor_job("demo", blocking_job, "first")
+    )
+    second = hass.async_create_task(
+        hass.async_run_integration_executor_job("demo", blocking_job, "second")
+    )
+    await hass.async_run_integration_executor_job("other", started.wait)
+    assert running == ["first"]
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert running == ["first", "second"]
+
+
+async def test_async_add_process_job(hass: HomeAssistant) -> None:
+    """Test process jobs run in the process pool of the executor pools."""
+    # The test harness runs process jobs in the cpu pool
+    assert await hass.async_add_process_job(threading.current_thread) in set(
+        hass.executor_pools.get("cpu")._threads
+    )
+    assert await hass.async_add_process_job(pow, 2, 10) == 1024
+
+
 async def test_shutdown_job(hass: HomeAssistant) -> None:
     """Test async_add_shutdown_job."""
     evt = asyncio.Event()
@@ -67,6 +67,9 @@ def test_core_config_schema() -> None:
         {"radius": -10},
         {"webrtc": "bla"},
         {"webrtc": {}},
+        {"executor_pools": {"import": 2}},
+        {"executor_pools": {"unknown": 2}},
+        {"executor_pools": {"io": 0}},
     ):
         with pytest.raises(MultipleInvalid):
             CORE_CONFIG_SCHEMA(value)
@@ -85,6 +88,7 @@ def test_core_config_schema() -> None:
             "language": "sv",
             "radius": "10",
             "webrtc": {"ice_servers": [{"url": "stun:custom_stun_server:3478"}]},
+            "executor_pools": {"cpu": "2", "io": 12},
         }
     )
 
@@ -413,6 +417,8 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
             "language": "sv",
             "radius": 150,
             "webrtc": {"ice_servers": [{"url": "stun:custom_stun_server:3478"}]},
+            "executor_pools": {"io": 12},
+            "executor_quotas": {"demo": 2},
         },
     )
 
@@ -437,6 +443,8 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.webrtc == RTCConfiguration(
         [RTCIceServer(urls=["stun:custom_stun_server:3478"])]
     )
+    assert hass.executor_pools.get("io").stats()["max_workers"] == 12
+    assert hass.executor_pools.async_get_quota("demo")._value == 2
 
 
 @pytest.mark.parametrize(
@@ -235,6 +235,36 @@ async def test_get_integration(hass: HomeAssistant) -> None:
     assert hue_light == integration.get_platform("light")
 
 
+async def test_integration_snapshot(hass: HomeAssistant) -> None:
+    """Test integrations are restored from a snapshot without doing I/O."""
+    integration = await loader.async_get_integration(hass, "hue")
+    assert await integration.resolve_dependencies()
+    assert integration.platforms_exists(["light", "not_a_platform"]) == ["light"]
+    # A platform that failed to import may be installed before the next start
+    hass.data[loader.DATA_MISSING_PLATFORMS]["hue.scene"] = True
+
+    snapshot = loader.async_get_integration_snapshot(hass)
+    assert snapshot["hue"]["all_dependencies"] == sorted(integration.all_dependencies)
+    assert snapshot["hue"]["missing_platforms"] == ["not_a_platform"]
+
+    hass.data[loader.DATA_INTEGRATIONS].clear()
+    hass.data[loader.DATA_MISSING_PLATFORMS].clear()
+    loader.async_restore_integration_snapshot(hass, snapshot)
+    assert hass.data[loader.DATA_MISSING_PLATFORMS] == {"hue.not_a_platform": True}
+
+    with patch.object(
+        loader, "_resolve_integrations_from_root"
+    ) as mock_resolve_from_root:
+        restored = await loader.async_get_integration(hass, "hue")
+    assert not mock_resolve_from_root.called
+    assert restored is not integration
+    assert restored.file_path == integration.file_path
+    assert restored.manifest == integration.manifest
+    assert restored.all_dependencies_resolved
+    assert restored.all_dependencies == integration.all_dependencies
+    assert restored.platforms_exists(["light", "not_a_platform"]) == ["light"]
+
+
 async def test_async_get_component(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     with pytest.raises(loader.IntegrationNotLoaded):
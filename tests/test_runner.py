@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Iterator
 import subprocess
 import threading
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import packaging.tags
 import py
@@ -187,3 +187,81 @@ def test_enable_posix_spawn() -> None:
     ):
         runner._enable_posix_spawn()
         assert subprocess._USE_POSIX_SPAWN is False
+
+
+def test_run_zygote() -> None:
+    """Test the zygote forks a worker per config dir and restarts workers."""
+    exit_codes = {"one": [runner.RESTART_EXIT_CODE, 0], "two": [3]}
+    pids = iter(range(100, 110))
+    forked: list[tuple[int, str]] = []
+
+    def _mock_fork_worker(config_dir, worker, handlers):
+        pid = next(pids)
+        forked.append((pid, config_dir))
+        return pid
+
+    def _mock_wait():
+        pid, config_dir = next(fork for fork in forked if fork[0] not in waited)
+        waited.add(pid)
+        return pid, exit_codes[config_dir].pop(0) << 8
+
+    waited: set[int] = set()
+    with (
+        patch.object(runner, "_fork_worker", side_effect=_mock_fork_worker),
+        patch.object(runner, "_preload_integrations") as mock_preload,
+        patch("homeassistant.runner.os.wait", side_effect=_mock_wait),
+        patch("homeassistant.runner.gc.freeze") as mock_freeze,
+        patch("homeassistant.runner.signal.signal"),
+    ):
+        exit_code = runner.run_zygote(["one", "two"], ["light"], lambda _: 0)
+
+    assert exit_code == 3
+    assert forked == [(100, "one"), (101, "two"), (102, "one")]
+    mock_preload.assert_called_once_with(["light"])
+    assert mock_freeze.called
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "expected_exit_code"),
+    [
+        (None, 0),
+        (SystemExit(), 0),
+        (SystemExit(None), 0),
+        (SystemExit(3), 3),
+        (SystemExit("bye"), 1),
+        (RuntimeError("bye"), 1),
+    ],
+)
+def test_fork_worker_exit_code(
+    side_effect: BaseException | None, expected_exit_code: int
+) -> None:
+    """Test the exit code of a forked worker."""
+
+    class _Exited(Exception):
+        """Raised instead of ending the process."""
+
+    worker = Mock(return_value=0, side_effect=side_effect)
+    with (
+        patch("homeassistant.runner.os.fork", return_value=0),
+        patch("homeassistant.runner.os._exit", side_effect=_Exited) as mock_exit,
+        patch("homeassistant.runner.traceback.print_exc"),
+        pytest.raises(_Exited),
+    ):
+        runner._fork_worker("config", worker, {})
+
+    worker.assert_called_once_with("config")
+    mock_exit.assert_called_once_with(expected_exit_code)
+
+
+def test_preload_integrations() -> None:
+    """Test integrations and their platforms are imported by the zygote."""
+    with patch(
+        "homeassistant.runner.importlib.import_module",
+        wraps=runner.importlib.import_module,
+    ) as mock_import:
+        runner._preload_integrations(["sun", "not_an_integration"])
+
+    imported = [call.args[0] for call in mock_import.call_args_list]
+    assert "homeassistant.components.sun" in imported
+    assert "homeassistant.components.sun.sensor" in imported
+    assert "homeassistant.components.not_an_integration" in imported
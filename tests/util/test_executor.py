@@ -1,13 +1,27 @@
 """Test Home Assistant executor util."""
 
 import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+import os
+import socket
+import threading
 import time
 from unittest.mock import patch
 
 import pytest
+import pytest_socket
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    EXECUTOR_POOL_CPU,
+    EXECUTOR_POOL_IMPORT,
+    EXECUTOR_POOL_IO,
+    ExecutorPools,
+    InterruptibleThreadPoolExecutor,
+    JobPriority,
+    executor_job_priority,
+    get_executor_stats,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(
@@ -92,3 +106,189 @@ async def test_overall_timeout_reached(caplog: pytest.LogCaptureFixture) -> None
     assert finish - start < 3.0
 
     iexecutor.shutdown()
+
+
+async def test_executor_runs_queued_jobs_by_priority() -> None:
+    """Test queued jobs are started by priority when the workers are busy."""
+    iexecutor = InterruptibleThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="PriorityTest"
+    )
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def _block() -> None:
+        started.set()
+        release.wait()
+
+    iexecutor.submit(_block)
+    started.wait()
+
+    futures = [iexecutor.submit(order.append, "automation 1")]
+    for priority in (JobPriority.BACKGROUND, JobPriority.POLLING):
+        with executor_job_priority(priority):
+            futures.append(iexecutor.submit(order.append, priority.name.lower()))
+    with executor_job_priority(JobPriority.INTERACTIVE):
+        futures.append(iexecutor.submit(order.append, "interactive"))
+    futures.append(iexecutor.submit(order.append, "automation 2"))
+
+    assert iexecutor.queue_depths() == {
+        "interactive": 1,
+        "automation": 2,
+        "polling": 1,
+        "background": 1,
+    }
+    stats = get_executor_stats()["PriorityTest"]
+    assert stats["queue_depths"]["automation"] == 2
+    assert stats["queued"] == 5
+    assert stats["running"] == 1
+    assert stats["saturated"] == 5
+
+    release.set()
+    concurrent.futures.wait(futures)
+    assert order == [
+        "interactive",
+        "automation 1",
+        "automation 2",
+        "polling",
+        "background",
+    ]
+
+    iexecutor.shutdown()
+
+
+async def test_executor_does_not_starve_low_priority_jobs() -> None:
+    """Test queued jobs are started once they were passed over too often."""
+    iexecutor = InterruptibleThreadPoolExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def _block() -> None:
+        started.set()
+        release.wait()
+
+    iexecutor.submit(_block)
+    started.wait()
+
+    with executor_job_priority(JobPriority.BACKGROUND):
+        futures = [iexecutor.submit(order.append, "background")]
+    with executor_job_priority(JobPriority.INTERACTIVE):
+        futures.extend(
+            iexecutor.submit(order.append, "interactive")
+            for _ in range(executor.MAX_PRIORITY_SKIPS + 2)
+        )
+
+    release.set()
+    concurrent.futures.wait(futures)
+    assert order.index("background") == executor.MAX_PRIORITY_SKIPS
+
+    iexecutor.shutdown()
+
+
+async def test_executor_shutdown_runs_queued_jobs() -> None:
+    """Test shutting down without cancelling futures still runs queued jobs."""
+    iexecutor = InterruptibleThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    iexecutor.submit(release.wait)
+    with executor_job_priority(JobPriority.BACKGROUND):
+        future = iexecutor.submit(lambda: "done")
+
+    ThreadPoolExecutor.shutdown(iexecutor, wait=False)
+    release.set()
+    assert future.result(timeout=5) == "done"
+    iexecutor.join_threads_or_timeout()
+
+
+async def test_executor_pools() -> None:
+    """Test named executor pools are created on first use."""
+    pools = ExecutorPools({EXECUTOR_POOL_IO: 2})
+    pools.add_pool("camera", 1)
+    with pytest.raises(ValueError):
+        pools.add_pool(EXECUTOR_POOL_IO, 4)
+    with pytest.raises(ValueError):
+        pools.get("unknown")
+    assert pools.stats() == {}
+
+    io_pool = pools.get(EXECUTOR_POOL_IO)
+    assert pools.get(EXECUTOR_POOL_IO) is io_pool
+    assert io_pool.submit(lambda: "io").result() == "io"
+    assert pools.get("camera").submit(threading.current_thread).result().name == (
+        "CameraExecutor_0"
+    )
+    assert set(pools.stats()) == {EXECUTOR_POOL_IO, "camera"}
+    assert pools.stats()[EXECUTOR_POOL_IO]["max_workers"] == 2
+
+    pools.set_size(EXECUTOR_POOL_IO, 4)
+    assert pools.stats()[EXECUTOR_POOL_IO]["max_workers"] == 4
+    # Importing is not thread safe and unknown pools are not added
+    with pytest.raises(ValueError):
+        pools.set_size(EXECUTOR_POOL_IMPORT, 2)
+    with pytest.raises(ValueError):
+        pools.set_size("unknown", 2)
+
+    default_quota = pools.async_get_quota("default")
+    assert default_quota._value == executor.DEFAULT_INTEGRATION_QUOTA
+    assert pools.async_get_quota("default") is default_quota
+    pools.async_set_quota("demo", 2)
+    quota = pools.async_get_quota("demo")
+    assert quota._value == 2
+    assert pools.async_get_quota("demo") is quota
+    pools.async_set_quota("demo", 3)
+    assert pools.async_get_quota("demo")._value == 3
+    pools.async_set_quota("demo", None)
+    assert pools.async_get_quota("demo")._value == executor.DEFAULT_INTEGRATION_QUOTA
+
+    pools.shutdown()
+
+    pools = ExecutorPools(integration_quota=None)
+    assert pools.async_get_quota("demo") is None
+
+
+async def test_executor_pools_shutdown_shares_timeout() -> None:
+    """Test the pools are joined against one deadline when shutting down."""
+    pools = ExecutorPools({EXECUTOR_POOL_CPU: 1, EXECUTOR_POOL_IO: 1})
+    release = threading.Event()
+    futures = [
+        pools.get(name).submit(release.wait)
+        for name in (EXECUTOR_POOL_CPU, EXECUTOR_POOL_IO)
+    ]
+    timeouts: list[float] = []
+    join_threads_or_timeout = InterruptibleThreadPoolExecutor.join_threads_or_timeout
+
+    def _join(pool: InterruptibleThreadPoolExecutor, timeout: float) -> None:
+        # All pools stop taking jobs before the first one is joined
+        assert all(pool._shutdown for pool in pools._pools.values())
+        timeouts.append(timeout)
+        time.sleep(0.1)
+        release.set()
+        join_threads_or_timeout(pool, timeout)
+
+    with patch.object(
+        InterruptibleThreadPoolExecutor, "join_threads_or_timeout", _join
+    ):
+        pools.shutdown()
+
+    assert len(timeouts) == 2
+    assert timeouts[0] <= executor.EXECUTOR_SHUTDOWN_TIMEOUT
+    assert timeouts[1] <= timeouts[0] - 0.1
+    assert [future.result() for future in futures] == [True, True]
+
+
+async def test_executor_pools_process_pool() -> None:
+    """Test process jobs run in worker processes."""
+    # The forkserver hands out the workers over a unix socket
+    connect = socket.socket.connect
+    pytest_socket.socket_allow_hosts(["127.0.0.1"], allow_unix_socket=True)
+    try:
+        pools = ExecutorPools(process_pool_size=1)
+        process_pool = pools.get_process_pool()
+        assert pools.get_process_pool() is process_pool
+        assert process_pool.submit(os.getpid).result(timeout=30) != os.getpid()
+        pools.shutdown()
+    finally:
+        socket.socket.connect = connect
+
+    pools = ExecutorPools(process_pool_size=0)
+    assert pools.get_process_pool() is pools.get(EXECUTOR_POOL_CPU)
+    pools.shutdown()
@@ -0,0 +1,41 @@
+"""Test the job statistics helpers."""
+
+import asyncio
+
+from homeassistant.util.job_stats import LOOP_LAG_BUCKETS, JobStats, LoopLagMonitor
+
+
+def test_job_stats() -> None:
+    """Test recording job run times."""
+    job_stats = JobStats()
+    job_stats.record("fast", 0.1)
+    job_stats.record("fast", 0.2)
+    job_stats.record("slow", 1.0)
+
+    assert [(name, stat.as_dict()) for name, stat in job_stats.top()] == [
+        ("slow", {"count": 1, "total": 1.0, "max": 1.0}),
+        ("fast", {"count": 2, "total": 0.1 + 0.2, "max": 0.2}),
+    ]
+    assert [name for name, _ in job_stats.top(1)] == ["slow"]
+
+    job_stats.reset()
+    assert job_stats.top() == []
+
+
+async def test_loop_lag_monitor() -> None:
+    """Test measuring the event loop lag."""
+    loop = asyncio.get_running_loop()
+    monitor = LoopLagMonitor(loop, 0.01)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    monitor.stop()
+
+    histogram = monitor.as_dict()
+    assert sum(bucket["count"] for bucket in histogram["buckets"]) >= 1
+    assert len(histogram["buckets"]) == len(LOOP_LAG_BUCKETS)
+    assert histogram["buckets"][0]["le"] == LOOP_LAG_BUCKETS[0]
+    assert histogram["buckets"][-1]["le"] is None
+
+    monitor.reset()
+    assert monitor.as_dict()["max"] == 0.0
+    assert sum(bucket["count"] for bucket in monitor.as_dict()["buckets"]) == 0
@@ -0,0 +1,138 @@
+"""Test the persistent YAML cache."""
+
+from datetime import date
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.util import yaml as yaml_util
+from homeassistant.util.yaml import loader as yaml_loader
+
+
+def _annotations(obj: Any, path: str = "") -> list[tuple[str, str, int]]:
+    """Return the file and line annotations of a loaded tree."""
+    result = []
+    if hasattr(obj, "__config_file__"):
+        result.append((path, obj.__config_file__, obj.__line__))
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            result.extend(_annotations(key, f"{path}/key:{key}"))
+            result.extend(_annotations(value, f"{path}/{key}"))
+    elif isinstance(obj, list):
+        for idx, value in enumerate(obj):
+            result.extend(_annotations(value, f"{path}[{idx}]"))
+    return result
+
+
+def _write_config(config_dir: Path) -> str:
+    """Write a configuration with includes, secrets and env vars."""
+    (config_dir / "automations").mkdir()
+    (config_dir / "configuration.yaml").write_text(
+        "homeassistant:\n"
+        "  name: !secret name\n"
+        "  unit_system: !env_var UNIT_SYSTEM metric\n"
+        "automation: !include_dir_merge_list automations\n"
+        "script: !include scripts.yaml\n"
+        "sensor: [1, 2.5, true, null]\n"
+    )
+    (config_dir / "secrets.yaml").write_text("name: Home\n")
+    (config_dir / "scripts.yaml").write_text("hello:\n  sequence:\n    - delay: 1\n")
+    (config_dir / "automations" / "one.yaml").write_text("- alias: one\n")
+    (config_dir / "automations" / "two.yaml").write_text("- alias: two\n")
+    return str(config_dir / "configuration.yaml")
+
+
+def test_cached_load_matches_parse(tmp_path: Path) -> None:
+    """Test loading through the cache gives the same tree and annotations."""
+    config_path = _write_config(tmp_path)
+    secrets = yaml_util.Secrets(tmp_path)
+    expected = yaml_util.load_yaml(config_path, secrets)
+    cache = yaml_util.YamlCache(str(tmp_path / ".storage" / "core.yaml_cache"))
+
+    loaded = yaml_util.load_yaml(config_path, secrets, cache)
+    assert loaded == expected
+    assert _annotations(loaded) == _annotations(expected)
+    assert cache.dirty
+
+    cache.save()
+    assert not cache.dirty
+    cache = yaml_util.YamlCache(str(tmp_path / ".storage" / "core.yaml_cache"))
+    with patch.object(
+        yaml_loader, "_parse_yaml_fastest", wraps=yaml_loader._parse_yaml_fastest
+    ) as mock_parse:
+        loaded = yaml_util.load_yaml(config_path, secrets, cache)
+    assert mock_parse.call_count == 0
+    assert loaded == expected
+    assert _annotations(loaded) == _annotations(expected)
+    assert not cache.dirty
+
+
+def test_cache_resolves_tags_on_load(tmp_path: Path) -> None:
+    """Test secrets, env vars and included directories are resolved each load."""
+    config_path = _write_config(tmp_path)
+    cache = yaml_util.YamlCache(str(tmp_path / "core.yaml_cache"))
+    yaml_util.load_yaml(config_path, yaml_util.Secrets(tmp_path), cache)
+
+    (tmp_path / "secrets.yaml").write_text("name: Cabin\n")
+    (tmp_path / "automations" / "three.yaml").write_text("- alias: three\n")
+    with (
+        patch.dict(os.environ, {"UNIT_SYSTEM": "us_customary"}),
+        patch.object(
+            yaml_loader, "_parse_yaml_fastest", wraps=yaml_loader._parse_yaml_fastest
+        ) as mock_parse,
+    ):
+        loaded = yaml_util.load_yaml(config_path, yaml_util.Secrets(tmp_path), cache)
+
+    # Only the changed secrets and the new automation file are parsed
+    assert mock_parse.call_count == 2
+    assert loaded["homeassistant"] == {"name": "Cabin", "unit_system": "us_customary"}
+    assert loaded["automation"] == [
+        {"alias": "one"},
+        {"alias": "three"},
+        {"alias": "two"},
+    ]
+
+
+def test_cache_validates_content_hash(tmp_path: Path) -> None:
+    """Test files are only parsed again when their content changes."""
+    path = tmp_path / "scripts.yaml"
+    path.write_text("hello:\n  sequence: []\n")
+    cache = yaml_util.YamlCache(str(tmp_path / "core.yaml_cache"))
+    yaml_util.load_yaml(path, None, cache)
+
+    with patch.object(
+        yaml_loader, "_parse_yaml_fastest", wraps=yaml_loader._parse_yaml_fastest
+    ) as mock_parse:
+        os.utime(path, ns=(0, 0))
+        assert yaml_util.load_yaml(path, None, cache) == {"hello": {"sequence": []}}
+        assert mock_parse.call_count == 0
+        assert cache.get(str(path)).mtime_ns == 0
+
+        path.write_text("hello:\n  sequence: [1]\n")
+        os.utime(path, ns=(0, 0))
+        assert yaml_util.load_yaml(path, None, cache) == {"hello": {"sequence": [1]}}
+        assert mock_parse.call_count == 1
+
+
+def test_cache_skips_unsupported_values(tmp_path: Path) -> None:
+    """Test files with values that can not be marshalled are not cached."""
+    path = tmp_path / "dates.yaml"
+    path.write_text("start: 2024-01-01\n")
+    cache = yaml_util.YamlCache(str(tmp_path / "core.yaml_cache"))
+
+    assert yaml_util.load_yaml(path, None, cache) == {"start": date(2024, 1, 1)}
+    assert cache.get(str(path)) is None
+
+
+def test_invalid_cache_file_is_ignored(tmp_path: Path) -> None:
+    """Test an unreadable cache file is ignored and replaced."""
+    path = tmp_path / "scripts.yaml"
+    path.write_text("hello: world\n")
+    cache_path = tmp_path / "core.yaml_cache"
+    cache_path.write_bytes(b"not marshal")
+    cache = yaml_util.YamlCache(str(cache_path))
+
+    assert yaml_util.load_yaml(path, None, cache) == {"hello": "world"}
+    cache.save()
+    assert yaml_util.YamlCache(str(cache_path)).get(str(path)) is not None